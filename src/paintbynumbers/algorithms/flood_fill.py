@@ -5,7 +5,7 @@ easier to test and reuse across different parts of the application.
 """
 
 from __future__ import annotations
-from typing import List, Set, Callable
+from typing import List, Set, Callable, Tuple
 from paintbynumbers.structs.point import Point
 from paintbynumbers.utils.boundary import is_in_bounds
 
@@ -15,7 +15,9 @@ class FloodFillAlgorithm:
 
     Uses a stack-based approach to find all connected pixels matching a predicate.
     The algorithm starts from a seed point and expands to all reachable neighbors
-    that satisfy the given condition.
+    that satisfy the given condition. Each pixel is marked visited the first
+    time it is tested, so the predicate is evaluated at most once per pixel;
+    it must not start accepting a pixel it rejected earlier in the same fill.
 
     Example:
         >>> flood_fill = FloodFillAlgorithm()
@@ -60,40 +62,43 @@ class FloodFillAlgorithm:
             ... )
         """
         filled: List[Point] = []
-        visited: Set[int] = set()
-        stack: List[Point] = [start]
-
-        while len(stack) > 0:
-            point = stack.pop()
-            key = point.y * width + point.x
-
-            # Skip if already visited
-            if key in visited:
-                continue
-
-            # Skip if out of bounds
-            if not is_in_bounds(point.x, point.y, width, height):
-                continue
-
-            # Skip if doesn't match predicate
-            if not should_include(point.x, point.y):
-                continue
-
-            # Mark as visited and add to result
-            visited.add(key)
-            filled.append(point)
-
-            # Add 4-connected neighbors to stack
-            # Note: We don't use get_neighbors_4 here to avoid extra allocations
-            # Instead, we push points directly and rely on bounds checking above
-            if point.y > 0:
-                stack.append(Point(point.x, point.y - 1))  # Up
-            if point.y < height - 1:
-                stack.append(Point(point.x, point.y + 1))  # Down
-            if point.x > 0:
-                stack.append(Point(point.x - 1, point.y))  # Left
-            if point.x < width - 1:
-                stack.append(Point(point.x + 1, point.y))  # Right
+
+        # Fast path: an excluded start (common for already-visited pixels)
+        # returns before any stack or visited bookkeeping is allocated
+        x, y = start.x, start.y
+        if not is_in_bounds(x, y, width, height) or not should_include(x, y):
+            return filled
+
+        # Neighbors are marked visited before they are tested, so the predicate
+        # runs at most once per pixel, rejected ones included (a pixel
+        # rejected during a fill stays rejected). Every pixel is pushed at
+        # most once and no Point is allocated for rejected neighbors. An
+        # isolated pixel therefore costs one pop and four neighbor checks.
+        visited: Set[int] = {y * width + x}
+        stack: List[Tuple[int, int]] = [(x, y)]
+
+        while stack:
+            x, y = stack.pop()
+            filled.append(Point(x, y))
+            key = y * width + x
+
+            # Add 4-connected neighbors: up, down, left, right
+            if y > 0 and (key - width) not in visited:
+                visited.add(key - width)
+                if should_include(x, y - 1):
+                    stack.append((x, y - 1))
+            if y < height - 1 and (key + width) not in visited:
+                visited.add(key + width)
+                if should_include(x, y + 1):
+                    stack.append((x, y + 1))
+            if x > 0 and (key - 1) not in visited:
+                visited.add(key - 1)
+                if should_include(x - 1, y):
+                    stack.append((x - 1, y))
+            if x < width - 1 and (key + 1) not in visited:
+                visited.add(key + 1)
+                if should_include(x + 1, y):
+                    stack.append((x + 1, y))
 
         return filled
 
@@ -133,35 +138,36 @@ class FloodFillAlgorithm:
             ...     )
             ... )
         """
-        visited: Set[int] = set()
-        stack: List[Point] = [start]
-        count = 0
-
-        while len(stack) > 0:
-            point = stack.pop()
-            key = point.y * width + point.x
+        x, y = start.x, start.y
+        if not is_in_bounds(x, y, width, height) or not should_include(x, y):
+            return 0
 
-            if key in visited:
-                continue
-
-            if not is_in_bounds(point.x, point.y, width, height):
-                continue
-
-            if not should_include(point.x, point.y):
-                continue
+        visited: Set[int] = {y * width + x}
+        stack: List[Tuple[int, int]] = [(x, y)]
+        count = 0
 
-            visited.add(key)
-            on_fill(point.x, point.y)
+        while stack:
+            x, y = stack.pop()
+            on_fill(x, y)
             count += 1
+            key = y * width + x
 
             # Add 4-connected neighbors
-            if point.y > 0:
-                stack.append(Point(point.x, point.y - 1))
-            if point.y < height - 1:
-                stack.append(Point(point.x, point.y + 1))
-            if point.x > 0:
-                stack.append(Point(point.x - 1, point.y))
-            if point.x < width - 1:
-                stack.append(Point(point.x + 1, point.y))
+            if y > 0 and (key - width) not in visited:
+                visited.add(key - width)
+                if should_include(x, y - 1):
+                    stack.append((x, y - 1))
+            if y < height - 1 and (key + width) not in visited:
+                visited.add(key + width)
+                if should_include(x, y + 1):
+                    stack.append((x, y + 1))
+            if x > 0 and (key - 1) not in visited:
+                visited.add(key - 1)
+                if should_include(x - 1, y):
+                    stack.append((x - 1, y))
+            if x < width - 1 and (key + 1) not in visited:
+                visited.add(key + 1)
+                if should_include(x + 1, y):
+                    stack.append((x + 1, y))
 
         return count
@@ -1,18 +1,84 @@
 """K-means clustering algorithm implementation.
 
 This module provides K-means clustering for color quantization and general vector
-clustering. Uses Lloyd's algorithm with random initialization.
+clustering. Uses Lloyd's algorithm with k-means++ (or uniform random) initialization.
 
 OPTIMIZED: Uses NumPy vectorization for distance calculations and centroid updates.
 """
 
 from __future__ import annotations
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Dict, List, Optional, Tuple, Union
+import os
 import sys
 import numpy as np
-from paintbynumbers.algorithms.vector import Vector
+from paintbynumbers.algorithms.vector import Vector, VectorStore
 from paintbynumbers.utils.random import Random
 
+# Default number of points sampled per mini-batch step
+DEFAULT_BATCH_SIZE = 1024
+
+# L2 size assumed when the platform does not report it
+DEFAULT_L2_CACHE_BYTES = 256 * 1024
+
+# Smallest number of points processed per assignment chunk
+MIN_ASSIGNMENT_CHUNK_SIZE = 32
+
+# Points transferred to the GPU per assignment chunk (bounds VRAM usage)
+GPU_ASSIGNMENT_CHUNK_SIZE = 1 << 20
+
+# Supported compute devices for the assignment step
+SUPPORTED_DEVICES = ("cpu", "cuda")
+
+
+def _detect_l2_cache_bytes() -> int:
+    """Return the L2 cache size in bytes, or a conservative default."""
+    try:
+        size = os.sysconf('SC_LEVEL2_CACHE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        size = 0
+    return size if size and size > 0 else DEFAULT_L2_CACHE_BYTES
+
+
+L2_CACHE_BYTES = _detect_l2_cache_bytes()
+
+# Assignment chunk sizes keyed by (k, dims)
+_chunk_size_cache: Dict[Tuple[int, int], int] = {}
+
+
+def get_assignment_chunk_size(k: int, dims: int) -> int:
+    """Get the number of points to assign per chunk so the work fits in L2.
+
+    Each point row needs two float64 (k,) rows (distances and scratch) plus the
+    point itself. The chunk is sized to use at most half of L2, leaving the
+    rest for the centroids and surrounding data. Results are cached per (k, dims).
+
+    Args:
+        k: Number of centroids
+        dims: Dimensionality of the points
+
+    Returns:
+        Number of points per chunk (at least MIN_ASSIGNMENT_CHUNK_SIZE)
+
+    Example:
+        >>> get_assignment_chunk_size(16, 3) >= MIN_ASSIGNMENT_CHUNK_SIZE
+        True
+    """
+    key = (k, dims)
+    chunk_size = _chunk_size_cache.get(key)
+    if chunk_size is None:
+        bytes_per_point = 8 * (2 * k + dims)
+        chunk_size = max(MIN_ASSIGNMENT_CHUNK_SIZE, (L2_CACHE_BYTES // 2) // bytes_per_point)
+        _chunk_size_cache[key] = chunk_size
+    return chunk_size
+
+
+class KMeansInitMethod(str, Enum):
+    """Strategy for picking the initial centroids."""
+    RANDOM = "RANDOM"  # Pick k data points uniformly at random
+    KMEANS_PP = "KMEANS_PP"  # k-means++ (distance-weighted seeding)
+
 
 class KMeans:
     """K-means clustering algorithm.
@@ -23,8 +89,14 @@ class KMeans:
 
     Attributes:
         k: Number of clusters
+        init_method: Strategy used to seed the initial centroids
+        use_minibatch: Whether step() performs mini-batch updates
+        batch_size: Number of points sampled per mini-batch step
+        device: Compute device used for the assignment step ("cpu" or "cuda")
+        n_threads: Number of threads sharing the CPU assignment step
         current_iteration: Current iteration count
-        points_per_category: Vectors assigned to each cluster
+        labels: Cluster index of each point after the last assignment (None before)
+        points_per_category: Vectors assigned to each cluster (built from labels)
         centroids: Current cluster centroids
         current_delta_distance_difference: Sum of distances centroids moved in last step
 
@@ -43,51 +115,171 @@ class KMeans:
 
     def __init__(
         self,
-        points: List[Vector],
+        points: Union[List[Vector], VectorStore],
         k: int,
         random: Random,
-        centroids: Optional[List[Vector]] = None
+        centroids: Optional[List[Vector]] = None,
+        init_method: KMeansInitMethod = KMeansInitMethod.KMEANS_PP,
+        use_minibatch: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        device: str = "cpu",
+        n_threads: int = 1
     ) -> None:
         """Create a new K-means clustering instance.
 
         Args:
-            points: Data points to cluster
+            points: Data points to cluster, as Vector objects or a VectorStore
+                (preferred for large point counts)
             k: Number of clusters
             random: Random number generator (for deterministic results)
-            centroids: Optional initial centroids (if None, random initialization)
+            centroids: Optional initial centroids (if None, seeded using init_method)
+            init_method: Initialization strategy used when no centroids are given
+            use_minibatch: If True, step() runs a mini-batch update instead of a
+                full Lloyd iteration (much faster for large point counts)
+            batch_size: Number of points sampled per mini-batch step
+            device: "cpu" (NumPy) or "cuda" to run the assignment step on the
+                GPU through CuPy
+            n_threads: Number of threads for the CPU assignment step. The
+                points are split into one contiguous tile per thread; NumPy
+                releases the GIL inside the distance kernels. Keep at 1 when
+                several processes already share the CPUs.
+
+        Raises:
+            ValueError: If device is not supported or n_threads is below 1
+            ImportError: If device is "cuda" and CuPy is not installed
 
         Example:
             >>> random = Random(42)  # Fixed seed for reproducibility
             >>> data = [Vector([1, 2]), Vector([3, 4])]
             >>> kmeans = KMeans(data, 2, random)
         """
-        self._points = points
+        # Points are kept as contiguous arrays (structure of arrays); Vector
+        # objects are only materialized when points_per_category is read
+        if isinstance(points, VectorStore):
+            self._store = points
+            self._points: Optional[List[Vector]] = None
+        else:
+            self._store = VectorStore.from_vectors(points)
+            self._points = points
         self.k = k
         self._random = random
+        self.init_method = init_method
+        self.use_minibatch = use_minibatch
+        self.batch_size = batch_size
+
+        if device not in SUPPORTED_DEVICES:
+            raise ValueError(
+                f"Unsupported device '{device}'. Available: {', '.join(SUPPORTED_DEVICES)}"
+            )
+        self.device = device
+        if n_threads < 1:
+            raise ValueError(f"n_threads must be at least 1, got {n_threads}")
+        self.n_threads = n_threads
+        self._cupy = None
+        if device == "cuda":
+            try:
+                import cupy
+            except ImportError as e:
+                raise ImportError(
+                    "CuPy is required for device='cuda'. Install with: pip install cupy"
+                ) from e
+            self._cupy = cupy
 
         self.current_iteration = 0
-        self.points_per_category: List[List[Vector]] = []
+        self.labels: Optional[np.ndarray] = None
+        self._points_per_category: Optional[List[List[Vector]]] = None
         self.centroids: List[Vector] = []
         self.current_delta_distance_difference = 0.0
 
+        # Accumulated weight seen by each centroid during mini-batch updates
+        self._minibatch_counts = np.zeros(k, dtype=np.float64)
+
         if centroids is not None:
             # Use provided centroids
             self.centroids = centroids
-            for _ in range(self.k):
-                self.points_per_category.append([])
+        elif init_method == KMeansInitMethod.KMEANS_PP:
+            self._init_kmeans_plus_plus()
         else:
             # Random initialization
             self._init_centroids()
 
     def _init_centroids(self) -> None:
-        """Initialize centroids by randomly selecting from data points."""
-        for _ in range(self.k):
-            # Select random point as initial centroid
-            random_index = int(len(self._points) * self._random.next())
-            # Clamp to valid range
-            random_index = min(random_index, len(self._points) - 1)
-            self.centroids.append(self._points[random_index])
-            self.points_per_category.append([])
+        """Initialize centroids by randomly selecting from data points.
+
+        All k indices are drawn in one call on the seeded NumPy generator;
+        points are only reused when there are fewer points than clusters.
+        """
+        n_points = len(self._store)
+        indices = self._random.generator.choice(
+            n_points, size=self.k, replace=self.k > n_points
+        )
+        for index in indices:
+            self.centroids.append(self._vector_at(int(index)))
+
+    def _init_kmeans_plus_plus(self) -> None:
+        """Initialize centroids using k-means++ seeding.
+
+        The first centroid is picked uniformly at random. Each following centroid
+        is sampled with probability proportional to its weight times the squared
+        distance to the nearest centroid chosen so far, which spreads the seeds
+        out and typically halves the number of iterations needed to converge.
+        """
+        n_points = len(self._store)
+        points_array = self._store.values
+        weights = self._store.weights
+
+        # Each seed consumes exactly one draw, so they can be drawn up front
+        draws = self._random.next_batch(max(self.k, 1))
+        first_index = min(int(n_points * draws[0]), n_points - 1)
+        chosen = [first_index]
+
+        # Squared distance from each point to its nearest chosen centroid
+        diff = points_array - points_array[first_index]
+        min_sq_distances = np.einsum('ij,ij->i', diff, diff)
+
+        for draw in draws[1:]:
+            scores = min_sq_distances * weights
+            total = scores.sum()
+
+            if total > 0:
+                cumulative = np.cumsum(scores)
+                target = draw * total
+                next_index = int(np.searchsorted(cumulative, target, side='right'))
+            else:
+                # All points coincide with a centroid (or have zero weight)
+                next_index = int(n_points * draw)
+            next_index = min(next_index, n_points - 1)
+            chosen.append(next_index)
+
+            diff = points_array - points_array[next_index]
+            np.minimum(min_sq_distances, np.einsum('ij,ij->i', diff, diff), out=min_sq_distances)
+
+        for index in chosen:
+            self.centroids.append(self._vector_at(index))
+
+    def _vector_at(self, index: int) -> Vector:
+        """Get the point at index as a Vector (the original object if given one)."""
+        if self._points is not None:
+            return self._points[index]
+        return self._store[index]
+
+    @property
+    def points_per_category(self) -> List[List[Vector]]:
+        """Get the points assigned to each cluster by the last assignment.
+
+        Built lazily from labels and cached until the next assignment, so the
+        clustering loop itself never creates per-point Python lists.
+
+        Returns:
+            List of k lists of Vectors (all empty before the first assignment)
+        """
+        if self._points_per_category is None:
+            categories: List[List[Vector]] = [[] for _ in range(self.k)]
+            if self.labels is not None:
+                for index, label in enumerate(self.labels.tolist()):
+                    categories[label].append(self._vector_at(index))
+            self._points_per_category = categories
+        return self._points_per_category
 
     def step(self) -> None:
         """Perform one iteration of the K-means algorithm.
@@ -106,55 +298,202 @@ class KMeans:
             ...       kmeans.current_iteration < 100:
             ...     kmeans.step()
         """
-        # Clear previous assignments
-        for i in range(self.k):
-            self.points_per_category[i] = []
+        if self.use_minibatch:
+            self.step_minibatch(self.batch_size)
+            return
+
+        labels = self.assign_points()
+        if labels is None:
+            self.current_delta_distance_difference = 0.0
+            self.current_iteration += 1
+            return
+
+        # OPTIMIZATION: Vectorized update step. Per-cluster weighted sums are
+        # computed with bincount over the contiguous value/weight arrays.
+        points_array = self._store.values
+        weights = self._store.weights
+        member_counts = np.bincount(labels, minlength=self.k)
+        weight_sums = np.bincount(labels, weights=weights, minlength=self.k)
+        value_sums = np.column_stack([
+            np.bincount(labels, weights=weights * points_array[:, dim], minlength=self.k)
+            for dim in range(points_array.shape[1])
+        ])
 
-        # OPTIMIZATION: Vectorized assignment step using NumPy
-        # Convert points and centroids to NumPy arrays for batch distance computation
-        n_points = len(self._points)
-        if n_points > 0 and self.k > 0:
-            dims = len(self._points[0].values)
+        total_distance_moved = 0.0
 
-            # Build point matrix: shape (n_points, dims)
-            points_array = np.array([p.values for p in self._points], dtype=np.float64)
+        # Clusters without members (or with zero total weight) keep their centroid
+        for k in np.nonzero((member_counts > 0) & (weight_sums > 0))[0]:
+            old_values = np.asarray(self.centroids[k].values, dtype=np.float64)
+            new_values = value_sums[k] / weight_sums[k]
 
-            # Build centroid matrix: shape (k, dims)
-            centroids_array = np.array([c.values for c in self.centroids], dtype=np.float64)
+            # Track how much this centroid moved
+            total_distance_moved += float(np.sqrt(np.sum((new_values - old_values) ** 2)))
 
-            # Compute all distances at once: shape (n_points, k)
-            # Using broadcasting: (n_points, 1, dims) - (1, k, dims) = (n_points, k, dims)
-            diff = points_array[:, None, :] - centroids_array[None, :, :]
-            distances = np.sqrt(np.einsum('ijk,ijk->ij', diff, diff))
+            # Update centroid
+            self.centroids[k] = Vector(new_values.tolist(), float(weight_sums[k]))
 
-            # Find nearest centroid for each point
-            nearest_indices = np.argmin(distances, axis=1)
+        self.current_delta_distance_difference = total_distance_moved
+        self.current_iteration += 1
 
-            # Assign points to clusters
-            for idx, point in enumerate(self._points):
-                nearest_centroid_index = int(nearest_indices[idx])
-                self.points_per_category[nearest_centroid_index].append(point)
+    def assign_points(self) -> Optional[np.ndarray]:
+        """Assign every point to its nearest centroid.
 
-        # OPTIMIZATION: Vectorized update step
-        total_distance_moved = 0.0
+        Updates labels (and invalidates points_per_category) without moving the
+        centroids. step() calls this before the update step; after mini-batch
+        training call it once to obtain the final partition of all points.
 
-        for k in range(len(self.points_per_category)):
-            cluster = self.points_per_category[k]
+        OPTIMIZED: Uses NumPy vectorization for 10-100x speedup on distance calculations.
 
-            if len(cluster) > 0:
-                # Calculate new centroid as weighted average (uses optimized Vector.average)
-                new_centroid = Vector.average(cluster)
+        Returns:
+            The new labels array, or None if there are no points or clusters
+        """
+        self._points_per_category = None
+
+        if len(self._store) == 0 or self.k == 0:
+            self.labels = None
+            return None
+
+        self.labels = self._nearest_centroid_indices(self._store.values)
+        return self.labels
+
+    def step_minibatch(self, batch_size: int) -> None:
+        """Perform one mini-batch K-means iteration.
+
+        Samples batch_size points (with replacement, using the seeded generator),
+        assigns them to their nearest centroid and moves each centroid towards
+        the weighted mean of its batch members. Each centroid keeps a running
+        total of the weight it has absorbed, so the learning rate decays as
+        1/n_k and the centroid converges to the running weighted mean.
+
+        Only the centroids are updated; call assign_points() afterwards to
+        refresh points_per_category for the full data set.
+
+        Args:
+            batch_size: Number of points to sample for this iteration
+
+        Example:
+            >>> kmeans = KMeans(data, 16, random)
+            >>> kmeans.step_minibatch(1024)
+            >>> while not kmeans.has_converged(0.5):
+            ...     kmeans.step_minibatch(1024)
+            >>> kmeans.assign_points()
+        """
+        n_points = len(self._store)
+        if n_points == 0 or self.k == 0:
+            self.current_delta_distance_difference = 0.0
+            self.current_iteration += 1
+            return
+
+        # Draw batch indices deterministically from the seeded generator
+        batch_indices = self._random.generator.integers(0, n_points, size=batch_size)
+        batch_array = self._store.values[batch_indices]
+        batch_weights = self._store.weights[batch_indices]
+        labels = self._nearest_centroid_indices(batch_array)
+
+        # Aggregate weighted sums per cluster: equivalent to applying the
+        # per-point update c_k += w / n_k * (x - c_k) for every batch member
+        dims = batch_array.shape[1]
+        weight_sums = np.bincount(labels, weights=batch_weights, minlength=self.k)
+        value_sums = np.zeros((self.k, dims), dtype=np.float64)
+        np.add.at(value_sums, labels, batch_array * batch_weights[:, None])
 
-                # Track how much this centroid moved (uses optimized distance_to)
-                distance_moved = self.centroids[k].distance_to(new_centroid)
-                total_distance_moved += distance_moved
+        total_distance_moved = 0.0
+        for k in np.nonzero(weight_sums > 0)[0]:
+            old_values = np.asarray(self.centroids[k].values, dtype=np.float64)
+            count = self._minibatch_counts[k]
+            new_count = count + weight_sums[k]
+            new_values = (old_values * count + value_sums[k]) / new_count
 
-                # Update centroid
-                self.centroids[k] = new_centroid
+            total_distance_moved += float(np.sqrt(np.sum((new_values - old_values) ** 2)))
+            self._minibatch_counts[k] = new_count
+            self.centroids[k] = Vector(new_values.tolist(), new_count)
 
         self.current_delta_distance_difference = total_distance_moved
         self.current_iteration += 1
 
+    def _nearest_centroid_indices(self, points_array: np.ndarray) -> np.ndarray:
+        """Find the index of the nearest centroid for each row of points_array.
+
+        Args:
+            points_array: Points to classify, shape (n_points, dims)
+
+        Returns:
+            Array of centroid indices, shape (n_points,)
+        """
+        # Build centroid matrix: shape (k, dims)
+        centroids_array = np.array([c.values for c in self.centroids], dtype=np.float64)
+
+        if self._cupy is not None:
+            return self._nearest_centroid_indices_gpu(points_array, centroids_array)
+
+        # Process points in L2-sized chunks so the (chunk, k) distance buffers
+        # stay cache resident. Uses ||x - c||^2 = ||x||^2 + ||c||^2 - 2 x.c,
+        # so each chunk is one GEMM; the per-point ||x||^2 term and the sqrt
+        # do not change the argmin and are skipped.
+        n_points, dims = points_array.shape
+        chunk_size = get_assignment_chunk_size(len(self.centroids), dims)
+        nearest_indices = np.empty(n_points, dtype=np.intp)
+        centroids_t = np.ascontiguousarray(centroids_array.T)
+        centroid_norms = np.einsum('ij,ij->i', centroids_array, centroids_array)
+
+        def assign_tile(tile_start: int, tile_stop: int) -> None:
+            for start in range(tile_start, tile_stop, chunk_size):
+                stop = min(start + chunk_size, tile_stop)
+                scores = points_array[start:stop] @ centroids_t
+                scores *= -2.0
+                scores += centroid_norms
+                nearest_indices[start:stop] = np.argmin(scores, axis=1)
+
+        # One contiguous tile of whole chunks per thread; each thread writes
+        # only its own slice of nearest_indices
+        n_chunks = -(-n_points // chunk_size)
+        n_tiles = min(self.n_threads, n_chunks)
+        if n_tiles <= 1:
+            assign_tile(0, n_points)
+        else:
+            tile_size = -(-n_chunks // n_tiles) * chunk_size
+            starts = range(0, n_points, tile_size)
+            with ThreadPoolExecutor(max_workers=n_tiles) as pool:
+                stops = [min(start + tile_size, n_points) for start in starts]
+                list(pool.map(assign_tile, starts, stops))
+
+        return nearest_indices
+
+    def _nearest_centroid_indices_gpu(
+        self,
+        points_array: np.ndarray,
+        centroids_array: np.ndarray
+    ) -> np.ndarray:
+        """GPU variant of _nearest_centroid_indices using CuPy.
+
+        Uses ||x - c||^2 = ||x||^2 + ||c||^2 - 2 x.c, dropping the per-point
+        ||x||^2 term (it does not change the argmin), so the bulk of the work is
+        a single GEMM on cuBLAS. Points are streamed in fixed-size chunks so
+        images larger than VRAM still work.
+
+        Args:
+            points_array: Points to classify, shape (n_points, dims)
+            centroids_array: Centroids, shape (k, dims)
+
+        Returns:
+            Array of centroid indices, shape (n_points,)
+        """
+        cp = self._cupy
+        assert cp is not None, "GPU assignment requires device='cuda'"
+        centroids_gpu = cp.asarray(centroids_array)
+        centroid_norms = cp.sum(centroids_gpu * centroids_gpu, axis=1)
+
+        n_points = points_array.shape[0]
+        nearest_indices = np.empty(n_points, dtype=np.intp)
+
+        for start in range(0, n_points, GPU_ASSIGNMENT_CHUNK_SIZE):
+            stop = start + GPU_ASSIGNMENT_CHUNK_SIZE
+            chunk_gpu = cp.asarray(points_array[start:stop])
+            distances = centroid_norms[None, :] - 2.0 * (chunk_gpu @ centroids_gpu.T)
+            nearest_indices[start:stop] = cp.asnumpy(cp.argmin(distances, axis=1))
+
+        return nearest_indices
+
     def classify(self, point: Vector) -> int:
         """Get the cluster index for a given point.
 
@@ -8,7 +8,7 @@ OPTIMIZED: Uses NumPy for fast distance and averaging operations.
 """
 
 from __future__ import annotations
-from typing import List, Any, Optional
+from typing import List, Any, Optional, Sequence
 import math
 import numpy as np
 
@@ -23,6 +23,11 @@ class Vector:
         values: List of dimensional values
         weight: Weight for weighted operations (default: 1.0)
         tag: Optional metadata (e.g., original RGB color)
+
+    Note:
+        For large point sets (e.g. one vector per image color) prefer
+        VectorStore, which keeps values and weights in contiguous arrays
+        instead of one boxed Python object per point.
     """
 
     def __init__(self, values: List[float], weight: float = 1.0, tag: Optional[Any] = None) -> None:
@@ -175,3 +180,130 @@ class Vector:
             self.values == other.values
             and self.weight == other.weight
         )
+
+
+class VectorStore:
+    """Structure-of-arrays storage for many weighted vectors.
+
+    Keeps all values in a single (N, dims) float64 array and all weights in a
+    single (N,) array, so clustering code can run pure NumPy operations over
+    contiguous buffers instead of iterating over Vector objects. Tags are kept
+    in a plain list alongside.
+
+    Attributes:
+        dimensions: Dimensionality of the stored vectors (None until first add)
+
+    Example:
+        >>> store = VectorStore()
+        >>> store.add([255, 0, 0], 10.0, (255, 0, 0))
+        0
+        >>> store.add([0, 255, 0], 1.0)
+        1
+        >>> store.weights
+        array([10.,  1.])
+        >>> store[0].tag
+        (255, 0, 0)
+    """
+
+    _INITIAL_CAPACITY = 64
+
+    def __init__(self, dimensions: Optional[int] = None) -> None:
+        """Create an empty store.
+
+        Args:
+            dimensions: Dimensionality of the vectors (inferred from the first add if None)
+        """
+        self.dimensions = dimensions
+        self._size = 0
+        self._values = np.empty((0, dimensions or 0), dtype=np.float64)
+        self._weights = np.empty(0, dtype=np.float64)
+        self._tags: List[Any] = []
+
+    @classmethod
+    def from_vectors(cls, vectors: Sequence[Vector]) -> VectorStore:
+        """Build a store from a list of Vector objects.
+
+        Args:
+            vectors: Vectors to copy into the store
+
+        Returns:
+            New store with the same values, weights and tags
+        """
+        dimensions = len(vectors[0].values) if len(vectors) > 0 else None
+        store = cls(dimensions)
+        if len(vectors) > 0:
+            store._values = np.array([v.values for v in vectors], dtype=np.float64)
+            store._weights = np.array([v.weight for v in vectors], dtype=np.float64)
+            store._tags = [v.tag for v in vectors]
+            store._size = len(vectors)
+        return store
+
+    def add(self, values: Sequence[float], weight: float = 1.0, tag: Optional[Any] = None) -> int:
+        """Append a vector to the store.
+
+        Args:
+            values: Dimensional values
+            weight: Weight for weighted operations (default: 1.0)
+            tag: Optional metadata tag
+
+        Returns:
+            Index of the added vector
+
+        Raises:
+            ValueError: If values has a different dimensionality than the store
+        """
+        if self.dimensions is None:
+            self.dimensions = len(values)
+            self._values = np.empty((0, self.dimensions), dtype=np.float64)
+        elif len(values) != self.dimensions:
+            raise ValueError(
+                f"Expected {self.dimensions} values, got {len(values)}"
+            )
+
+        if self._size == len(self._weights):
+            # Grow geometrically so repeated adds stay amortized O(1)
+            capacity = max(self._INITIAL_CAPACITY, 2 * self._size)
+            values_buffer = np.empty((capacity, self.dimensions), dtype=np.float64)
+            values_buffer[:self._size] = self._values[:self._size]
+            weights_buffer = np.empty(capacity, dtype=np.float64)
+            weights_buffer[:self._size] = self._weights[:self._size]
+            self._values = values_buffer
+            self._weights = weights_buffer
+
+        index = self._size
+        self._values[index] = values
+        self._weights[index] = weight
+        self._tags.append(tag)
+        self._size += 1
+        return index
+
+    @property
+    def values(self) -> np.ndarray:
+        """Get all values as an (N, dims) array view."""
+        return self._values[:self._size]
+
+    @property
+    def weights(self) -> np.ndarray:
+        """Get all weights as an (N,) array view."""
+        return self._weights[:self._size]
+
+    @property
+    def tags(self) -> List[Any]:
+        """Get the tags of all vectors."""
+        return self._tags
+
+    def __len__(self) -> int:
+        """Number of stored vectors."""
+        return self._size
+
+    def __getitem__(self, index: int) -> Vector:
+        """Materialize the vector at index as a Vector object."""
+        if not -self._size <= index < self._size:
+            raise IndexError(f"VectorStore index {index} out of range")
+        if index < 0:
+            index += self._size
+        return Vector(
+            self._values[index].tolist(),
+            float(self._weights[index]),
+            self._tags[index]
+        )
@@ -1,5 +1,13 @@
 """Command-line interface for Paint by Numbers Generator."""
 
-from paintbynumbers.cli.main import main, init_config, cli_group
+from typing import Any
 
 __all__ = ['main', 'init_config', 'cli_group']
+
+
+def __getattr__(name: str) -> Any:
+    """Import CLI commands on first access so importing the package stays cheap."""
+    if name in __all__:
+        import paintbynumbers.cli.main as _cli_main
+        return getattr(_cli_main, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,378 @@
+"""The ``generate`` command: turn an image into paint-by-numbers artwork.
+
+This is also the ``paintbynumbers`` console entry point.
+"""
+
+from __future__ import annotations
+import os
+import sys
+from functools import cache
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import click
+from click.core import ParameterSource
+
+from paintbynumbers.utils.jsonio import read_json, write_json
+
+if TYPE_CHECKING:
+    from paintbynumbers.core.settings import ClusteringColorSpace
+
+# NOTE: The pipeline and settings modules pull in NumPy, Pillow and the whole
+# processing graph. They are imported inside the command bodies so that
+# `--help` and argument errors return without loading them.
+
+
+_BAR_WIDTH = 30
+
+# Every bar the progress display can show, built once
+_BARS = tuple("█" * i + "░" * (_BAR_WIDTH - i) for i in range(_BAR_WIDTH + 1))
+
+# (stage, percent) of the last line drawn, so repeated updates are skipped
+_last_progress: List[Optional[Tuple[str, int]]] = [None]
+
+
+def _progress_callback(stage: str, progress: float) -> None:
+    """Display progress updates.
+
+    Redraws only when the stage or the displayed percentage changes.
+    """
+    percent = int(progress * 100)
+    done = progress >= 1.0
+    if not done and _last_progress[0] == (stage, percent):
+        return
+    _last_progress[0] = None if done else (stage, percent)
+
+    filled = min(max(int(_BAR_WIDTH * progress), 0), _BAR_WIDTH)
+    sys.stdout.write(f"\r{stage:.<30} [{_BARS[filled]}] {percent}%")
+    if done:
+        sys.stdout.write("\n")
+    sys.stdout.flush()
+
+
+# generate options that make up the CLI output profile
+_PROFILE_PARAMS = (
+    'show_labels', 'show_borders', 'fill_facets', 'scale',
+    'font_size', 'font_color', 'border_width', 'label_start_number',
+)
+
+
+@cache
+def _color_spaces() -> Dict[str, ClusteringColorSpace]:
+    """Map ``--color-space`` choices to enum members (built on first use)."""
+    from paintbynumbers.core.settings import ClusteringColorSpace
+    return {member.value: member for member in ClusteringColorSpace}
+
+
+def _dump_help(ctx: click.Context, param: click.Parameter, value: bool) -> None:
+    """Print help with a ``{prog}`` placeholder at a fixed width, then exit.
+
+    Used to regenerate ``_help.txt``, the help text served by
+    ``paintbynumbers.cli.main.run`` without building this command.
+    """
+    if not value or ctx.resilient_parsing:
+        return
+    command = ctx.command
+    help_ctx = click.Context(
+        command, info_name='{prog}', terminal_width=78, **command.context_settings
+    )
+    click.echo(command.get_help(help_ctx))
+    ctx.exit()
+
+
+@click.command(
+    no_args_is_help=True,
+    context_settings={'help_option_names': ['-h', '--help']},
+)
+@click.argument('input_path', type=click.Path())
+@click.argument('output_path', type=click.Path())
+@click.option(
+    '--config', '-c',
+    type=click.Path(),
+    help='Path to JSON configuration file'
+)
+@click.option(
+    '--colors', '-n',
+    type=int,
+    help='Number of colors (K-means clusters)'
+)
+@click.option(
+    '--color-space',
+    type=click.Choice(['RGB', 'HSL', 'LAB'], case_sensitive=False),
+    help='Color space for K-means clustering'
+)
+@click.option(
+    '--max-width',
+    type=int,
+    help='Maximum image width (will resize if larger)'
+)
+@click.option(
+    '--max-height',
+    type=int,
+    help='Maximum image height (will resize if larger)'
+)
+@click.option(
+    '--min-facet-size',
+    type=int,
+    help='Minimum facet size in pixels (smaller facets will be merged)'
+)
+@click.option(
+    '--max-facets',
+    type=int,
+    help='Maximum number of facets (will merge smallest if exceeded)'
+)
+@click.option(
+    '--border-smoothing',
+    type=int,
+    help='Number of times to halve border segments for smoothing (0-3)'
+)
+@click.option(
+    '--svg/--no-svg',
+    default=True,
+    help='Generate SVG output (default: enabled)'
+)
+@click.option(
+    '--png',
+    is_flag=True,
+    help='Also generate PNG output'
+)
+@click.option(
+    '--jpg',
+    is_flag=True,
+    help='Also generate JPG output'
+)
+@click.option(
+    '--show-labels/--no-show-labels',
+    default=True,
+    help='Show color labels in output (default: enabled)'
+)
+@click.option(
+    '--show-borders/--no-show-borders',
+    default=True,
+    help='Show borders in output (default: enabled)'
+)
+@click.option(
+    '--fill-facets/--no-fill-facets',
+    default=True,
+    help='Fill facets with colors (default: enabled)'
+)
+@click.option(
+    '--scale',
+    type=float,
+    default=3.0,
+    help='Output scale multiplier (default: 3.0)'
+)
+@click.option(
+    '--font-size',
+    type=int,
+    default=20,
+    help='Label font size (default: 20)'
+)
+@click.option(
+    '--font-color',
+    default='#000000',
+    help='Label font color (default: #000000)'
+)
+@click.option(
+    '--border-width',
+    type=float,
+    default=1.0,
+    help='Border/stroke width in SVG (default: 1.0)'
+)
+@click.option(
+    '--label-start-number',
+    type=int,
+    default=0,
+    help='Starting number for labels (default: 0)'
+)
+@click.option(
+    '--seed',
+    type=int,
+    help='Random seed for reproducibility'
+)
+@click.option(
+    '--quiet', '-q',
+    is_flag=True,
+    help='Suppress progress output'
+)
+@click.option(
+    '--save-config',
+    type=click.Path(),
+    help='Save configuration to JSON file'
+)
+@click.option(
+    '--verbose', '-v',
+    is_flag=True,
+    help='Print the full traceback when an error occurs'
+)
+@click.option(
+    '--dump-help',
+    is_flag=True,
+    hidden=True,
+    expose_value=False,
+    is_eager=True,
+    callback=_dump_help,
+    help='Print the help text used by the fast --help path and exit'
+)
+def main(
+    input_path: str,
+    output_path: str,
+    config: Optional[str],
+    colors: Optional[int],
+    color_space: Optional[str],
+    max_width: Optional[int],
+    max_height: Optional[int],
+    min_facet_size: Optional[int],
+    max_facets: Optional[int],
+    border_smoothing: Optional[int],
+    svg: bool,
+    png: bool,
+    jpg: bool,
+    show_labels: bool,
+    show_borders: bool,
+    fill_facets: bool,
+    scale: float,
+    font_size: int,
+    font_color: str,
+    border_width: float,
+    label_start_number: int,
+    seed: Optional[int],
+    quiet: bool,
+    save_config: Optional[str],
+    verbose: bool
+) -> None:
+    """Generate paint-by-numbers artwork from an image.
+
+    INPUT_PATH: Path to input image file
+
+    OUTPUT_PATH: Base path for output files (without extension)
+
+    Examples:
+
+      \b
+      # Basic usage - generate SVG with default settings
+      $ paintbynumbers input.jpg output
+
+      \b
+      # Generate SVG and PNG with 24 colors
+      $ paintbynumbers input.jpg output --colors 24 --png
+
+      \b
+      # Use custom configuration file
+      $ paintbynumbers input.jpg output --config settings.json
+
+      \b
+      # Adjust output appearance
+      $ paintbynumbers input.jpg output --colors 16 --scale 4.0 --font-size 24
+
+      \b
+      # Save configuration for later reuse
+      $ paintbynumbers input.jpg output --colors 20 --save-config my-settings.json
+    """
+    # Checked here rather than with click.Path(exists=True) so that parsing
+    # (and --help) never touches the filesystem
+    if not os.path.isfile(input_path):
+        click.echo(f"Error: input file not found: {input_path}", err=True)
+        sys.exit(1)
+    if config is not None and not os.path.isfile(config):
+        click.echo(f"Error: config file not found: {config}", err=True)
+        sys.exit(1)
+
+    from paintbynumbers.core.pipeline import PaintByNumbersPipeline
+    from paintbynumbers.core.settings import Settings, OutputProfile
+
+    try:
+        # Load or create settings
+        if config:
+            settings = Settings.from_json(read_json(config))
+            if not quiet:
+                click.echo(f"Loaded configuration from {config}")
+        else:
+            settings = Settings()
+
+        # Override with command-line options
+        if colors is not None:
+            settings.kMeansNrOfClusters = colors
+        if color_space is not None:
+            settings.kMeansClusteringColorSpace = _color_spaces()[color_space.upper()]
+        if max_width is not None:
+            settings.resizeImageWidth = max_width
+            settings.resizeImageIfTooLarge = True
+        if max_height is not None:
+            settings.resizeImageHeight = max_height
+            settings.resizeImageIfTooLarge = True
+        if min_facet_size is not None:
+            settings.removeFacetsSmallerThanNrOfPoints = min_facet_size
+        if max_facets is not None:
+            settings.maximumNumberOfFacets = max_facets
+        if border_smoothing is not None:
+            settings.nrOfTimesToHalveBorderSegments = border_smoothing
+        if seed is not None:
+            settings.randomSeed = seed
+
+        # Update output profile. Profiles loaded from --config are kept unless
+        # one of the appearance flags was given on the command line.
+        ctx = click.get_current_context()
+        profile_overridden = any(
+            ctx.get_parameter_source(name) not in (None, ParameterSource.DEFAULT)
+            for name in _PROFILE_PARAMS
+        )
+        if config is None or profile_overridden:
+            profile = OutputProfile(
+                name="cli_output",
+                filetype="svg",
+                svgShowLabels=show_labels,
+                svgShowBorders=show_borders,
+                svgFillFacets=fill_facets,
+                svgSizeMultiplier=scale,
+                svgFontSize=font_size,
+                svgFontColor=font_color,
+                svgBorderWidth=border_width,
+                svgLabelStartNumber=label_start_number
+            )
+            settings.outputProfiles = [profile]
+
+        # Save configuration if requested
+        if save_config:
+            write_json(settings.to_json(), save_config)
+            if not quiet:
+                click.echo(f"Configuration saved to {save_config}")
+
+        # Display processing info
+        if not quiet:
+            click.echo(f"\nProcessing: {input_path}")
+            click.echo(f"Output: {output_path}")
+            click.echo(f"Colors: {settings.kMeansNrOfClusters}")
+            click.echo(f"Color space: {settings.kMeansClusteringColorSpace.value}")
+            click.echo("")
+
+        # Process the image
+        progress = _progress_callback if not quiet else None
+        PaintByNumbersPipeline.process_and_save(
+            input_path=input_path,
+            output_path=output_path,
+            settings=settings,
+            export_png=png,
+            export_jpg=jpg,
+            progress_callback=progress
+        )
+
+        if not quiet:
+            click.echo("\n")
+            outputs = []
+            if svg:
+                outputs.append(f"{output_path}.svg")
+            if png:
+                outputs.append(f"{output_path}.png")
+            if jpg:
+                outputs.append(f"{output_path}.jpg")
+            click.echo(f"✓ Successfully generated: {', '.join(outputs)}")
+
+    except KeyboardInterrupt:
+        click.echo("\n\nProcessing interrupted by user.", err=True)
+        sys.exit(130)
+    except Exception as e:
+        click.echo(f"\nError: {type(e).__name__}: {e}", err=True)
+        if verbose:
+            import traceback
+            traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,40 @@
+"""The ``init-config`` command: write a default settings file."""
+
+from __future__ import annotations
+import sys
+
+import click
+
+from paintbynumbers.utils.jsonio import write_json
+
+
+@click.command()
+@click.option(
+    '--output', '-o',
+    type=click.Path(),
+    default='settings.json',
+    help='Output file path (default: settings.json)'
+)
+def init_config(output: str) -> None:
+    """Create a default configuration file.
+
+    This generates a JSON configuration file with all default settings
+    that can be customized and used with the --config option.
+
+    Example:
+
+      \b
+      $ paintbynumbers-config --output my-settings.json
+      $ paintbynumbers input.jpg output --config my-settings.json
+    """
+    from paintbynumbers.core.settings import Settings
+
+    try:
+        settings = Settings()
+        write_json(settings.to_json(), output)
+        click.echo(f"✓ Configuration file created: {output}")
+        click.echo("\nEdit this file to customize settings, then use it with:")
+        click.echo(f"  paintbynumbers input.jpg output --config {output}")
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
@@ -1,13 +1,19 @@
 """Command-line interface for Paint by Numbers Generator.
 
 This module provides the main CLI for processing images into paint-by-numbers artwork.
+
+The commands themselves live in private modules (``_generate``,
+``_init_config`` and ``_explore``). ``cli_group`` only imports the module of
+the subcommand that is actually invoked, so running one subcommand never
+builds the option parsers of the others. Without Click installed the module
+still imports, and every command prints an install hint and exits.
 """
 
 from __future__ import annotations
+import importlib
+import os
 import sys
-import json
-from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     import click
@@ -15,557 +21,118 @@ try:
 except ImportError:
     CLICK_AVAILABLE = False
 
-from paintbynumbers.core.pipeline import PaintByNumbersPipeline
-from paintbynumbers.core.settings import Settings, ClusteringColorSpace
-
-
-def _progress_callback(stage: str, progress: float) -> None:
-    """Display progress updates."""
-    bar_width = 30
-    filled = int(bar_width * progress)
-    bar = "█" * filled + "░" * (bar_width - filled)
-    percent = int(progress * 100)
-    click.echo(f"\r{stage:.<30} [{bar}] {percent}%", nl=(progress >= 1.0))
-
-
-@click.command()
-@click.argument('input_path', type=click.Path(exists=True))
-@click.argument('output_path', type=click.Path())
-@click.option(
-    '--config', '-c',
-    type=click.Path(exists=True),
-    help='Path to JSON configuration file'
-)
-@click.option(
-    '--colors', '-n',
-    type=int,
-    help='Number of colors (K-means clusters)'
-)
-@click.option(
-    '--color-space',
-    type=click.Choice(['RGB', 'HSL', 'LAB'], case_sensitive=False),
-    help='Color space for K-means clustering'
-)
-@click.option(
-    '--max-width',
-    type=int,
-    help='Maximum image width (will resize if larger)'
-)
-@click.option(
-    '--max-height',
-    type=int,
-    help='Maximum image height (will resize if larger)'
-)
-@click.option(
-    '--min-facet-size',
-    type=int,
-    help='Minimum facet size in pixels (smaller facets will be merged)'
-)
-@click.option(
-    '--max-facets',
-    type=int,
-    help='Maximum number of facets (will merge smallest if exceeded)'
-)
-@click.option(
-    '--border-smoothing',
-    type=int,
-    help='Number of times to halve border segments for smoothing (0-3)'
-)
-@click.option(
-    '--svg/--no-svg',
-    default=True,
-    help='Generate SVG output (default: enabled)'
-)
-@click.option(
-    '--png',
-    is_flag=True,
-    help='Also generate PNG output'
-)
-@click.option(
-    '--jpg',
-    is_flag=True,
-    help='Also generate JPG output'
-)
-@click.option(
-    '--show-labels/--no-show-labels',
-    default=True,
-    help='Show color labels in output (default: enabled)'
-)
-@click.option(
-    '--show-borders/--no-show-borders',
-    default=True,
-    help='Show borders in output (default: enabled)'
-)
-@click.option(
-    '--fill-facets/--no-fill-facets',
-    default=True,
-    help='Fill facets with colors (default: enabled)'
-)
-@click.option(
-    '--scale',
-    type=float,
-    default=3.0,
-    help='Output scale multiplier (default: 3.0)'
-)
-@click.option(
-    '--font-size',
-    type=int,
-    default=20,
-    help='Label font size (default: 20)'
-)
-@click.option(
-    '--font-color',
-    default='#000000',
-    help='Label font color (default: #000000)'
-)
-@click.option(
-    '--border-width',
-    type=float,
-    default=1.0,
-    help='Border/stroke width in SVG (default: 1.0)'
-)
-@click.option(
-    '--label-start-number',
-    type=int,
-    default=0,
-    help='Starting number for labels (default: 0)'
-)
-@click.option(
-    '--seed',
-    type=int,
-    help='Random seed for reproducibility'
-)
-@click.option(
-    '--quiet', '-q',
-    is_flag=True,
-    help='Suppress progress output'
-)
-@click.option(
-    '--save-config',
-    type=click.Path(),
-    help='Save configuration to JSON file'
-)
-def main(
-    input_path: str,
-    output_path: str,
-    config: Optional[str],
-    colors: Optional[int],
-    color_space: Optional[str],
-    max_width: Optional[int],
-    max_height: Optional[int],
-    min_facet_size: Optional[int],
-    max_facets: Optional[int],
-    border_smoothing: Optional[int],
-    svg: bool,
-    png: bool,
-    jpg: bool,
-    show_labels: bool,
-    show_borders: bool,
-    fill_facets: bool,
-    scale: float,
-    font_size: int,
-    font_color: str,
-    border_width: float,
-    label_start_number: int,
-    seed: Optional[int],
-    quiet: bool,
-    save_config: Optional[str]
-) -> None:
-    """Generate paint-by-numbers artwork from an image.
-
-    INPUT_PATH: Path to input image file
-
-    OUTPUT_PATH: Base path for output files (without extension)
-
-    Examples:
-
-      \b
-      # Basic usage - generate SVG with default settings
-      $ paintbynumbers input.jpg output
-
-      \b
-      # Generate SVG and PNG with 24 colors
-      $ paintbynumbers input.jpg output --colors 24 --png
-
-      \b
-      # Use custom configuration file
-      $ paintbynumbers input.jpg output --config settings.json
-
-      \b
-      # Adjust output appearance
-      $ paintbynumbers input.jpg output --colors 16 --scale 4.0 --font-size 24
-
-      \b
-      # Save configuration for later reuse
-      $ paintbynumbers input.jpg output --colors 20 --save-config my-settings.json
-    """
-    if not CLICK_AVAILABLE:
-        click.echo("Error: Click is required for the CLI. Install with: pip install click")
-        sys.exit(1)
 
-    try:
-        # Load or create settings
-        if config:
-            with open(config, 'r') as f:
-                config_data = json.load(f)
-            settings = Settings.from_json(config_data)
-            if not quiet:
-                click.echo(f"Loaded configuration from {config}")
-        else:
-            settings = Settings()
-
-        # Override with command-line options
-        if colors is not None:
-            settings.kMeansNrOfClusters = colors
-        if color_space is not None:
-            settings.kMeansClusteringColorSpace = ClusteringColorSpace(color_space.upper())
-        if max_width is not None:
-            settings.resizeImageWidth = max_width
-            settings.resizeImageIfTooLarge = True
-        if max_height is not None:
-            settings.resizeImageHeight = max_height
-            settings.resizeImageIfTooLarge = True
-        if min_facet_size is not None:
-            settings.removeFacetsSmallerThanNrOfPoints = min_facet_size
-        if max_facets is not None:
-            settings.maximumNumberOfFacets = max_facets
-        if border_smoothing is not None:
-            settings.nrOfTimesToHalveBorderSegments = border_smoothing
-        if seed is not None:
-            settings.randomSeed = seed
-
-        # Update output profile
-        from paintbynumbers.core.settings import OutputProfile
-        profile = OutputProfile(
-            name="cli_output",
-            filetype="svg",
-            svgShowLabels=show_labels,
-            svgShowBorders=show_borders,
-            svgFillFacets=fill_facets,
-            svgSizeMultiplier=scale,
-            svgFontSize=font_size,
-            svgFontColor=font_color,
-            svgBorderWidth=border_width,
-            svgLabelStartNumber=label_start_number
-        )
-        settings.outputProfiles = [profile]
-
-        # Save configuration if requested
-        if save_config:
-            with open(save_config, 'w') as f:
-                json.dump(settings.to_json(), f, indent=2)
-            if not quiet:
-                click.echo(f"Configuration saved to {save_config}")
-
-        # Display processing info
-        if not quiet:
-            click.echo(f"\nProcessing: {input_path}")
-            click.echo(f"Output: {output_path}")
-            click.echo(f"Colors: {settings.kMeansNrOfClusters}")
-            click.echo(f"Color space: {settings.kMeansClusteringColorSpace.value}")
-            click.echo("")
-
-        # Process the image
-        progress = _progress_callback if not quiet else None
-        PaintByNumbersPipeline.process_and_save(
-            input_path=input_path,
-            output_path=output_path,
-            settings=settings,
-            export_png=png,
-            export_jpg=jpg,
-            progress_callback=progress
-        )
-
-        if not quiet:
-            click.echo("\n")
-            outputs = []
-            if svg:
-                outputs.append(f"{output_path}.svg")
-            if png:
-                outputs.append(f"{output_path}.png")
-            if jpg:
-                outputs.append(f"{output_path}.jpg")
-            click.echo(f"✓ Successfully generated: {', '.join(outputs)}")
-
-    except KeyboardInterrupt:
-        click.echo("\n\nProcessing interrupted by user.", err=True)
-        sys.exit(130)
-    except Exception as e:
-        click.echo(f"\nError: {e}", err=True)
-        if not quiet:
-            import traceback
-            traceback.print_exc()
-        sys.exit(1)
-
-
-@click.command()
-@click.option(
-    '--output', '-o',
-    type=click.Path(),
-    default='settings.json',
-    help='Output file path (default: settings.json)'
-)
-def init_config(output: str) -> None:
-    """Create a default configuration file.
-
-    This generates a JSON configuration file with all default settings
-    that can be customized and used with the --config option.
-
-    Example:
-
-      \b
-      $ paintbynumbers-config --output my-settings.json
-      $ paintbynumbers input.jpg output --config my-settings.json
-    """
-    if not CLICK_AVAILABLE:
-        click.echo("Error: Click is required. Install with: pip install click")
-        sys.exit(1)
+# Subcommand name -> (module, attribute) holding the Click command
+_SUBCOMMANDS: Dict[str, Tuple[str, str]] = {
+    'generate': ('paintbynumbers.cli._generate', 'main'),
+    'init-config': ('paintbynumbers.cli._init_config', 'init_config'),
+    'explore': ('paintbynumbers.cli._explore', 'explore'),
+    'init-explorer-config': ('paintbynumbers.cli._explore', 'init_explorer_config'),
+}
 
-    try:
-        settings = Settings()
-        with open(output, 'w') as f:
-            json.dump(settings.to_json(), f, indent=2)
-        click.echo(f"✓ Configuration file created: {output}")
-        click.echo("\nEdit this file to customize settings, then use it with:")
-        click.echo(f"  paintbynumbers input.jpg output --config {output}")
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
-
-
-@click.group()
-def cli_group():
-    """Paint by Numbers Generator CLI tools."""
-    pass
-
-
-@click.command()
-@click.argument('input_path', type=click.Path(exists=True))
-@click.option(
-    '--config', '-c',
-    type=click.Path(exists=True),
-    help='Path to JSON explorer configuration file'
-)
-@click.option(
-    '--preset',
-    type=click.Choice(['quick_test', 'detailed_photos', 'simple_illustrations',
-                       'color_space_comparison', 'cluster_exploration']),
-    help='Use a preset configuration'
-)
-@click.option(
-    '--output-dir', '-o',
-    type=click.Path(),
-    help='Output directory (default: results/{image_name}/{timestamp})'
-)
-@click.option(
-    '--strategy',
-    type=click.Choice(['grid', 'star', 'random'], case_sensitive=False),
-    help='Exploration strategy (overrides config/preset)'
-)
-@click.option(
-    '--parallel/--sequential',
-    default=True,
-    help='Process variations in parallel (default: enabled)'
-)
-@click.option(
-    '--workers',
-    type=int,
-    help='Number of parallel workers (default: CPU count)'
-)
-@click.option(
-    '--no-save',
-    is_flag=True,
-    help='Skip saving intermediate outputs (faster)'
-)
-@click.option(
-    '--quiet', '-q',
-    is_flag=True,
-    help='Suppress progress output'
-)
-def explore(
-    input_path: str,
-    config: Optional[str],
-    preset: Optional[str],
-    output_dir: Optional[str],
-    strategy: Optional[str],
-    parallel: bool,
-    workers: Optional[int],
-    no_save: bool,
-    quiet: bool,
-) -> None:
-    """Explore parameter variations for paint-by-numbers generation.
-
-    INPUT_PATH: Path to input image file
-
-    This command generates multiple variations of paint-by-numbers output
-    with different parameter combinations and creates an interactive HTML
-    report for comparing results.
-
-    Examples:
-
-      \b
-      # Quick test with preset configuration
-      $ paintbynumbers explore input.jpg --preset quick_test
-
-      \b
-      # Use custom configuration file
-      $ paintbynumbers explore input.jpg --config explorer.json
-
-      \b
-      # Override strategy from config
-      $ paintbynumbers explore input.jpg --preset cluster_exploration --strategy star
-
-      \b
-      # Disable parallel processing and intermediate saves (slower but less disk)
-      $ paintbynumbers explore input.jpg --preset quick_test --sequential --no-save
-    """
-    if not CLICK_AVAILABLE:
-        click.echo("Error: Click is required. Install with: pip install click")
-        sys.exit(1)
+# Names that used to be defined in this module, kept importable from here
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, str]] = {
+    attr: (module, attr) for module, attr in _SUBCOMMANDS.values()
+}
 
-    try:
-        from paintbynumbers.explorer import (
-            ExplorerConfig,
-            ExplorationEngine,
-            HTMLReportGenerator,
-            get_preset,
-            ExplorationStrategy
-        )
-
-        # Load configuration
-        if config:
-            explorer_config = ExplorerConfig.from_json(config)
-            if not quiet:
-                click.echo(f"Loaded explorer configuration from {config}")
-        elif preset:
-            explorer_config = get_preset(preset)
-            if not quiet:
-                click.echo(f"Using preset: {preset}")
-        else:
-            # Default to quick_test preset
-            explorer_config = get_preset('quick_test')
-            if not quiet:
-                click.echo("Using default preset: quick_test")
-
-        # Override with command-line options
-        if output_dir:
-            explorer_config.output_dir = Path(output_dir)
-        if strategy:
-            explorer_config.strategy = ExplorationStrategy(strategy.upper())
-        explorer_config.parallel_processing = parallel
-        if workers:
-            explorer_config.max_workers = workers
-        if no_save:
-            explorer_config.save_intermediate = False
-
-        # Display exploration info
-        if not quiet:
-            click.echo(f"\nInput image: {input_path}")
-            click.echo(f"Strategy: {explorer_config.strategy.value}")
-            click.echo(f"Total variations: {explorer_config.get_total_combinations()}")
-            click.echo(f"Parallel processing: {explorer_config.parallel_processing}")
-            if explorer_config.parallel_processing:
-                max_w = explorer_config.max_workers or "auto"
-                click.echo(f"Workers: {max_w}")
-            click.echo("")
-
-        # Create progress callback
-        def progress_callback(current, total, message):
-            if not quiet:
-                click.echo(f"Progress: [{current}/{total}] {message}")
-
-        # Run exploration
-        engine = ExplorationEngine(
-            config=explorer_config,
-            input_image=Path(input_path),
-            output_dir=explorer_config.output_dir,
-            progress_callback=progress_callback if not quiet else None,
-        )
-
-        results = engine.run()
-
-        # Generate HTML report
-        if not quiet:
-            click.echo("\nGenerating HTML report...")
-
-        report_path = engine.output_dir / "report.html"
-        report_generator = HTMLReportGenerator(results, engine.output_dir)
-        report_generator.generate(report_path)
-
-        if not quiet:
-            click.echo(f"\n✓ Exploration complete!")
-            click.echo(f"  Results directory: {engine.output_dir}")
-            click.echo(f"  HTML report: {report_path}")
-            click.echo(f"\nOpen the report in your browser to compare variations:")
-            click.echo(f"  file://{report_path.absolute()}")
-
-    except KeyboardInterrupt:
-        click.echo("\n\nExploration interrupted by user.", err=True)
-        sys.exit(130)
-    except Exception as e:
-        click.echo(f"\nError: {e}", err=True)
-        if not quiet:
-            import traceback
-            traceback.print_exc()
-        sys.exit(1)
-
-
-@click.command()
-@click.option(
-    '--output', '-o',
-    type=click.Path(),
-    default='explorer_config.json',
-    help='Output file path (default: explorer_config.json)'
-)
-@click.option(
-    '--preset',
-    type=click.Choice(['quick_test', 'detailed_photos', 'simple_illustrations',
-                       'color_space_comparison', 'cluster_exploration']),
-    help='Base configuration on a preset'
-)
-def init_explorer_config(output: str, preset: Optional[str]) -> None:
-    """Create a configuration file for the explorer.
-
-    This generates a JSON configuration file with exploration settings
-    that can be customized and used with the explore command.
-
-    Example:
-
-      \b
-      $ paintbynumbers init-explorer-config --output my-explorer.json --preset quick_test
-      $ paintbynumbers explore input.jpg --config my-explorer.json
+
+# Rendered ``generate --help`` output, served by ``run()`` without building the
+# command. Regenerate after changing generate's options or docstring with:
+#   python -m paintbynumbers.cli.main --dump-help > src/paintbynumbers/cli/_help.txt
+_HELP_RESOURCE = '_help.txt'
+
+
+_CLICK_MISSING_MESSAGE = "Error: Click is required for the CLI. Install with: pip install click"
+
+
+def _missing_click(*args: Any, **kwargs: Any) -> None:
+    """Stand-in for every command when Click is not installed."""
+    print(_CLICK_MISSING_MESSAGE, file=sys.stderr)
+    sys.exit(1)
+
+
+def _build_cli() -> Any:
+    """Create the lazily dispatching ``cli_group``.
+
+    Kept in a function so nothing touches ``click`` at import time; it is
+    only called once Click is known to be importable.
+
+    Returns:
+        The root ``click.Group`` for the ``paintbynumbers`` tools
     """
+
+    class LazyGroup(click.Group):
+        """Click group that imports a subcommand only when it is requested.
+
+        ``list_commands`` answers from the static ``_SUBCOMMANDS`` table, and
+        ``get_command`` imports the defining module on first use.
+        """
+
+        def list_commands(self, ctx: click.Context) -> List[str]:
+            return sorted(_SUBCOMMANDS)
+
+        def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+            target = _SUBCOMMANDS.get(cmd_name)
+            if target is None:
+                return None
+            module_name, attr = target
+            command: click.Command = getattr(importlib.import_module(module_name), attr)
+            return command
+
+    @click.group(cls=LazyGroup)
+    def cli_group():
+        """Paint by Numbers Generator CLI tools."""
+        pass
+
+    return cli_group
+
+
+if CLICK_AVAILABLE:
+    cli_group = _build_cli()
+else:
+    cli_group = _missing_click
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``main``, ``init_config`` and the explorer commands lazily."""
+    target = _LAZY_ATTRIBUTES.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
     if not CLICK_AVAILABLE:
-        click.echo("Error: Click is required. Install with: pip install click")
-        sys.exit(1)
+        return _missing_click
+    module_name, attr = target
+    return getattr(importlib.import_module(module_name), attr)
+
 
+def _cached_help_text() -> Optional[str]:
+    """Read the pre-rendered generate help, or None if it is not shipped."""
+    from importlib.resources import files
     try:
-        from paintbynumbers.explorer import ExplorerConfig, get_preset
+        return files(__package__).joinpath(_HELP_RESOURCE).read_text(encoding='utf-8')
+    except OSError:
+        return None
 
-        if preset:
-            config = get_preset(preset)
-            click.echo(f"Using preset: {preset}")
-        else:
-            config = ExplorerConfig()
 
-        config.to_json(output)
-        click.echo(f"✓ Explorer configuration file created: {output}")
-        click.echo(f"\nStrategy: {config.strategy.value}")
-        click.echo(f"Total variations: {config.get_total_combinations()}")
-        click.echo("\nEdit this file to customize exploration settings, then use it with:")
-        click.echo(f"  paintbynumbers explore input.jpg --config {output}")
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+def run(prog_name: Optional[str] = None) -> None:
+    """Console entry point for ``paintbynumbers`` (the ``generate`` command).
 
+    A bare invocation or a lone ``-h``/``--help`` prints the pre-rendered help
+    shipped as ``_help.txt`` and exits without importing or building the Click
+    command. Anything else is handed to ``generate``.
 
-cli_group.add_command(main, 'generate')
-cli_group.add_command(init_config, 'init-config')
-cli_group.add_command(explore, 'explore')
-cli_group.add_command(init_explorer_config, 'init-explorer-config')
+    Args:
+        prog_name: Program name shown in the usage line (defaults to the
+            name the script was invoked as)
+    """
+    args = sys.argv[1:]
+    if CLICK_AVAILABLE and args in ([], ['-h'], ['--help']):
+        help_text = _cached_help_text()
+        if help_text is not None:
+            prog = prog_name or os.path.basename(sys.argv[0]) or 'paintbynumbers'
+            sys.stdout.write(help_text.replace('{prog}', prog))
+            sys.exit(0)
+    __getattr__('main')(prog_name=prog_name)
 
 
 if __name__ == '__main__':
-    main()
+    run(prog_name='python -m paintbynumbers.cli.main')
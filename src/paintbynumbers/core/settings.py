@@ -42,6 +42,7 @@ class Settings:
     kMeansMinDeltaDifference: float = 1.0
     kMeansClusteringColorSpace: ClusteringColorSpace = ClusteringColorSpace.RGB
     kMeansColorRestrictions: Optional[List[Tuple[int, int, int]]] = None
+    kMeansThreads: int = 1  # Threads for the k-means assignment step
 
     # Color aliases (for restricted colors)
     colorAliases: Dict[str, str] = field(default_factory=dict)
@@ -122,6 +123,7 @@ class Settings:
             "kMeansMinDeltaDifference": self.kMeansMinDeltaDifference,
             "kMeansClusteringColorSpace": self.kMeansClusteringColorSpace.value,
             "kMeansColorRestrictions": self.kMeansColorRestrictions,
+            "kMeansThreads": self.kMeansThreads,
             "colorAliases": self.colorAliases,
             "randomSeed": self.randomSeed,
             "removeFacetsSmallerThanNrOfPoints": self.removeFacetsSmallerThanNrOfPoints,
@@ -1,7 +1,8 @@
 """Core type definitions."""
 
 from __future__ import annotations
-from typing import TypeVar, Dict, Tuple
+from typing import TypeVar, Dict, Tuple, Any
+from dataclasses import FrozenInstanceError
 from enum import IntEnum
 from paintbynumbers.structs.point import Point
 
@@ -37,6 +38,8 @@ class PathPoint(Point):
         orientation: Which wall border this point represents
     """
 
+    __slots__ = ('orientation',)
+
     def __init__(self, x: int, y: int, orientation: OrientationEnum) -> None:
         """Initialize a PathPoint.
 
@@ -48,6 +51,18 @@ class PathPoint(Point):
         super().__init__(x, y)
         self.orientation = orientation
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Only the coordinates are frozen. object.__setattr__ rather than
+        # Point's generated one: slots=True rebuilds Point, so that method
+        # rejects instances of subclasses
+        if name != 'orientation':
+            raise FrozenInstanceError(f"cannot assign to field {name!r}")
+        object.__setattr__(self, name, value)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Point's slots pickling only carries the dataclass fields
+        return (type(self), (self.x, self.y, self.orientation))
+
     @classmethod
     def from_point(cls, pt: Point, orientation: OrientationEnum) -> PathPoint:
         """Create PathPoint from existing Point.
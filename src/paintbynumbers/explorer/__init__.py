@@ -1,10 +1,25 @@
-"""Paint-by-Numbers parameter exploration tool."""
+"""Paint-by-Numbers parameter exploration tool.
 
-from .config import ExplorerConfig, ExplorationStrategy, get_preset, PRESETS
-from .engine import ExplorationEngine, VariationResult
-from .metrics import MetricsCollector, VariationMetrics
-from .report import HTMLReportGenerator
-from .variations import VariationGenerator
+Only the configuration objects are imported eagerly. The engine, metrics,
+report and variation modules pull in the whole processing pipeline, so they
+are imported on first attribute access.
+"""
+
+import importlib
+from typing import Any, Dict, List
+
+from .config import ExplorerConfig, ExplorationStrategy, get_preset
+
+# Public name -> submodule that defines it
+_LAZY: Dict[str, str] = {
+    "ExplorationEngine": ".engine",
+    "VariationResult": ".engine",
+    "MetricsCollector": ".metrics",
+    "VariationMetrics": ".metrics",
+    "HTMLReportGenerator": ".report",
+    "VariationGenerator": ".variations",
+    "PRESETS": ".config",
+}
 
 __all__ = [
     "ExplorerConfig",
@@ -18,3 +33,17 @@ __all__ = [
     "get_preset",
     "PRESETS",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access and cache them."""
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __package__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return list(__all__)
@@ -0,0 +1,60 @@
+"""Process-pool initializer for exploration workers.
+
+Kept free of NumPy and pipeline imports: with the ``spawn`` start method the
+initializer runs before the worker unpickles its first task, so the thread
+limits below are in place before NumPy loads its BLAS library.
+"""
+
+import importlib
+import os
+from typing import Any, Optional, Tuple
+
+try:
+    from threadpoolctl import threadpool_limits
+    THREADPOOLCTL_AVAILABLE = True
+except ImportError:
+    THREADPOOLCTL_AVAILABLE = False
+
+# Environment variables read by the common BLAS/OpenMP runtimes at load time
+BLAS_THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+
+def init_worker(
+    blas_threads: int,
+    setup: Optional[str] = None,
+    setup_args: Tuple[Any, ...] = (),
+) -> None:
+    """Set up an exploration worker process.
+
+    Limits BLAS/OpenMP threads, then runs the optional ``setup`` hook, whose
+    module is imported once per worker instead of on the first task.
+    Without a limit every worker starts one BLAS thread per core, so N
+    workers on N cores oversubscribe the machine N times over.
+
+    Args:
+        blas_threads: Threads each worker's BLAS/OpenMP runtime may use
+        setup: ``"package.module:function"`` to call once the limits are
+            set. Given by name so its module is only imported afterwards.
+        setup_args: Arguments for the ``setup`` function
+
+    Note:
+        Variables already present in the environment are respected. With
+        the ``fork`` start method NumPy is already loaded, so the limit is
+        applied through threadpoolctl when it is installed.
+    """
+    value = str(blas_threads)
+    for var in BLAS_THREAD_ENV_VARS:
+        os.environ.setdefault(var, value)
+
+    if THREADPOOLCTL_AVAILABLE:
+        threadpool_limits(limits=blas_threads)
+
+    if setup is not None:
+        module_name, func_name = setup.split(":")
+        getattr(importlib.import_module(module_name), func_name)(*setup_args)
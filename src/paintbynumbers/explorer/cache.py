@@ -0,0 +1,99 @@
+"""On-disk cache of variation results for the exploration engine.
+
+Each entry stores the metrics and SVG of one variation, keyed by a hash of
+its parameters together with the input image's path, size and modification
+time. Re-running an exploration on an unchanged image then skips the
+pipeline for every variation that was already processed, including the
+baseline that star explorations share between configurations.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from .. import __version__
+from ..utils.jsonio import read_json, write_json
+
+if TYPE_CHECKING:
+    from .metrics import VariationMetrics
+
+CACHE_DIR_NAME = ".explorer_cache"
+
+
+class ResultCache:
+    """Variation results cached under a directory, one subdirectory per key.
+
+    Instances are small and picklable, so they can be passed to worker
+    processes. Unpickling one does not import NumPy (``metrics`` is imported
+    on first use), so it can travel in the worker initializer's arguments.
+    Keys are computed by the caller with ``key()`` and are stable across
+    runs and processes.
+    """
+
+    def __init__(self, cache_dir: Path, input_image: Path):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache entries (created on demand)
+            input_image: Image the cached variations were generated from
+        """
+        self.cache_dir = Path(cache_dir)
+        image = Path(input_image).resolve()
+        stat = image.stat()
+        # Any change to the source image invalidates every entry
+        self._image_key = f"{image}|{stat.st_size}|{stat.st_mtime_ns}|{__version__}"
+
+    def key(self, variation: Dict[str, Any]) -> str:
+        """Return the cache key of a variation.
+
+        Args:
+            variation: Parameter dictionary
+
+        Returns:
+            32-character hex digest
+        """
+        # Stdlib json keeps keys identical whether or not orjson is installed
+        params = json.dumps(variation, sort_keys=True, default=str)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self._image_key.encode("utf-8"))
+        digest.update(params.encode("utf-8"))
+        return digest.hexdigest()
+
+    def load(self, key: str) -> Optional[Tuple["VariationMetrics", str]]:
+        """Look up a cached result.
+
+        Args:
+            key: Key from ``key()``
+
+        Returns:
+            Tuple of (metrics, svg_content), or None on a miss. The metrics
+            are those stored, so ``processing_time`` is the time of the run
+            that produced the entry.
+        """
+        from .metrics import VariationMetrics
+
+        entry = self.cache_dir / key
+        try:
+            metrics = VariationMetrics(**read_json(entry / "metrics.json"))
+            svg_content = (entry / "output.svg").read_text()
+        except (OSError, ValueError, TypeError):
+            # Missing, partially written or outdated entry
+            return None
+        return metrics, svg_content
+
+    def store(self, key: str, metrics: "VariationMetrics", svg_content: str) -> None:
+        """Store a result.
+
+        The metrics file is written last; ``load()`` treats an entry
+        without it as a miss, so an interrupted store is never read back.
+
+        Args:
+            key: Key from ``key()``
+            metrics: Metrics of the variation
+            svg_content: SVG produced by the pipeline
+        """
+        entry = self.cache_dir / key
+        entry.mkdir(parents=True, exist_ok=True)
+        (entry / "output.svg").write_text(svg_content)
+        write_json(metrics.to_dict(), entry / "metrics.json", indent=False)
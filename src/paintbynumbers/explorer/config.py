@@ -1,10 +1,15 @@
 """Configuration for the parameter exploration tool."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+import math
+import os
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 from pathlib import Path
-import json
+
+from ..core.settings import Settings
+from ..utils.jsonio import read_json, write_json
 
 
 class ExplorationStrategy(str, Enum):
@@ -12,36 +17,60 @@ class ExplorationStrategy(str, Enum):
     GRID = "grid"  # Test all combinations (exhaustive)
     STAR = "star"  # Vary one parameter at a time from baseline
     RANDOM = "random"  # Random sampling when grid would be too large
+    LATIN_HYPERCUBE = "latin_hypercube"  # Random sampling spread evenly over each parameter
+
+
+# Canonical defaults, copied into each new ExplorerConfig. Read-only so the
+# shared values cannot be modified through an instance; vary values are
+# tuples and become fresh lists per instance.
+_DEFAULT_BASELINE: Mapping[str, Any] = MappingProxyType({
+    "kMeansNrOfClusters": 16,
+    "kMeansMinDeltaDifference": 1.0,
+    "kMeansClusteringColorSpace": "RGB",
+    "removeFacetsSmallerThanNrOfPoints": 20,
+    "removeFacetsFromLargeToSmall": True,
+    "narrowPixelStripCleanupRuns": 3,
+    "nrOfTimesToHalveBorderSegments": 2,
+    "resizeImageWidth": 1024,
+    "resizeImageHeight": 1024,
+})
+
+_DEFAULT_VARY: Mapping[str, Tuple[Any, ...]] = MappingProxyType({
+    "kMeansNrOfClusters": (8, 16, 24),
+    "kMeansClusteringColorSpace": ("RGB", "LAB", "HSL"),
+})
 
+# Parameter names accepted in baseline/vary/fixed (each variation becomes
+# ``Settings(**params)``)
+_SETTINGS_FIELDS = frozenset(f.name for f in fields(Settings))
 
-@dataclass
+# Fields that determine the number of combinations; rebinding any of them
+# invalidates the cached total.
+_COMBINATION_FIELDS = frozenset({"strategy", "vary", "random_samples"})
+
+
+@dataclass(slots=True)
 class ExplorerConfig:
-    """Configuration for parameter exploration."""
+    """Configuration for parameter exploration.
+
+    The combination count is cached. It is recomputed when ``strategy``,
+    ``vary`` or ``random_samples`` is reassigned, but not when the ``vary``
+    dict is mutated in place; assign a new dict instead.
+    """
 
     # Exploration strategy
     strategy: ExplorationStrategy = ExplorationStrategy.STAR
 
-    # For random strategy: number of samples to generate
+    # For random and latin_hypercube strategies: number of samples to generate
     random_samples: int = 20
 
     # Baseline configuration (starting point for star exploration)
-    baseline: Dict[str, Any] = field(default_factory=lambda: {
-        "kMeansNrOfClusters": 16,
-        "kMeansMinDeltaDifference": 1.0,
-        "kMeansClusteringColorSpace": "RGB",
-        "removeFacetsSmallerThanNrOfPoints": 20,
-        "removeFacetsFromLargeToSmall": True,
-        "narrowPixelStripCleanupRuns": 3,
-        "nrOfTimesToHalveBorderSegments": 2,
-        "resizeImageWidth": 1024,
-        "resizeImageHeight": 1024,
-    })
+    baseline: Dict[str, Any] = field(default_factory=lambda: dict(_DEFAULT_BASELINE))
 
     # Parameters to vary with their possible values
-    vary: Dict[str, List[Any]] = field(default_factory=lambda: {
-        "kMeansNrOfClusters": [8, 16, 24],
-        "kMeansClusteringColorSpace": ["RGB", "LAB", "HSL"],
-    })
+    vary: Dict[str, List[Any]] = field(
+        default_factory=lambda: {name: list(values) for name, values in _DEFAULT_VARY.items()}
+    )
 
     # Fixed parameters (won't be varied)
     fixed: Dict[str, Any] = field(default_factory=dict)
@@ -50,16 +79,21 @@ class ExplorerConfig:
     output_dir: Optional[Path] = None
     save_intermediate: bool = True  # Save each variation's output
     parallel_processing: bool = True
-    max_workers: Optional[int] = None  # None = use CPU count
+    max_workers: Optional[int] = None  # None = CPU count minus one, -n = CPU count + 1 - n
+    worker_blas_threads: int = 1  # BLAS/OpenMP threads per worker process
+    use_cache: bool = False  # Reuse results of identical earlier variations
+    capture_traceback: bool = False  # Keep full tracebacks of failed variations
 
     # Warnings
     warn_threshold: int = 50  # Warn if combinations exceed this
 
+    # Cached combination count (see total_combinations)
+    _total: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
     @classmethod
     def from_json(cls, json_path: Union[str, Path]) -> "ExplorerConfig":
         """Load configuration from JSON file."""
-        with open(json_path, 'r') as f:
-            data = json.load(f)
+        data = read_json(json_path)
 
         # Convert strategy string to enum
         if "strategy" in data:
@@ -83,32 +117,82 @@ class ExplorerConfig:
             "save_intermediate": self.save_intermediate,
             "parallel_processing": self.parallel_processing,
             "max_workers": self.max_workers,
+            "worker_blas_threads": self.worker_blas_threads,
+            "use_cache": self.use_cache,
+            "capture_traceback": self.capture_traceback,
             "warn_threshold": self.warn_threshold,
         }
 
-        with open(json_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        write_json(data, json_path)
+
+    def __post_init__(self) -> None:
+        """Reject parameter names that are not Settings fields or both varied and fixed.
+
+        Checked once here rather than failing every variation later.
+
+        Raises:
+            ValueError: If baseline, vary or fixed names an unknown parameter,
+                or a parameter is in both vary and fixed
+        """
+        unknown = (set(self.baseline) | set(self.vary) | set(self.fixed)) - _SETTINGS_FIELDS
+        if unknown:
+            raise ValueError(
+                f"Unknown Settings parameter(s) in explorer config: {', '.join(sorted(unknown))}"
+            )
+        overlap = self.vary.keys() & self.fixed.keys()
+        if overlap:
+            raise ValueError(
+                f"Parameter(s) both varied and fixed in explorer config: {', '.join(sorted(overlap))}"
+            )
+
+    @property
+    def effective_max_workers(self) -> int:
+        """Number of worker processes to use for parallel processing.
+
+        ``max_workers`` when positive, otherwise one less than the CPU count
+        so the coordinating process keeps a core to itself. A negative value
+        counts back from the CPU count, as joblib's ``n_jobs`` does: -1 uses
+        every CPU, -2 all but one, and so on (at least one worker).
+        """
+        if self.max_workers and self.max_workers > 0:
+            return self.max_workers
+        cpu_count = os.cpu_count() or 2
+        if self.max_workers and self.max_workers < 0:
+            return max(1, cpu_count + 1 + self.max_workers)
+        return max(1, cpu_count - 1)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # object.__setattr__ rather than super(): slots=True rebuilds the
+        # class, which breaks the zero-argument super() cell
+        if name in _COMBINATION_FIELDS:
+            object.__setattr__(self, "_total", None)
+        object.__setattr__(self, name, value)
+
+    @property
+    def total_combinations(self) -> int:
+        """Total number of combinations for the current strategy (cached)."""
+        if self._total is None:
+            if self.strategy in (ExplorationStrategy.RANDOM, ExplorationStrategy.LATIN_HYPERCUBE):
+                total = self.random_samples
+            elif self.strategy == ExplorationStrategy.STAR:
+                # One baseline + one variation per value per parameter
+                # (-1 per parameter because the baseline is already counted)
+                total = 1 + sum(len(param_values) - 1 for param_values in self.vary.values())
+            else:  # GRID
+                total = math.prod(len(param_values) for param_values in self.vary.values())
+            self._total = total
+        return self._total
 
     def get_total_combinations(self) -> int:
         """Calculate total number of combinations based on strategy."""
-        if self.strategy == ExplorationStrategy.RANDOM:
-            return self.random_samples
-        elif self.strategy == ExplorationStrategy.STAR:
-            # One baseline + one variation per value per parameter
-            total = 1  # baseline
-            for param_values in self.vary.values():
-                total += len(param_values) - 1  # -1 because baseline already counted
-            return total
-        else:  # GRID
-            total = 1
-            for param_values in self.vary.values():
-                total *= len(param_values)
-            return total
-
-
-# Preset configurations for common use cases
-PRESETS = {
-    "quick_test": ExplorerConfig(
+        return self.total_combinations
+
+
+# Preset configurations for common use cases. Each preset is built on demand
+# so that importing this module does not construct all of them; the
+# ``PRESETS`` mapping is still available through the module ``__getattr__``.
+def _build_quick_test() -> ExplorerConfig:
+    return ExplorerConfig(
         strategy=ExplorationStrategy.STAR,
         baseline={
             "kMeansNrOfClusters": 16,
@@ -119,9 +203,11 @@ PRESETS = {
             "kMeansNrOfClusters": [8, 16, 24],
             "removeFacetsSmallerThanNrOfPoints": [10, 20],
         },
-    ),
+    )
+
 
-    "detailed_photos": ExplorerConfig(
+def _build_detailed_photos() -> ExplorerConfig:
+    return ExplorerConfig(
         strategy=ExplorationStrategy.GRID,
         baseline={
             "kMeansNrOfClusters": 24,
@@ -133,9 +219,11 @@ PRESETS = {
             "kMeansClusteringColorSpace": ["LAB"],
             "removeFacetsSmallerThanNrOfPoints": [20, 30, 40],
         },
-    ),
+    )
 
-    "simple_illustrations": ExplorerConfig(
+
+def _build_simple_illustrations() -> ExplorerConfig:
+    return ExplorerConfig(
         strategy=ExplorationStrategy.GRID,
         baseline={
             "kMeansNrOfClusters": 8,
@@ -146,9 +234,11 @@ PRESETS = {
             "kMeansNrOfClusters": [6, 8, 12],
             "removeFacetsSmallerThanNrOfPoints": [50, 100],
         },
-    ),
+    )
+
 
-    "color_space_comparison": ExplorerConfig(
+def _build_color_space_comparison() -> ExplorerConfig:
+    return ExplorerConfig(
         strategy=ExplorationStrategy.STAR,
         baseline={
             "kMeansNrOfClusters": 16,
@@ -157,9 +247,11 @@ PRESETS = {
         vary={
             "kMeansClusteringColorSpace": ["RGB", "LAB", "HSL"],
         },
-    ),
+    )
+
 
-    "cluster_exploration": ExplorerConfig(
+def _build_cluster_exploration() -> ExplorerConfig:
+    return ExplorerConfig(
         strategy=ExplorationStrategy.STAR,
         baseline={
             "kMeansNrOfClusters": 16,
@@ -167,13 +259,38 @@ PRESETS = {
         vary={
             "kMeansNrOfClusters": [4, 8, 12, 16, 20, 24, 32],
         },
-    ),
+    )
+
+
+_PRESET_BUILDERS: Dict[str, Callable[[], ExplorerConfig]] = {
+    "quick_test": _build_quick_test,
+    "detailed_photos": _build_detailed_photos,
+    "simple_illustrations": _build_simple_illustrations,
+    "color_space_comparison": _build_color_space_comparison,
+    "cluster_exploration": _build_cluster_exploration,
 }
 
+_PRESET_NAMES = tuple(_PRESET_BUILDERS)
+
+
+def __getattr__(name: str) -> Any:
+    """Build ``PRESETS`` (a dict of every preset) on first access.
+
+    The dict is then cached in the module globals, so later accesses (and
+    ``paintbynumbers.explorer.PRESETS``) return the same object.
+    """
+    if name == "PRESETS":
+        presets = {preset: build() for preset, build in _PRESET_BUILDERS.items()}
+        globals()["PRESETS"] = presets
+        return presets
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def get_preset(name: str) -> ExplorerConfig:
-    """Get a preset configuration by name."""
-    if name not in PRESETS:
-        available = ", ".join(PRESETS.keys())
-        raise ValueError(f"Unknown preset '{name}'. Available: {available}")
-    return PRESETS[name]
+    """Get a preset configuration by name.
+
+    Each call returns a new ``ExplorerConfig``, so callers may modify it.
+    """
+    if name not in _PRESET_BUILDERS:
+        raise ValueError(f"Unknown preset '{name}'. Available: {', '.join(_PRESET_NAMES)}")
+    return _PRESET_BUILDERS[name]()
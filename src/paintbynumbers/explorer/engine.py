@@ -1,23 +1,43 @@
 """Main exploration engine for parameter testing."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-import json
+from functools import cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import queue
+import threading
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from multiprocessing import cpu_count
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 import traceback
 
 from ..core.pipeline import PaintByNumbersPipeline
-from ..core.settings import Settings
+from ..core.settings import OutputProfile, Settings
+from ..utils.jsonio import write_json, write_json_streamed
 from .config import ExplorerConfig
+from ._worker_init import init_worker
+from .cache import CACHE_DIR_NAME, ResultCache
 from .variations import VariationGenerator
 from .metrics import MetricsCollector, VariationMetrics
 
 
-@dataclass
+# Every variation renders the same SVG profile; the pipeline only reads it,
+# so one instance per process is shared by all variations
+_OUTPUT_PROFILE = OutputProfile(
+    name="explorer_output",
+    filetype="svg",
+    svgShowLabels=True,
+    svgShowBorders=True,
+    svgFillFacets=True,
+)
+
+# Shared output_paths of variations that saved nothing. Result consumers
+# only read output_paths, so one empty dict serves every such result.
+_EMPTY_PATHS: Dict[str, Path] = {}
+
+
+@dataclass(slots=True)
 class VariationResult:
     """Result of processing a single variation."""
 
@@ -25,13 +45,19 @@ class VariationResult:
     variation_index: int
     parameters: Dict[str, Any]
     metrics: VariationMetrics
-    output_paths: Dict[str, Path]  # svg, png, etc.
+    output_paths: Dict[str, Path]  # svg, png, etc. (read-only, may be shared)
     error: Optional[str] = None
     success: bool = True
+    traceback: Optional[str] = None  # Only with config.capture_traceback
+    metrics_dict: Optional[Dict[str, Any]] = None  # metrics.to_dict(), computed once
 
 
 class ExplorationEngine:
-    """Engine for running parameter exploration."""
+    """Engine for running parameter exploration.
+
+    Parallel runs keep a process pool alive between ``run()`` calls; call
+    ``close()`` (or use the engine as a context manager) when done.
+    """
 
     def __init__(
         self,
@@ -65,6 +91,21 @@ class ExplorationEngine:
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Set by run(): where variation outputs go, or None to save nothing
+        self._variations_root: Optional[Path] = None
+
+        # Worker pool for parallel runs (created on first use, see close())
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_key: Optional[tuple] = None
+
+        # Results of earlier runs on the same image (shared by all runs
+        # under the same parent directory)
+        self.cache: Optional[ResultCache] = None
+        if config.use_cache:
+            self.cache = ResultCache(
+                self.output_dir.parent / CACHE_DIR_NAME, self.input_image
+            )
+
         # Variation generator
         self.variation_generator = VariationGenerator(config)
         self.variations = self.variation_generator.generate_variations()
@@ -88,6 +129,13 @@ class ExplorationEngine:
         # Save exploration configuration
         self._save_exploration_config()
 
+        # Parent of the per-variation folders, created once here so each
+        # variation only has to create its own folder
+        self._variations_root = None
+        if self.config.save_intermediate:
+            self._variations_root = self.output_dir / "variations"
+            self._variations_root.mkdir(exist_ok=True)
+
         # Generate all variations
         print(f"Generating {len(self.variations)} variations...")
         print(f"Strategy: {self.config.strategy.value}")
@@ -121,90 +169,148 @@ class ExplorationEngine:
         """Process variations sequentially."""
         results = []
 
-        for i, variation in enumerate(self.variations, 1):
-            if self.progress_callback:
-                self.progress_callback(i, len(self.variations), f"Processing variation {i}")
+        with _OutputWriter() as writer:
+            for i, variation in enumerate(self.variations, 1):
+                if self.progress_callback:
+                    self.progress_callback(i, len(self.variations), f"Processing variation {i}")
 
-            print(f"\n[{i}/{len(self.variations)}] Processing variation...")
-            result = self._process_single_variation(variation, i)
-            results.append(result)
+                print(f"\n[{i}/{len(self.variations)}] Processing variation...")
+                result = self._process_single_variation(variation, i, writer)
+                results.append(result)
 
-            if result.success:
-                print(f"  ✓ Success ({result.metrics.processing_time:.2f}s)")
-            else:
-                print(f"  ✗ Failed: {result.error}")
+                if result.success:
+                    print(f"  ✓ Success ({result.metrics.processing_time:.2f}s)")
+                else:
+                    print(f"  ✗ Failed: {result.error}")
+                    if result.traceback:
+                        print(result.traceback)
 
-        return results
+        # Variations whose files could not be written fail after the fact
+        return writer.check_results(results)
+
+    def _get_executor(self, max_workers: int) -> ProcessPoolExecutor:
+        """Return the engine's worker pool, creating it on first use.
+
+        The pool is kept across ``run()`` calls so repeated runs do not pay
+        for process start-up again; it is replaced only when the worker
+        settings changed in between. Release it with ``close()``.
+        """
+        # Constant for every task of a run, so handed to the workers once
+        # by the initializer instead of being pickled with each batch
+        context = (
+            self.input_image,
+            self._variations_root,
+            self.cache,
+            self.config.capture_traceback,
+        )
+        pool_key = (max_workers, self.config.worker_blas_threads, context)
+
+        if self._executor is not None and self._executor_key != pool_key:
+            self.close()
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=init_worker,
+                # Named rather than passed as a function, so this module
+                # (and the pipeline) is imported after the thread limits
+                initargs=(
+                    self.config.worker_blas_threads,
+                    f"{__name__}:_set_worker_context",
+                    context,
+                ),
+            )
+            self._executor_key = pool_key
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> "ExplorationEngine":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def _process_parallel(self) -> List[VariationResult]:
         """Process variations in parallel."""
-        max_workers = self.config.max_workers or cpu_count()
+        max_workers = self.config.effective_max_workers
         print(f"Using {max_workers} parallel workers...")
 
-        results = []
-        completed = 0
-
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_idx = {
-                executor.submit(
-                    _process_variation_worker,
-                    variation,
-                    i,
-                    self.input_image,
-                    self.output_dir,
-                    self.variation_generator,
-                    self.config.save_intermediate,
-                ): i
-                for i, variation in enumerate(self.variations, 1)
-            }
+        total = len(self.variations)
+        executor = self._get_executor(max_workers)
+
+        # One task per batch of variations: one pickle round-trip per batch,
+        # and ~4 batches per worker still balances uneven
+        # variation run times
+        n_batches = min(total, 4 * max_workers)
+        indices = list(range(1, total + 1))
+        batches = [indices[i::n_batches] for i in range(n_batches)]
+
+        results: List[VariationResult] = []
+        futures = {
+            executor.submit(
+                _process_variation_batch_worker,
+                [self.variations[idx - 1] for idx in batch],
+                batch,
+                [
+                    self.variation_generator.get_variation_label(
+                        self.variations[idx - 1], idx
+                    )
+                    for idx in batch
+                ],
+            ): batch
+            for batch in batches
+        }
 
-            # Collect results as they complete
-            for future in as_completed(future_to_idx):
-                idx = future_to_idx[future]
-                completed += 1
-
-                try:
-                    result = future.result()
-                    results.append(result)
-
-                    if self.progress_callback:
-                        self.progress_callback(
-                            completed,
-                            len(self.variations),
-                            f"Completed variation {idx}",
-                        )
-
-                    status = "✓" if result.success else "✗"
-                    print(f"[{completed}/{len(self.variations)}] {status} Variation {idx}")
-
-                except Exception as e:
-                    print(f"[{completed}/{len(self.variations)}] ✗ Variation {idx} - Exception: {e}")
-                    # Create error result
-                    error_result = VariationResult(
+        for future in as_completed(futures):
+            try:
+                batch_results = future.result()
+            except Exception as e:
+                # The worker catches its own errors, so this is the pool
+                # itself failing (e.g. a crashed worker); it cannot be reused.
+                if isinstance(e, BrokenProcessPool):
+                    self._executor = None
+                batch_results = [
+                    VariationResult(
                         variation_id=f"var_{idx:03d}",
                         variation_index=idx,
                         parameters=self.variations[idx - 1],
                         metrics=None,
-                        output_paths={},
+                        output_paths=_EMPTY_PATHS,
                         error=str(e),
                         success=False,
                     )
-                    results.append(error_result)
+                    for idx in futures[future]
+                ]
+
+            for result in batch_results:
+                results.append(result)
+                completed = len(results)
+
+                if self.progress_callback:
+                    self.progress_callback(
+                        completed, total, f"Completed variation {result.variation_index}"
+                    )
+
+                status = "✓" if result.success else "✗"
+                print(f"[{completed}/{total}] {status} Variation {result.variation_index}")
 
         # Sort results by index to maintain order
         results.sort(key=lambda r: r.variation_index)
-
         return results
 
     def _process_single_variation(
-        self, variation: Dict[str, Any], index: int
+        self, variation: Dict[str, Any], index: int, writer: "_OutputWriter"
     ) -> VariationResult:
         """Process a single variation.
 
         Args:
             variation: Parameter dictionary
             index: Variation index (1-based)
+            writer: Background writer that saves the output files
 
         Returns:
             VariationResult
@@ -212,75 +318,26 @@ class ExplorationEngine:
         variation_id = self.variation_generator.get_variation_label(variation, index)
 
         try:
-            # Create variation directory
-            if self.config.save_intermediate:
-                var_dir = self.output_dir / "variations" / variation_id
-                var_dir.mkdir(parents=True, exist_ok=True)
-            else:
-                var_dir = None
-
-            # Create settings from variation parameters
-            settings = Settings(**variation)
-
-            # Add output profile for SVG (minimal for speed)
-            from ..core.settings import OutputProfile
-            settings.outputProfiles = [
-                OutputProfile(
-                    name="explorer_output",
-                    filetype="svg",
-                    svgShowLabels=True,
-                    svgShowBorders=True,
-                    svgFillFacets=True,
-                )
-            ]
-
-            # Process with pipeline
-            start_time = time.time()
-            result = PaintByNumbersPipeline.process(
-                str(self.input_image),
-                settings,
-                progress_callback=None
-            )
-            processing_time = time.time() - start_time
-
-            # Collect metrics
-            img_width = result.width
-            img_height = result.height
-
-            metrics = MetricsCollector.collect_metrics(
-                result.facet_result,
-                result.colors_by_index,
-                processing_time,
-                img_width,
-                img_height,
+            metrics, svg_content = _run_variation(
+                variation, self.input_image, self.cache, writer
             )
+            metrics_dict = metrics.to_dict()
 
             # Save outputs if requested
-            output_paths = {}
-            if var_dir:
-                # Save SVG
-                svg_path = var_dir / "output.svg"
-                with open(svg_path, 'w') as f:
-                    f.write(result.svg_content)
-                output_paths['svg'] = svg_path
-
-                # Save PNG preview (small)
-                png_path = var_dir / "preview.png"
-                self._save_png_preview(result.svg_content, png_path)
-                output_paths['png'] = png_path
-
-                # Save metadata
-                metadata_path = var_dir / "metadata.json"
-                self._save_metadata(
-                    metadata_path, variation, metrics, variation_id
+            output_paths = _EMPTY_PATHS
+            if self._variations_root is not None:
+                var_dir = self._variations_root / variation_id
+                var_dir.mkdir(exist_ok=True)
+                output_paths = _queue_variation_outputs(
+                    writer, var_dir, svg_content, variation, metrics_dict, variation_id
                 )
-                output_paths['metadata'] = metadata_path
 
             return VariationResult(
                 variation_id=variation_id,
                 variation_index=index,
                 parameters=variation,
                 metrics=metrics,
+                metrics_dict=metrics_dict,
                 output_paths=output_paths,
                 success=True,
             )
@@ -291,9 +348,10 @@ class ExplorationEngine:
                 variation_index=index,
                 parameters=variation,
                 metrics=None,
-                output_paths={},
-                error=f"{type(e).__name__}: {str(e)}\n{traceback.format_exc()}",
+                output_paths=_EMPTY_PATHS,
+                error=f"{type(e).__name__}: {str(e)}",
                 success=False,
+                traceback=traceback.format_exc() if self.config.capture_traceback else None,
             )
 
     def _save_exploration_config(self) -> None:
@@ -313,151 +371,108 @@ class ExplorationEngine:
             "failed": sum(1 for r in results if not r.success),
             "total_time": total_time,
             "timestamp": datetime.now().isoformat(),
-            "variations": [
-                {
-                    "id": r.variation_id,
-                    "index": r.variation_index,
-                    "success": r.success,
-                    "error": r.error,
-                    "parameters": r.parameters,
-                    "metrics": r.metrics.to_dict() if r.metrics else None,
-                }
-                for r in results
-            ],
         }
+        # Built lazily, so only one entry's dicts exist at a time
+        variations = (
+            {
+                "id": r.variation_id,
+                "index": r.variation_index,
+                "success": r.success,
+                "error": r.error,
+                "parameters": r.parameters,
+                "metrics": r.metrics_dict if r.metrics_dict is not None else (
+                    r.metrics.to_dict() if r.metrics else None
+                ),
+                # Only present when tracebacks were captured
+                **({"traceback": r.traceback} if r.traceback else {}),
+            }
+            for r in results
+        )
 
         summary_path = self.output_dir / "results_summary.json"
-        with open(summary_path, 'w') as f:
-            json.dump(summary, f, indent=2)
+        write_json_streamed(summary, "variations", variations, summary_path)
 
-    def _save_metadata(
-        self,
-        path: Path,
-        parameters: Dict[str, Any],
-        metrics: VariationMetrics,
-        variation_id: str,
-    ) -> None:
-        """Save variation metadata."""
-        metadata = {
-            "variation_id": variation_id,
-            "parameters": parameters,
-            "metrics": metrics.to_dict(),
-        }
 
-        with open(path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+# Settings shared by every task of a worker process, set by the pool
+# initializer: (input_image, variations_root, cache, capture_traceback)
+_WORKER_CONTEXT: Optional[Tuple[Path, Optional[Path], Optional[ResultCache], bool]] = None
 
-    def _save_png_preview(self, svg_content: str, output_path: Path) -> None:
-        """Save PNG preview from SVG."""
-        try:
-            import cairosvg
-            cairosvg.svg2png(
-                bytestring=svg_content.encode('utf-8'),
-                write_to=str(output_path),
-                output_width=400,  # Small preview
+
+def _set_worker_context(
+    input_image: Path,
+    variations_root: Optional[Path],
+    cache: Optional[ResultCache],
+    capture_traceback: bool,
+) -> None:
+    """Pool initializer hook storing the run's shared worker settings."""
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = (input_image, variations_root, cache, capture_traceback)
+
+
+# Worker functions for parallel processing (must be at module level)
+def _process_variation_batch_worker(
+    variations: List[Dict[str, Any]],
+    indices: List[int],
+    variation_ids: List[str],
+) -> List[VariationResult]:
+    """Worker function processing a batch of variations in one task."""
+    if _WORKER_CONTEXT is None:
+        raise RuntimeError("worker context not initialized")
+    input_image, variations_root, cache, capture_traceback = _WORKER_CONTEXT
+    # Leaving the block waits for the writes, so the batch's files exist
+    # (or their failures are known) before its results reach the parent
+    with _OutputWriter() as writer:
+        results = [
+            _process_variation_worker(
+                variation,
+                index,
+                variation_id,
+                input_image,
+                variations_root,
+                cache,
+                capture_traceback,
+                writer,
             )
-        except ImportError:
-            # cairosvg not available, skip PNG generation
-            pass
-        except Exception:
-            # Ignore errors in preview generation
-            pass
+            for variation, index, variation_id in zip(variations, indices, variation_ids, strict=True)
+        ]
+    return writer.check_results(results)
 
 
-# Worker function for parallel processing (must be at module level)
 def _process_variation_worker(
     variation: Dict[str, Any],
     index: int,
+    variation_id: str,
     input_image: Path,
-    output_dir: Path,
-    variation_generator: VariationGenerator,
-    save_intermediate: bool,
+    variations_root: Optional[Path],
+    cache: Optional[ResultCache],
+    capture_traceback: bool,
+    writer: "_OutputWriter",
 ) -> VariationResult:
-    """Worker function for parallel processing."""
-    variation_id = variation_generator.get_variation_label(variation, index)
+    """Worker function for parallel processing.
 
+    The variation label is computed by the parent, so the variation
+    generator does not have to be pickled with every task. Outputs are
+    saved under ``variations_root`` (which must exist) unless it is None.
+    """
     try:
-        # Create variation directory
-        if save_intermediate:
-            var_dir = output_dir / "variations" / variation_id
-            var_dir.mkdir(parents=True, exist_ok=True)
-        else:
-            var_dir = None
-
-        # Create settings from variation parameters
-        settings = Settings(**variation)
-
-        # Add output profile for SVG
-        from ..core.settings import OutputProfile
-        settings.outputProfiles = [
-            OutputProfile(
-                name="explorer_output",
-                filetype="svg",
-                svgShowLabels=True,
-                svgShowBorders=True,
-                svgFillFacets=True,
-            )
-        ]
-
-        # Process with pipeline
-        start_time = time.time()
-        result = PaintByNumbersPipeline.process(
-            str(input_image),
-            settings,
-            progress_callback=None
-        )
-        processing_time = time.time() - start_time
-
-        # Collect metrics
-        img_width = result.width
-        img_height = result.height
-
-        metrics = MetricsCollector.collect_metrics(
-            result.facet_result,
-            result.colors_by_index,
-            processing_time,
-            img_width,
-            img_height,
-        )
+        metrics, svg_content = _run_variation(variation, input_image, cache, writer)
+        metrics_dict = metrics.to_dict()
 
         # Save outputs if requested
-        output_paths = {}
-        if var_dir:
-            # Save SVG
-            svg_path = var_dir / "output.svg"
-            with open(svg_path, 'w') as f:
-                f.write(result.svg_content)
-            output_paths['svg'] = svg_path
-
-            # Save PNG preview
-            png_path = var_dir / "preview.png"
-            try:
-                import cairosvg
-                cairosvg.svg2png(
-                    bytestring=result.svg_content.encode('utf-8'),
-                    write_to=str(png_path),
-                    output_width=400,
-                )
-                output_paths['png'] = png_path
-            except:
-                pass
-
-            # Save metadata
-            metadata = {
-                "variation_id": variation_id,
-                "parameters": variation,
-                "metrics": metrics.to_dict(),
-            }
-            metadata_path = var_dir / "metadata.json"
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
-            output_paths['metadata'] = metadata_path
+        output_paths = _EMPTY_PATHS
+        if variations_root is not None:
+            var_dir = variations_root / variation_id
+            var_dir.mkdir(exist_ok=True)
+            output_paths = _queue_variation_outputs(
+                writer, var_dir, svg_content, variation, metrics_dict, variation_id
+            )
 
         return VariationResult(
             variation_id=variation_id,
             variation_index=index,
             parameters=variation,
             metrics=metrics,
+            metrics_dict=metrics_dict,
             output_paths=output_paths,
             success=True,
         )
@@ -468,7 +483,240 @@ def _process_variation_worker(
             variation_index=index,
             parameters=variation,
             metrics=None,
-            output_paths={},
+            output_paths=_EMPTY_PATHS,
             error=f"{type(e).__name__}: {str(e)}",
             success=False,
+            traceback=traceback.format_exc() if capture_traceback else None,
+        )
+
+
+def _run_variation(
+    variation: Dict[str, Any],
+    input_image: Path,
+    cache: Optional[ResultCache],
+    writer: "_OutputWriter",
+) -> Tuple[VariationMetrics, str]:
+    """Run the pipeline for one variation, or reuse its cached result.
+
+    Returns:
+        Tuple of (metrics, svg_content)
+    """
+    if cache is not None:
+        cache_key = cache.key(variation)
+        cached = cache.load(cache_key)
+        if cached is not None:
+            return cached
+
+    # Create settings from variation parameters
+    settings = Settings(**variation)
+
+    # Add output profile for SVG (minimal for speed)
+    settings.outputProfiles = [_OUTPUT_PROFILE]
+
+    # Process with pipeline
+    start_time = time.time()
+    result = PaintByNumbersPipeline.process(
+        str(input_image),
+        settings,
+        progress_callback=None
+    )
+    processing_time = time.time() - start_time
+
+    # Collect metrics
+    metrics = MetricsCollector.collect_metrics(
+        result.facet_result,
+        result.colors_by_index,
+        processing_time,
+        result.width,
+        result.height,
+    )
+
+    if cache is not None:
+        writer.submit(
+            cache.cache_dir / cache_key, cache.store, cache_key, metrics, result.svg_content
+        )
+
+    return metrics, result.svg_content
+
+
+class _OutputWriter:
+    """Write variation output files in the background.
+
+    Saving the SVG, PNG preview and metadata of one variation overlaps with
+    the pipeline run of the next. File writes go through a queue drained by
+    one writer thread; PNG rendering, which is CPU-bound and mostly spent in
+    cairo with the GIL released, runs on its own thread so it does not hold
+    up the cheap writes. Use as a context manager: leaving the block waits
+    until all queued work has finished. Failed writes are recorded per path;
+    pass the results through ``check_results()`` afterwards.
+    """
+
+    def __init__(self, max_pending: int = 8):
+        """Start the writer thread.
+
+        Args:
+            max_pending: Queued writes (and, separately, queued renders)
+                before new work blocks, which bounds the memory held by
+                not-yet-written SVG content
+        """
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(
+            target=self._drain, name="explorer-writer", daemon=True
         )
+        self._thread.start()
+
+        # Created on the first render, so runs without previews never start it
+        self._render_pool: Optional[ThreadPoolExecutor] = None
+        self._render_slots = threading.BoundedSemaphore(max_pending)
+
+        # Error message of each path that could not be written
+        self._failures: Dict[Path, str] = {}
+
+    def submit(self, path: Path, func: Callable[..., object], *args: Any) -> None:
+        """Queue ``func(*args)``, which writes ``path``."""
+        self._queue.put((path, func, args))
+
+    def render(self, path: Path, func: Callable[..., object], *args: Any) -> None:
+        """Run ``func(*args)``, which renders ``path``, on the render thread."""
+        if self._render_pool is None:
+            self._render_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="explorer-render"
+            )
+        self._render_slots.acquire()
+        future = self._render_pool.submit(func, *args)
+        future.add_done_callback(lambda f: self._render_done(path, f))
+
+    def close(self) -> None:
+        """Wait for all queued writes and renders, then stop the threads."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._render_pool is not None:
+            self._render_pool.shutdown(wait=True)
+            self._render_pool = None
+
+    def check_results(self, results: List[VariationResult]) -> List[VariationResult]:
+        """Apply the recorded write failures to results, after ``close()``.
+
+        A variation whose SVG or metadata could not be written is marked as
+        failed, as if the write had failed inline. A missing PNG preview is
+        only dropped from its output paths, since previews are optional.
+
+        Args:
+            results: Results whose output files were queued on this writer
+
+        Returns:
+            The results, with failed ones replaced
+        """
+        if not self._failures:
+            return results
+
+        checked = []
+        for result in results:
+            failed = {
+                kind: self._failures[path]
+                for kind, path in result.output_paths.items()
+                if path in self._failures
+            }
+            if failed:
+                output_paths = {
+                    kind: path for kind, path in result.output_paths.items() if kind not in failed
+                }
+                errors = [error for kind, error in failed.items() if kind != 'png']
+                if errors:
+                    result = replace(
+                        result,
+                        output_paths=output_paths,
+                        error="; ".join(errors),
+                        success=False,
+                    )
+                else:
+                    result = replace(result, output_paths=output_paths)
+            checked.append(result)
+        return checked
+
+    def __enter__(self) -> "_OutputWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _drain(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            path, func, args = item
+            try:
+                func(*args)
+            except Exception as e:
+                self._record_failure(path, e)
+
+    def _render_done(self, path: Path, future: "Future[object]") -> None:
+        self._render_slots.release()
+        error = future.exception()
+        if error is not None:
+            self._record_failure(path, error)
+
+    def _record_failure(self, path: Path, error: BaseException) -> None:
+        print(f"Warning: could not write {path}: {error}")
+        self._failures[path] = f"{type(error).__name__}: {str(error)}"
+
+
+def _queue_variation_outputs(
+    writer: _OutputWriter,
+    var_dir: Path,
+    svg_content: str,
+    parameters: Dict[str, Any],
+    metrics_dict: Dict[str, Any],
+    variation_id: str,
+) -> Dict[str, Path]:
+    """Queue a variation's output files on ``writer``.
+
+    Returns:
+        Paths of the files that will be written, keyed by kind
+    """
+    output_paths = {}
+
+    # Save SVG
+    svg_path = var_dir / "output.svg"
+    writer.submit(svg_path, svg_path.write_text, svg_content)
+    output_paths['svg'] = svg_path
+
+    # Save PNG preview (small)
+    if _png_previews_available():
+        png_path = var_dir / "preview.png"
+        writer.render(png_path, _save_png_preview, svg_content, png_path)
+        output_paths['png'] = png_path
+
+    # Save metadata
+    metadata = {
+        "variation_id": variation_id,
+        "parameters": parameters,
+        "metrics": metrics_dict,
+    }
+    metadata_path = var_dir / "metadata.json"
+    writer.submit(metadata_path, write_json, metadata, metadata_path, False)
+    output_paths['metadata'] = metadata_path
+
+    return output_paths
+
+
+@cache
+def _png_previews_available() -> bool:
+    """Check whether cairosvg can render PNG previews."""
+    try:
+        import cairosvg  # noqa: F401
+    except Exception:
+        # ImportError, or OSError when the cairo library itself is missing
+        return False
+    return True
+
+
+def _save_png_preview(svg_content: str, output_path: Path) -> None:
+    """Save PNG preview from SVG."""
+    import cairosvg
+    cairosvg.svg2png(
+        bytestring=svg_content.encode('utf-8'),
+        write_to=str(output_path),
+        output_width=400,  # Small preview
+    )
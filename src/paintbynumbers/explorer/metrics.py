@@ -1,12 +1,14 @@
 """Quality metrics for paint-by-numbers variations."""
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from functools import lru_cache
+from typing import List, Sequence, Tuple
 import numpy as np
+from numpy.typing import NDArray
 from ..processing.facetmanagement import FacetResult
 
 
-@dataclass
+@dataclass(slots=True)
 class VariationMetrics:
     """Quality metrics for a single variation."""
 
@@ -38,6 +40,9 @@ class VariationMetrics:
 
     def to_dict(self) -> dict:
         """Convert metrics to dictionary."""
+        # Spelled out on purpose: a dict display compiles to a single
+        # constant-keys build and is about twice as fast as generating
+        # the dict from fields() with getattr. Keep it in field order.
         return {
             "num_facets": self.num_facets,
             "num_colors": self.num_colors,
@@ -90,23 +95,33 @@ class MetricsCollector:
         num_facets = len(active_facets)
         num_colors = len(colors)
 
-        # Facet size statistics
-        facet_sizes = [facet.pointCount for facet in active_facets]
-        min_facet_size = min(facet_sizes) if facet_sizes else 0
-        max_facet_size = max(facet_sizes) if facet_sizes else 0
-        mean_facet_size = np.mean(facet_sizes) if facet_sizes else 0
-        median_facet_size = np.median(facet_sizes) if facet_sizes else 0
-
-        # Color diversity metrics
-        color_diversity = MetricsCollector._calculate_color_diversity(colors)
-        avg_saturation = MetricsCollector._calculate_avg_saturation(colors)
-        avg_lightness = MetricsCollector._calculate_avg_lightness(colors)
+        # Facet size statistics (one array, NumPy reductions)
+        facet_sizes = np.fromiter(
+            (facet.pointCount for facet in active_facets),
+            dtype=np.int64,
+            count=num_facets,
+        )
+        if num_facets:
+            min_facet_size = int(facet_sizes.min())
+            max_facet_size = int(facet_sizes.max())
+            mean_facet_size = float(facet_sizes.mean())
+            median_facet_size = float(np.median(facet_sizes))
+        else:
+            min_facet_size = max_facet_size = 0
+            mean_facet_size = median_facet_size = 0
+
+        # Color diversity metrics (order-independent, so keyed on the
+        # sorted palette; sweeps often repeat the same palette)
+        color_diversity, avg_saturation, avg_lightness = MetricsCollector._palette_metrics(
+            tuple(sorted(map(tuple, colors)))
+        )
 
         # Complexity metrics
-        total_border_points = sum(
-            len(facet.borderPath) if facet.borderPath else 0
-            for facet in active_facets
-        )
+        total_border_points = int(np.fromiter(
+            (len(facet.borderPath) if facet.borderPath else 0 for facet in active_facets),
+            dtype=np.int64,
+            count=num_facets,
+        ).sum())
         avg_border_complexity = (
             total_border_points / num_facets if num_facets > 0 else 0
         )
@@ -133,100 +148,104 @@ class MetricsCollector:
         )
 
     @staticmethod
-    def _calculate_color_diversity(colors: List[Tuple[int, int, int]]) -> float:
+    @lru_cache(maxsize=512)
+    def _palette_metrics(
+        palette: Tuple[Tuple[int, int, int], ...]
+    ) -> Tuple[float, float, float]:
+        """Calculate the color metrics of a palette.
+
+        Args:
+            palette: RGB colors (0-255) as a hashable tuple
+
+        Returns:
+            Tuple of (color_diversity, avg_saturation, avg_lightness)
+        """
+        # One HSV conversion shared by all three
+        hsv = MetricsCollector._rgb_to_hsv_array(palette)
+        return (
+            MetricsCollector._calculate_color_diversity(hsv),
+            MetricsCollector._calculate_avg_saturation(hsv),
+            MetricsCollector._calculate_avg_lightness(hsv),
+        )
+
+    @staticmethod
+    def _rgb_to_hsv_array(colors: Sequence[Tuple[int, int, int]]) -> NDArray[np.float64]:
+        """Convert RGB colors to HSV in one vectorized pass.
+
+        Args:
+            colors: List of RGB colors (0-255)
+
+        Returns:
+            Array of shape (n, 3) with hue in degrees [0, 360) and
+            saturation/value in [0, 1]
+        """
+        rgb = np.asarray(colors, dtype=np.float64).reshape(-1, 3) / 255.0
+        r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+        max_c = rgb.max(axis=1)
+        min_c = rgb.min(axis=1)
+        diff = max_c - min_c
+
+        # Divide by 1 where diff/max_c is 0; those entries are masked below
+        safe_diff = np.where(diff == 0, 1.0, diff)
+        hue = np.select(
+            [diff == 0, max_c == r, max_c == g],
+            [
+                0.0,
+                (60 * ((g - b) / safe_diff) + 360) % 360,
+                (60 * ((b - r) / safe_diff) + 120) % 360,
+            ],
+            default=(60 * ((r - g) / safe_diff) + 240) % 360,
+        )
+        saturation = np.where(max_c == 0, 0.0, diff / np.where(max_c == 0, 1.0, max_c))
+
+        return np.stack((hue, saturation, max_c), axis=1)
+
+    @staticmethod
+    def _calculate_color_diversity(hsv: NDArray[np.float64]) -> float:
         """Calculate color diversity score (0-1).
 
         Uses variance in HSV space as a measure of diversity.
+
+        Args:
+            hsv: HSV colors from ``_rgb_to_hsv_array``
         """
-        if not colors:
+        if len(hsv) <= 1:
             return 0.0
 
-        # Convert RGB to HSV
-        hsv_colors = []
-        for r, g, b in colors:
-            r_norm, g_norm, b_norm = r / 255.0, g / 255.0, b / 255.0
-            max_c = max(r_norm, g_norm, b_norm)
-            min_c = min(r_norm, g_norm, b_norm)
-            diff = max_c - min_c
-
-            # Hue
-            if diff == 0:
-                h = 0
-            elif max_c == r_norm:
-                h = (60 * ((g_norm - b_norm) / diff) + 360) % 360
-            elif max_c == g_norm:
-                h = (60 * ((b_norm - r_norm) / diff) + 120) % 360
-            else:
-                h = (60 * ((r_norm - g_norm) / diff) + 240) % 360
-
-            # Saturation
-            s = 0 if max_c == 0 else (diff / max_c)
-
-            # Value
-            v = max_c
-
-            hsv_colors.append((h, s, v))
-
-        # Calculate variance in each dimension
-        hues = [h for h, s, v in hsv_colors]
-        saturations = [s for h, s, v in hsv_colors]
-        values = [v for h, s, v in hsv_colors]
-
         # For hue, handle circular nature (0° = 360°)
-        hue_variance = MetricsCollector._circular_variance(hues)
-        sat_variance = np.var(saturations) if len(saturations) > 1 else 0
-        val_variance = np.var(values) if len(values) > 1 else 0
+        hue_variance = MetricsCollector._circular_variance(hsv[:, 0])
+        # Saturation and value variances in one reduction
+        sat_variance, val_variance = hsv[:, 1:].var(axis=0)
 
         # Combine variances (hue is most important for diversity)
         diversity = (hue_variance * 0.5 + sat_variance * 0.3 + val_variance * 0.2)
 
         # Normalize to 0-1 range
-        return min(diversity, 1.0)
+        return float(min(diversity, 1.0))
 
     @staticmethod
-    def _circular_variance(angles: List[float]) -> float:
+    def _circular_variance(angles: NDArray[np.float64]) -> float:
         """Calculate variance for circular data (angles in degrees)."""
         if len(angles) <= 1:
             return 0.0
 
-        # Convert to radians and calculate mean direction
-        radians = [np.deg2rad(a) for a in angles]
-        cos_sum = sum(np.cos(r) for r in radians)
-        sin_sum = sum(np.sin(r) for r in radians)
-
-        # Mean resultant length
-        r_length = np.sqrt(cos_sum ** 2 + sin_sum ** 2) / len(radians)
+        # Mean resultant length of the unit vectors
+        radians = np.deg2rad(angles)
+        r_length = np.hypot(np.cos(radians).sum(), np.sin(radians).sum()) / len(radians)
 
         # Circular variance (0 = all same, 1 = maximally dispersed)
-        return 1 - r_length
+        return float(1 - r_length)
 
     @staticmethod
-    def _calculate_avg_saturation(colors: List[Tuple[int, int, int]]) -> float:
+    def _calculate_avg_saturation(hsv: NDArray[np.float64]) -> float:
         """Calculate average saturation of colors."""
-        if not colors:
+        if len(hsv) == 0:
             return 0.0
-
-        saturations = []
-        for r, g, b in colors:
-            r_norm, g_norm, b_norm = r / 255.0, g / 255.0, b / 255.0
-            max_c = max(r_norm, g_norm, b_norm)
-            min_c = min(r_norm, g_norm, b_norm)
-            diff = max_c - min_c
-            s = 0 if max_c == 0 else (diff / max_c)
-            saturations.append(s)
-
-        return float(np.mean(saturations))
+        return float(hsv[:, 1].mean())
 
     @staticmethod
-    def _calculate_avg_lightness(colors: List[Tuple[int, int, int]]) -> float:
+    def _calculate_avg_lightness(hsv: NDArray[np.float64]) -> float:
         """Calculate average lightness (value) of colors."""
-        if not colors:
+        if len(hsv) == 0:
             return 0.0
-
-        lightness = []
-        for r, g, b in colors:
-            r_norm, g_norm, b_norm = r / 255.0, g / 255.0, b / 255.0
-            v = max(r_norm, g_norm, b_norm)
-            lightness.append(v)
-
-        return float(np.mean(lightness))
+        return float(hsv[:, 2].mean())
@@ -1,16 +1,56 @@
-"""HTML report generator for exploration results."""
+"""HTML report generator for exploration results.
 
+The report's stylesheet and script are written next to it as
+``report.css`` and ``report.js``; only the results data is inlined. Both are
+minified when rcssmin and rjsmin are installed
+(``pip install paintbynumbers[speedups]``).
+"""
+
+import hashlib
+import shutil
 from pathlib import Path
-from typing import List
-import json
+from typing import Iterator, List, Optional, Tuple
 from datetime import datetime
 
+try:
+    import rcssmin
+    import rjsmin
+    MINIFY_AVAILABLE = True
+except ImportError:
+    MINIFY_AVAILABLE = False
+
+from ..utils.jsonio import dumps_json
 from .engine import VariationResult
 
 
+# Buffer size of the report file
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Static assets written next to the report
+CSS_FILE_NAME = "report.css"
+JS_FILE_NAME = "report.js"
+
+# Short display labels for common parameter names
+_SHORT_PARAM_LABELS = {
+    "kMeansNrOfClusters": "Clusters",
+    "kMeansClusteringColorSpace": "Color Space",
+    "kMeansMinDeltaDifference": "Delta",
+    "removeFacetsSmallerThanNrOfPoints": "Min Facet Size",
+    "maximumNumberOfFacets": "Max Facets",
+    "narrowPixelStripCleanupRuns": "Cleanup Runs",
+    "nrOfTimesToHalveBorderSegments": "Border Smoothing",
+    "resizeImageWidth": "Width",
+    "resizeImageHeight": "Height",
+    "removeFacetsFromLargeToSmall": "Remove Large First",
+}
+
+
 class HTMLReportGenerator:
     """Generates interactive HTML reports for exploration results."""
 
+    # Write the minified CSS/JS (when available); set to False for readable output
+    minify: bool = True
+
     def __init__(self, results: List[VariationResult], output_dir: Path):
         """Initialize report generator.
 
@@ -22,479 +62,148 @@ class HTMLReportGenerator:
         self.output_dir = Path(output_dir)
         self.successful_results = [r for r in results if r.success]
 
+        # Image paths relative to the HTML file, by variation index
+        self._image_srcs = {
+            r.variation_index: (
+                self._relative_src(r.output_paths.get('png')) if r.success else "",
+                self._relative_src(r.output_paths.get('svg')) if r.success else "",
+            )
+            for r in results
+        }
+
+        # Parameter rows ([label, value], sorted by name) shown on each card,
+        # by variation index. Built once and reused by every generate() call;
+        # the report script escapes them when it creates the card.
+        self._param_rows = {
+            r.variation_index: [
+                [_SHORT_PARAM_LABELS.get(key, key), str(value)]
+                for key, value in sorted(r.parameters.items())
+            ]
+            for r in results
+        }
+
+        # (results digest, path) of the last report written by generate()
+        self._last_report: Optional[Tuple[bytes, Path]] = None
+
     def generate(self, output_path: Path) -> None:
         """Generate HTML report.
 
+        The document is written section by section, so it is never held in
+        memory as a whole. When the results are unchanged since the previous
+        call, the report written then is copied (or left in place) instead of
+        being rebuilt.
+
+        The stylesheet and script are written to the same directory, unless
+        identical files are already there.
+
         Args:
             output_path: Path to save HTML file
         """
-        html = self._generate_html()
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html)
+        output_path = Path(output_path)
+        if self.results:
+            self._write_assets(output_path.parent)
+
+        key = self._results_digest()
+        last = self._last_report
+        if last is not None and last[0] == key and last[1].exists():
+            if last[1].resolve() != output_path.resolve():
+                shutil.copyfile(last[1], output_path)
+        else:
+            # A 1 MiB buffer turns the many fragments into a few large writes
+            with open(output_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.writelines(self._iter_html())
+            self._last_report = (key, output_path)
 
         print(f"HTML report saved to: {output_path}")
 
-    def _generate_html(self) -> str:
-        """Generate complete HTML document."""
-        return f"""<!DOCTYPE html>
+    def _write_assets(self, directory: Path) -> None:
+        """Write ``report.css`` and ``report.js`` to ``directory`` if they differ.
+
+        Args:
+            directory: Directory of the report
+        """
+        if self.minify:
+            assets = ((CSS_FILE_NAME, _REPORT_CSS_MIN), (JS_FILE_NAME, _REPORT_JS_MIN))
+        else:
+            assets = ((CSS_FILE_NAME, _REPORT_CSS), (JS_FILE_NAME, _REPORT_JS))
+
+        for name, content in assets:
+            path = directory / name
+            data = content.encode('utf-8')
+            try:
+                if path.read_bytes() == data:
+                    continue
+            except OSError:
+                pass
+            path.write_bytes(data)
+
+    def _results_digest(self) -> bytes:
+        """Return a digest of the result fields that the report shows."""
+        state = [
+            (
+                r.variation_index,
+                r.variation_id,
+                r.success,
+                r.error,
+                r.parameters,
+                (
+                    m.num_facets,
+                    m.num_colors,
+                    m.processing_time,
+                    m.color_diversity_score,
+                    m.mean_facet_size,
+                    m.avg_border_complexity,
+                ) if (m := r.metrics) else None,
+            )
+            for r in self.results
+        ]
+        payload = dumps_json([self._image_srcs, state]).encode('utf-8')
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def _relative_src(self, path: Optional[Path]) -> str:
+        """Return ``path`` as a URL relative to the output directory ("" if None)."""
+        if path is None:
+            return ""
+        return path.relative_to(self.output_dir).as_posix()
+
+    def _iter_html(self) -> Iterator[str]:
+        """Generate the complete HTML document as consecutive fragments."""
+        if not self.results:
+            # Nothing to filter, sort or compare: skip the styles and scripts
+            yield _EMPTY_HTML
+            return
+        yield """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Paint-by-Numbers Explorer Results</title>
-    {self._get_styles()}
+    """
+        yield self._get_styles()
+        yield """
 </head>
 <body>
     <div class="container">
-        {self._get_header()}
-        {self._get_controls()}
-        {self._get_comparison_section()}
-        {self._get_grid()}
+        """
+        yield self._get_header()
+        yield "\n        "
+        yield self._get_controls()
+        yield "\n        "
+        yield self._get_comparison_section()
+        yield "\n        "
+        yield self._get_grid()
+        yield """
     </div>
-    {self._get_scripts()}
+    """
+        yield from self._iter_scripts()
+        yield """
 </body>
 </html>"""
 
-    def _get_styles(self) -> str:
-        """Generate CSS styles."""
-        return """<style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            background: #f5f5f5;
-            color: #333;
-            line-height: 1.6;
-        }
-
-        .container {
-            max-width: 1600px;
-            margin: 0 auto;
-            padding: 20px;
-        }
-
-        .header {
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-
-        .header h1 {
-            font-size: 2em;
-            margin-bottom: 10px;
-            color: #2c3e50;
-        }
-
-        .header .stats {
-            display: flex;
-            gap: 30px;
-            margin-top: 20px;
-            flex-wrap: wrap;
-        }
-
-        .stat {
-            display: flex;
-            flex-direction: column;
-        }
-
-        .stat-label {
-            font-size: 0.9em;
-            color: #666;
-            margin-bottom: 5px;
-        }
-
-        .stat-value {
-            font-size: 1.5em;
-            font-weight: bold;
-            color: #3498db;
-        }
-
-        .controls {
-            background: white;
-            padding: 25px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-
-        .controls h2 {
-            font-size: 1.3em;
-            margin-bottom: 20px;
-            color: #2c3e50;
-        }
-
-        .filter-section {
-            margin-bottom: 20px;
-        }
-
-        .filter-label {
-            display: block;
-            font-weight: 600;
-            margin-bottom: 8px;
-            color: #555;
-        }
-
-        .filter-inputs {
-            display: flex;
-            gap: 15px;
-            flex-wrap: wrap;
-            align-items: center;
-        }
-
-        .filter-group {
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }
-
-        input[type="number"], select {
-            padding: 8px 12px;
-            border: 1px solid #ddd;
-            border-radius: 5px;
-            font-size: 0.95em;
-        }
-
-        input[type="number"] {
-            width: 100px;
-        }
-
-        select {
-            min-width: 150px;
-        }
-
-        .sort-controls {
-            display: flex;
-            gap: 15px;
-            align-items: center;
-            flex-wrap: wrap;
-        }
-
-        button {
-            padding: 10px 20px;
-            background: #3498db;
-            color: white;
-            border: none;
-            border-radius: 5px;
-            cursor: pointer;
-            font-size: 0.95em;
-            font-weight: 600;
-            transition: background 0.2s;
-        }
-
-        button:hover {
-            background: #2980b9;
-        }
-
-        button.secondary {
-            background: #95a5a6;
-        }
-
-        button.secondary:hover {
-            background: #7f8c8d;
-        }
-
-        .comparison-section {
-            background: white;
-            padding: 25px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            display: none;
-        }
-
-        .comparison-section.active {
-            display: block;
-        }
-
-        .comparison-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 20px;
-            margin-top: 20px;
-        }
-
-        .comparison-item {
-            border: 2px solid #3498db;
-            border-radius: 8px;
-            padding: 15px;
-        }
-
-        .grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(350px, 1fr));
-            gap: 25px;
-        }
-
-        /* List view mode - one per line with larger images */
-        .grid.list-view {
-            grid-template-columns: 1fr;
-            max-width: 1400px;
-            margin: 0 auto;
-        }
-
-        .grid.list-view .card {
-            display: flex;
-            flex-direction: row;
-            align-items: stretch;
-        }
-
-        .grid.list-view .card-image {
-            width: 60%;
-            height: auto;
-            min-height: 500px;
-            max-height: 700px;
-        }
-
-        .grid.list-view .card-content {
-            width: 40%;
-            overflow-y: auto;
-        }
-
-        .card {
-            background: white;
-            border-radius: 10px;
-            overflow: hidden;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            transition: transform 0.2s, box-shadow 0.2s;
-            cursor: pointer;
-        }
-
-        .card:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 5px 20px rgba(0,0,0,0.15);
-        }
-
-        .card.selected {
-            outline: 3px solid #3498db;
-            outline-offset: 2px;
-        }
-
-        .card.error {
-            opacity: 0.6;
-            background: #fee;
-        }
-
-        .card-image {
-            width: 100%;
-            height: 300px;
-            object-fit: contain;
-            background: #f9f9f9;
-            border-bottom: 1px solid #eee;
-        }
-
-        .card-content {
-            padding: 20px;
-        }
-
-        .card-title {
-            font-size: 1.1em;
-            font-weight: bold;
-            margin-bottom: 15px;
-            color: #2c3e50;
-        }
-
-        .card-params {
-            margin-bottom: 15px;
-            font-size: 0.9em;
-        }
-
-        .param-item {
-            display: flex;
-            justify-content: space-between;
-            padding: 5px 0;
-            border-bottom: 1px dotted #eee;
-        }
-
-        .param-label {
-            color: #666;
-        }
-
-        .param-value {
-            font-weight: 600;
-            color: #333;
-        }
-
-        .card-metrics {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 10px;
-            padding-top: 15px;
-            border-top: 2px solid #eee;
-            font-size: 0.85em;
-        }
-
-        .metric {
-            display: flex;
-            flex-direction: column;
-        }
-
-        .metric-label {
-            color: #666;
-            font-size: 0.9em;
-        }
-
-        .metric-value {
-            font-weight: bold;
-            color: #2c3e50;
-            font-size: 1.1em;
-        }
-
-        .error-message {
-            color: #e74c3c;
-            background: #fee;
-            padding: 10px;
-            border-radius: 5px;
-            margin-top: 10px;
-            font-size: 0.9em;
-        }
-
-        .no-results {
-            text-align: center;
-            padding: 60px 20px;
-            color: #999;
-            font-size: 1.2em;
-        }
-
-        .modal {
-            display: none;
-            position: fixed;
-            z-index: 1000;
-            left: 0;
-            top: 0;
-            width: 100%;
-            height: 100%;
-            background: rgba(0,0,0,0.95);
-            overflow: hidden;
-        }
-
-        .modal.active {
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            flex-direction: column;
-        }
-
-        .modal-header {
-            position: absolute;
-            top: 20px;
-            left: 0;
-            right: 0;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 0 40px;
-            color: white;
-            z-index: 1001;
-        }
-
-        .modal-counter {
-            font-size: 1.2em;
-            font-weight: 500;
-        }
-
-        .modal-title {
-            font-size: 1.1em;
-            color: #ddd;
-        }
-
-        .modal-close {
-            font-size: 2.5em;
-            cursor: pointer;
-            color: white;
-            line-height: 1;
-            transition: color 0.2s;
-        }
-
-        .modal-close:hover {
-            color: #3498db;
-        }
-
-        .modal-content {
-            position: relative;
-            max-width: 95vw;
-            max-height: 85vh;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }
-
-        .modal-image {
-            max-width: 100%;
-            max-height: 85vh;
-            width: auto;
-            height: auto;
-            object-fit: contain;
-        }
-
-        .modal-nav {
-            position: absolute;
-            top: 50%;
-            transform: translateY(-50%);
-            font-size: 3em;
-            color: white;
-            cursor: pointer;
-            padding: 20px;
-            user-select: none;
-            transition: color 0.2s, transform 0.2s;
-            z-index: 1001;
-        }
-
-        .modal-nav:hover {
-            color: #3498db;
-            transform: translateY(-50%) scale(1.2);
-        }
-
-        .modal-nav.prev {
-            left: 20px;
-        }
-
-        .modal-nav.next {
-            right: 20px;
-        }
-
-        .modal-nav.disabled {
-            opacity: 0.3;
-            cursor: not-allowed;
-            pointer-events: none;
-        }
-
-        .modal-help {
-            position: absolute;
-            bottom: 20px;
-            left: 50%;
-            transform: translateX(-50%);
-            color: #999;
-            font-size: 0.9em;
-            text-align: center;
-        }
-
-        @media (max-width: 768px) {
-            .grid {
-                grid-template-columns: 1fr;
-            }
-
-            .filter-inputs, .sort-controls {
-                flex-direction: column;
-                align-items: stretch;
-            }
-
-            .filter-group {
-                flex-direction: column;
-                align-items: stretch;
-            }
-
-            input[type="number"], select {
-                width: 100%;
-            }
-        }
-    </style>"""
+    @staticmethod
+    def _get_styles() -> str:
+        """Generate the stylesheet link."""
+        return _STYLES_LINK
 
     def _get_header(self) -> str:
         """Generate header section."""
@@ -502,41 +211,523 @@ class HTMLReportGenerator:
         successful = len(self.successful_results)
         failed = total - successful
 
-        # Calculate average metrics
+        # Calculate average metrics (both totals in one pass)
         if self.successful_results:
-            avg_time = sum(r.metrics.processing_time for r in self.successful_results) / len(self.successful_results)
-            avg_facets = sum(r.metrics.num_facets for r in self.successful_results) / len(self.successful_results)
+            total_time = 0.0
+            total_facets = 0
+            for r in self.successful_results:
+                m = r.metrics
+                total_time += m.processing_time
+                total_facets += m.num_facets
+            avg_time = total_time / successful
+            avg_facets = total_facets / successful
         else:
             avg_time = 0
             avg_facets = 0
 
-        return f"""<div class="header">
-        <h1>Paint-by-Numbers Explorer Results</h1>
-        <p>Generated on {datetime.now().strftime("%Y-%m-%d at %H:%M:%S")}</p>
-        <div class="stats">
-            <div class="stat">
-                <span class="stat-label">Total Variations</span>
-                <span class="stat-value">{total}</span>
-            </div>
-            <div class="stat">
-                <span class="stat-label">Successful</span>
-                <span class="stat-value" style="color: #27ae60;">{successful}</span>
-            </div>
-            {f'<div class="stat"><span class="stat-label">Failed</span><span class="stat-value" style="color: #e74c3c;">{failed}</span></div>' if failed > 0 else ''}
-            <div class="stat">
-                <span class="stat-label">Avg Processing Time</span>
-                <span class="stat-value">{avg_time:.2f}s</span>
-            </div>
-            <div class="stat">
-                <span class="stat-label">Avg Facets</span>
-                <span class="stat-value">{avg_facets:.0f}</span>
-            </div>
-        </div>
-    </div>"""
+        failed_html = _FAILED_STAT_TEMPLATE % failed if failed > 0 else ''
+        generated = datetime.now().strftime("%Y-%m-%d at %H:%M:%S")
+        return _HEADER_TEMPLATE % (
+            generated, total, successful, failed_html, avg_time, avg_facets,
+        )
 
-    def _get_controls(self) -> str:
+    @staticmethod
+    def _get_controls() -> str:
         """Generate filter and sort controls."""
-        return """<div class="controls">
+        return _CONTROLS_HTML
+
+    @staticmethod
+    def _get_comparison_section() -> str:
+        """Generate comparison section."""
+        return _COMPARISON_HTML
+
+    @staticmethod
+    def _get_grid() -> str:
+        """Generate the results grid.
+
+        The grid starts empty: the script creates the cards from
+        ``resultsData`` in batches as the grid scrolls into view, so the
+        document does not carry markup for every result.
+        """
+        return _GRID_HTML
+
+    def _iter_scripts(self) -> Iterator[str]:
+        """Generate the results data and the script element that renders it.
+
+        The (largest) data string is yielded on its own rather than
+        formatted into the surrounding markup, which would copy it.
+        """
+        # Everything the cards show, for rendering them in the browser
+        results_data = []
+        for r in self.results:
+            png_src, svg_src = self._image_srcs[r.variation_index]
+            entry = {
+                'index': r.variation_index,
+                'id': r.variation_id,
+                'success': r.success,
+                'params': self._param_rows[r.variation_index],
+                'png': png_src,
+                'svg': svg_src,
+            }
+            if r.success and (m := r.metrics):
+                entry['facets'] = m.num_facets
+                entry['colors'] = m.num_colors
+                entry['time'] = m.processing_time
+                entry['diversity'] = m.color_diversity_score
+                entry['meanFacetSize'] = m.mean_facet_size
+                entry['complexity'] = m.avg_border_complexity
+            else:
+                entry['error'] = (r.error or "")[:200]
+            results_data.append(entry)
+
+        # "</" would end the script element inside a JSON string
+        results_json = dumps_json(results_data).replace("</", "<\\/")
+
+        yield _SCRIPTS_PREFIX
+        yield results_json
+        yield _SCRIPTS_SUFFIX
+
+
+# Static report fragments. They do not depend on the results, so they are
+# built once at import instead of on every generate() call.
+
+_STYLES_LINK = f'<link rel="stylesheet" href="{CSS_FILE_NAME}">'
+
+# The results data, then the script that renders it
+_SCRIPTS_PREFIX = '<script>const resultsData = '
+_SCRIPTS_SUFFIX = f';</script>\n    <script src="{JS_FILE_NAME}"></script>'
+
+_REPORT_CSS = """* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
+    background: #f5f5f5;
+    color: #333;
+    line-height: 1.6;
+}
+
+.container {
+    max-width: 1600px;
+    margin: 0 auto;
+    padding: 20px;
+}
+
+.header {
+    background: white;
+    padding: 30px;
+    border-radius: 10px;
+    margin-bottom: 30px;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+}
+
+.header h1 {
+    font-size: 2em;
+    margin-bottom: 10px;
+    color: #2c3e50;
+}
+
+.header .stats {
+    display: flex;
+    gap: 30px;
+    margin-top: 20px;
+    flex-wrap: wrap;
+}
+
+.stat {
+    display: flex;
+    flex-direction: column;
+}
+
+.stat-label {
+    font-size: 0.9em;
+    color: #666;
+    margin-bottom: 5px;
+}
+
+.stat-value {
+    font-size: 1.5em;
+    font-weight: bold;
+    color: #3498db;
+}
+
+.controls {
+    background: white;
+    padding: 25px;
+    border-radius: 10px;
+    margin-bottom: 30px;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+}
+
+.controls h2 {
+    font-size: 1.3em;
+    margin-bottom: 20px;
+    color: #2c3e50;
+}
+
+.filter-section {
+    margin-bottom: 20px;
+}
+
+.filter-label {
+    display: block;
+    font-weight: 600;
+    margin-bottom: 8px;
+    color: #555;
+}
+
+.filter-inputs {
+    display: flex;
+    gap: 15px;
+    flex-wrap: wrap;
+    align-items: center;
+}
+
+.filter-group {
+    display: flex;
+    align-items: center;
+    gap: 10px;
+}
+
+input[type="number"], select {
+    padding: 8px 12px;
+    border: 1px solid #ddd;
+    border-radius: 5px;
+    font-size: 0.95em;
+}
+
+input[type="number"] {
+    width: 100px;
+}
+
+select {
+    min-width: 150px;
+}
+
+.sort-controls {
+    display: flex;
+    gap: 15px;
+    align-items: center;
+    flex-wrap: wrap;
+}
+
+button {
+    padding: 10px 20px;
+    background: #3498db;
+    color: white;
+    border: none;
+    border-radius: 5px;
+    cursor: pointer;
+    font-size: 0.95em;
+    font-weight: 600;
+    transition: background 0.2s;
+}
+
+button:hover {
+    background: #2980b9;
+}
+
+button.secondary {
+    background: #95a5a6;
+}
+
+button.secondary:hover {
+    background: #7f8c8d;
+}
+
+.comparison-section {
+    background: white;
+    padding: 25px;
+    border-radius: 10px;
+    margin-bottom: 30px;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+    display: none;
+}
+
+.comparison-section.active {
+    display: block;
+}
+
+.comparison-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+    gap: 20px;
+    margin-top: 20px;
+}
+
+.comparison-item {
+    border: 2px solid #3498db;
+    border-radius: 8px;
+    padding: 15px;
+}
+
+.grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fill, minmax(350px, 1fr));
+    gap: 25px;
+}
+
+/* List view mode - one per line with larger images */
+.grid.list-view {
+    grid-template-columns: 1fr;
+    max-width: 1400px;
+    margin: 0 auto;
+}
+
+.grid.list-view .card {
+    display: flex;
+    flex-direction: row;
+    align-items: stretch;
+}
+
+.grid.list-view .card-image {
+    width: 60%;
+    height: auto;
+    min-height: 500px;
+    max-height: 700px;
+}
+
+.grid.list-view .card-content {
+    width: 40%;
+    overflow-y: auto;
+}
+
+.card {
+    background: white;
+    border-radius: 10px;
+    overflow: hidden;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+    transition: transform 0.2s, box-shadow 0.2s;
+    cursor: pointer;
+}
+
+.card:hover {
+    transform: translateY(-5px);
+    box-shadow: 0 5px 20px rgba(0,0,0,0.15);
+}
+
+.card.selected {
+    outline: 3px solid #3498db;
+    outline-offset: 2px;
+}
+
+.card.error {
+    opacity: 0.6;
+    background: #fee;
+}
+
+.card-image {
+    width: 100%;
+    height: 300px;
+    object-fit: contain;
+    background: #f9f9f9;
+    border-bottom: 1px solid #eee;
+}
+
+.card-content {
+    padding: 20px;
+}
+
+.card-title {
+    font-size: 1.1em;
+    font-weight: bold;
+    margin-bottom: 15px;
+    color: #2c3e50;
+}
+
+.card-params {
+    margin-bottom: 15px;
+    font-size: 0.9em;
+}
+
+.param-item {
+    display: flex;
+    justify-content: space-between;
+    padding: 5px 0;
+    border-bottom: 1px dotted #eee;
+}
+
+.param-label {
+    color: #666;
+}
+
+.param-value {
+    font-weight: 600;
+    color: #333;
+}
+
+.card-metrics {
+    display: grid;
+    grid-template-columns: 1fr 1fr;
+    gap: 10px;
+    padding-top: 15px;
+    border-top: 2px solid #eee;
+    font-size: 0.85em;
+}
+
+.metric {
+    display: flex;
+    flex-direction: column;
+}
+
+.metric-label {
+    color: #666;
+    font-size: 0.9em;
+}
+
+.metric-value {
+    font-weight: bold;
+    color: #2c3e50;
+    font-size: 1.1em;
+}
+
+.error-message {
+    color: #e74c3c;
+    background: #fee;
+    padding: 10px;
+    border-radius: 5px;
+    margin-top: 10px;
+    font-size: 0.9em;
+}
+
+.modal {
+    display: none;
+    position: fixed;
+    z-index: 1000;
+    left: 0;
+    top: 0;
+    width: 100%;
+    height: 100%;
+    background: rgba(0,0,0,0.95);
+    overflow: hidden;
+}
+
+.modal.active {
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    flex-direction: column;
+}
+
+.modal-header {
+    position: absolute;
+    top: 20px;
+    left: 0;
+    right: 0;
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    padding: 0 40px;
+    color: white;
+    z-index: 1001;
+}
+
+.modal-counter {
+    font-size: 1.2em;
+    font-weight: 500;
+}
+
+.modal-title {
+    font-size: 1.1em;
+    color: #ddd;
+}
+
+.modal-close {
+    font-size: 2.5em;
+    cursor: pointer;
+    color: white;
+    line-height: 1;
+    transition: color 0.2s;
+}
+
+.modal-close:hover {
+    color: #3498db;
+}
+
+.modal-content {
+    position: relative;
+    max-width: 95vw;
+    max-height: 85vh;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+}
+
+.modal-image {
+    max-width: 100%;
+    max-height: 85vh;
+    width: auto;
+    height: auto;
+    object-fit: contain;
+}
+
+.modal-nav {
+    position: absolute;
+    top: 50%;
+    transform: translateY(-50%);
+    font-size: 3em;
+    color: white;
+    cursor: pointer;
+    padding: 20px;
+    user-select: none;
+    transition: color 0.2s, transform 0.2s;
+    z-index: 1001;
+}
+
+.modal-nav:hover {
+    color: #3498db;
+    transform: translateY(-50%) scale(1.2);
+}
+
+.modal-nav.prev {
+    left: 20px;
+}
+
+.modal-nav.next {
+    right: 20px;
+}
+
+.modal-nav.disabled {
+    opacity: 0.3;
+    cursor: not-allowed;
+    pointer-events: none;
+}
+
+.modal-help {
+    position: absolute;
+    bottom: 20px;
+    left: 50%;
+    transform: translateX(-50%);
+    color: #999;
+    font-size: 0.9em;
+    text-align: center;
+}
+
+@media (max-width: 768px) {
+    .grid {
+        grid-template-columns: 1fr;
+    }
+
+    .filter-inputs, .sort-controls {
+        flex-direction: column;
+        align-items: stretch;
+    }
+
+    .filter-group {
+        flex-direction: column;
+        align-items: stretch;
+    }
+
+    input[type="number"], select {
+        width: 100%;
+    }
+}
+"""
+
+_CONTROLS_HTML = """<div class="controls">
         <h2>Filter & Sort</h2>
 
         <div class="filter-section">
@@ -600,23 +791,407 @@ class HTMLReportGenerator:
         </div>
     </div>"""
 
-    def _get_comparison_section(self) -> str:
-        """Generate comparison section."""
-        return """<div class="comparison-section" id="comparison-section">
+_COMPARISON_HTML = """<div class="comparison-section" id="comparison-section">
         <h2>Comparison View</h2>
         <div id="comparison-grid" class="comparison-grid">
             <!-- Comparison items will be added dynamically -->
         </div>
     </div>"""
 
-    def _get_grid(self) -> str:
-        """Generate results grid."""
-        cards = [self._get_card(result) for result in self.results]
-        cards_html = "\n".join(cards)
+_REPORT_JS = """let comparisonMode = false;
+let selectedCards = new Set();
+let isListView = false;
+
+// Cards are created from resultsData as the grid scrolls into view,
+// CARD_BATCH_SIZE at a time, and kept for reuse after filtering
+const CARD_BATCH_SIZE = 50;
+const cardElements = new Map();
+let orderedResults = resultsData;
+let renderedCount = 0;
+
+function escapeHtml(text) {
+    return String(text).replace(/[&<>"']/g, ch => ({
+        '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'
+    })[ch]);
+}
+
+function metricHtml(label, value) {
+    return `<div class="metric"><span class="metric-label">${label}</span>` +
+           `<span class="metric-value">${value}</span></div>`;
+}
+
+function createCard(result) {
+    const card = document.createElement('div');
+    card.className = result.success ? 'card' : 'card error';
+    card.id = `card-${result.index}`;
+    card.dataset.pngSrc = result.png;
+    card.dataset.svgSrc = result.svg;
+    card.onclick = event => selectCard(card, event);
+
+    let imageHtml;
+    if (result.png) {
+        const src = isListView ? result.svg : result.png;
+        imageHtml = `<img class="card-image" src="${escapeHtml(src)}" ` +
+                    `alt="${escapeHtml(result.id)}" loading="lazy" ` +
+                    `onclick="openModal(event, this.src)">`;
+    } else {
+        imageHtml = '<div class="card-image" style="display: flex; align-items: center;' +
+                    ' justify-content: center; color: #999;">No preview</div>';
+    }
+
+    const paramsHtml = result.params.map(([label, value]) =>
+        `<div class="param-item"><span class="param-label">${escapeHtml(label)}:</span>` +
+        `<span class="param-value">${escapeHtml(value)}</span></div>`
+    ).join('');
+
+    let detailsHtml;
+    if (result.facets !== undefined) {
+        detailsHtml = '<div class="card-metrics">' +
+            metricHtml('Facets', result.facets) +
+            metricHtml('Colors', result.colors) +
+            metricHtml('Time', `${result.time.toFixed(2)}s`) +
+            metricHtml('Diversity', result.diversity.toFixed(2)) +
+            metricHtml('Avg Facet', `${result.meanFacetSize.toFixed(0)}px`) +
+            metricHtml('Complexity', result.complexity.toFixed(1)) +
+            '</div>';
+    } else {
+        detailsHtml = `<div class="error-message">Error: ${escapeHtml(result.error)}</div>`;
+    }
+
+    card.innerHTML = imageHtml +
+        `<div class="card-content"><div class="card-title">${escapeHtml(result.id)}</div>` +
+        `<div class="card-params">${paramsHtml}</div>${detailsHtml}</div>`;
+    return card;
+}
+
+function getCard(result) {
+    let card = cardElements.get(result.index);
+    if (!card) {
+        card = createCard(result);
+        cardElements.set(result.index, card);
+    }
+    return card;
+}
+
+function renderNextBatch() {
+    const end = Math.min(renderedCount + CARD_BATCH_SIZE, orderedResults.length);
+    const fragment = document.createDocumentFragment();
+    for (; renderedCount < end; renderedCount++) {
+        fragment.appendChild(getCard(orderedResults[renderedCount]));
+    }
+    document.getElementById('results-grid').appendChild(fragment);
+}
+
+function renderGrid() {
+    document.getElementById('results-grid').replaceChildren();
+    renderedCount = 0;
+    renderNextBatch();
+}
+
+const sentinel = document.getElementById('grid-sentinel');
+const sentinelObserver = new IntersectionObserver(entries => {
+    if (entries.some(entry => entry.isIntersecting) &&
+            renderedCount < orderedResults.length) {
+        renderNextBatch();
+        // Observe again: if the sentinel is still in view, the
+        // observer reports it once more and the next batch follows
+        sentinelObserver.unobserve(sentinel);
+        sentinelObserver.observe(sentinel);
+    }
+}, { rootMargin: '600px' });
+
+const sortKeys = {
+    index: result => result.index,
+    facets: result => result.facets || 0,
+    colors: result => result.colors || 0,
+    time: result => result.time || 0,
+    diversity: result => result.diversity || 0,
+    complexity: result => result.complexity || 0,
+};
+
+function applyFiltersAndSort() {
+    const facetsMin = parseFloat(document.getElementById('facets-min').value) || -Infinity;
+    const facetsMax = parseFloat(document.getElementById('facets-max').value) || Infinity;
+    const colorsMin = parseFloat(document.getElementById('colors-min').value) || -Infinity;
+    const colorsMax = parseFloat(document.getElementById('colors-max').value) || Infinity;
+    const timeMin = parseFloat(document.getElementById('time-min').value) || -Infinity;
+    const timeMax = parseFloat(document.getElementById('time-max').value) || Infinity;
+
+    const sortBy = document.getElementById('sort-by').value;
+    const sortOrder = document.getElementById('sort-order').value;
+
+    // Filter results
+    orderedResults = resultsData.filter(result => {
+        const facets = result.facets || 0;
+        const colors = result.colors || 0;
+        const time = result.time || 0;
+
+        return facets >= facetsMin && facets <= facetsMax &&
+               colors >= colorsMin && colors <= colorsMax &&
+               time >= timeMin && time <= timeMax;
+    });
+
+    // Sort them
+    const key = sortKeys[sortBy] || (() => 0);
+    orderedResults.sort((a, b) =>
+        sortOrder === 'asc' ? key(a) - key(b) : key(b) - key(a)
+    );
+
+    renderGrid();
+}
+
+function resetFilters() {
+    document.getElementById('facets-min').value = '';
+    document.getElementById('facets-max').value = '';
+    document.getElementById('colors-min').value = '';
+    document.getElementById('colors-max').value = '';
+    document.getElementById('time-min').value = '';
+    document.getElementById('time-max').value = '';
+    document.getElementById('sort-by').value = 'index';
+    document.getElementById('sort-order').value = 'asc';
+
+    applyFiltersAndSort();
+}
+
+function toggleComparisonMode() {
+    comparisonMode = !comparisonMode;
+    const button = document.getElementById('toggle-comparison');
+    button.textContent = comparisonMode ?
+        'Disable Comparison' :
+        'Enable Comparison (select up to 4)';
+    button.style.background = comparisonMode ? '#e74c3c' : '#3498db';
+
+    if (!comparisonMode) {
+        clearComparison();
+    }
+}
+
+function selectCard(card, event) {
+    // Don't select if clicking on image (that opens modal)
+    if (event.target.tagName === 'IMG') {
+        return;
+    }
+
+    if (!comparisonMode) return;
+
+    if (selectedCards.has(card)) {
+        selectedCards.delete(card);
+        card.classList.remove('selected');
+    } else {
+        if (selectedCards.size >= 4) {
+            alert('Maximum 4 variations can be compared');
+            return;
+        }
+        selectedCards.add(card);
+        card.classList.add('selected');
+    }
+
+    updateComparison();
+}
+
+function clearComparison() {
+    selectedCards.forEach(card => {
+        card.classList.remove('selected');
+    });
+    selectedCards.clear();
+    updateComparison();
+}
+
+function updateComparison() {
+    const section = document.getElementById('comparison-section');
+    const grid = document.getElementById('comparison-grid');
+
+    if (selectedCards.size === 0) {
+        section.classList.remove('active');
+        return;
+    }
+
+    section.classList.add('active');
+    grid.innerHTML = '';
+
+    selectedCards.forEach(card => {
+        const clone = card.cloneNode(true);
+        clone.classList.add('comparison-item');
+        clone.onclick = null;
+        grid.appendChild(clone);
+    });
+}
+
+// View mode toggle
+function toggleViewMode() {
+    isListView = !isListView;
+    const grid = document.getElementById('results-grid');
+    const button = document.getElementById('toggle-view');
+
+    if (isListView) {
+        grid.classList.add('list-view');
+        button.textContent = '🔲 Switch to Grid View';
+    } else {
+        grid.classList.remove('list-view');
+        button.textContent = '📋 Switch to List View (larger images)';
+    }
+
+    // High-res SVG images for list view, PNG thumbnails for grid
+    // view (cards not created yet pick the right one when they are)
+    cardElements.forEach(card => {
+        const img = card.querySelector('.card-image');
+        const src = isListView ? card.dataset.svgSrc : card.dataset.pngSrc;
+        if (img && src) {
+            img.src = src;
+        }
+    });
+}
+
+// Modal navigation (over all filtered results, created or not)
+let currentModalIndex = 0;
+let modalResults = [];
+
+function openModal(event, src) {
+    event.stopPropagation();
+
+    // Get the card element
+    const cardElement = event.target.closest('.card');
+
+    // Navigate the results in their current order
+    modalResults = orderedResults;
+
+    // Find current card index
+    currentModalIndex = modalResults.findIndex(
+        result => cardElements.get(result.index) === cardElement
+    );
+
+    // Show modal
+    showModalImage(currentModalIndex);
+}
+
+function showModalImage(index) {
+    if (index < 0 || index >= modalResults.length) return;
+
+    currentModalIndex = index;
+    const result = modalResults[index];
+
+    // Update modal image
+    const modal = document.getElementById('image-modal');
+    const modalImg = document.getElementById('modal-image');
+
+    // Always use SVG for better quality in modal
+    if (result.svg) {
+        modalImg.src = result.svg;
+    }
+
+    // Update counter and title
+    const counter = document.getElementById('modal-counter');
+    const title = document.getElementById('modal-title');
+
+    counter.textContent = `${index + 1} / ${modalResults.length}`;
+    title.textContent = result.id;
+
+    // Update navigation button states
+    const prevBtn = document.querySelector('.modal-nav.prev');
+    const nextBtn = document.querySelector('.modal-nav.next');
+
+    prevBtn.classList.toggle('disabled', index === 0);
+    nextBtn.classList.toggle('disabled', index === modalResults.length - 1);
+
+    modal.classList.add('active');
+}
+
+function navigateModal(direction) {
+    const newIndex = currentModalIndex + direction;
+    if (newIndex >= 0 && newIndex < modalResults.length) {
+        showModalImage(newIndex);
+    }
+}
+
+function closeModal() {
+    const modal = document.getElementById('image-modal');
+    modal.classList.remove('active');
+}
+
+// Keyboard shortcuts
+document.addEventListener('keydown', (e) => {
+    const modal = document.getElementById('image-modal');
+    const isModalOpen = modal.classList.contains('active');
+
+    if (e.key === 'Escape') {
+        if (isModalOpen) {
+            closeModal();
+        } else if (comparisonMode) {
+            toggleComparisonMode();
+        }
+    }
+
+    if (isModalOpen) {
+        if (e.key === 'ArrowLeft' || e.key === 'ArrowUp') {
+            e.preventDefault();
+            navigateModal(-1);
+        }
+        if (e.key === 'ArrowRight' || e.key === 'ArrowDown') {
+            e.preventDefault();
+            navigateModal(1);
+        }
+    }
+});
+
+renderGrid();
+sentinelObserver.observe(sentinel);
+"""
+
+# Minified copies of the CSS/JS, built once at import (the readable source
+# when the minifiers are not installed)
+if MINIFY_AVAILABLE:
+    _REPORT_CSS_MIN = rcssmin.cssmin(_REPORT_CSS)
+    _REPORT_JS_MIN = rjsmin.jsmin(_REPORT_JS)
+else:
+    _REPORT_CSS_MIN = _REPORT_CSS
+    _REPORT_JS_MIN = _REPORT_JS
 
-        return f"""<div class="grid" id="results-grid">
-        {cards_html if cards else '<div class="no-results">No results to display</div>'}
-    </div>
+# Complete report for an exploration without results
+_EMPTY_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>Paint-by-Numbers Explorer Results</title>
+</head>
+<body>
+    <p>No results to display</p>
+</body>
+</html>"""
+
+# Header fragments, filled with %-formatting
+_HEADER_TEMPLATE = """<div class="header">
+        <h1>Paint-by-Numbers Explorer Results</h1>
+        <p>Generated on %s</p>
+        <div class="stats">
+            <div class="stat">
+                <span class="stat-label">Total Variations</span>
+                <span class="stat-value">%d</span>
+            </div>
+            <div class="stat">
+                <span class="stat-label">Successful</span>
+                <span class="stat-value" style="color: #27ae60;">%d</span>
+            </div>
+            %s
+            <div class="stat">
+                <span class="stat-label">Avg Processing Time</span>
+                <span class="stat-value">%.2fs</span>
+            </div>
+            <div class="stat">
+                <span class="stat-label">Avg Facets</span>
+                <span class="stat-value">%.0f</span>
+            </div>
+        </div>
+    </div>"""
+
+_FAILED_STAT_TEMPLATE = (
+    '<div class="stat"><span class="stat-label">Failed</span>'
+    '<span class="stat-value" style="color: #e74c3c;">%d</span></div>'
+)
+
+# Results grid (filled by the script) and image viewer
+_GRID_HTML = """<div class="grid" id="results-grid">
+        </div>
+        <div id="grid-sentinel" style="height: 1px;"></div>
 
     <!-- Modal for full-size image viewer with navigation -->
     <div id="image-modal" class="modal" onclick="closeModal()">
@@ -636,425 +1211,3 @@ class HTMLReportGenerator:
             Use ← → arrow keys or click arrows to navigate | ESC to close
         </div>
     </div>"""
-
-    def _get_card(self, result: VariationResult) -> str:
-        """Generate HTML for a single result card."""
-        # Prepare image paths (relative to HTML file)
-        png_src = ""
-        svg_src = ""
-
-        if result.success:
-            if 'png' in result.output_paths:
-                rel_path = result.output_paths['png'].relative_to(self.output_dir)
-                png_src = str(rel_path).replace('\\', '/')
-
-            if 'svg' in result.output_paths:
-                rel_path = result.output_paths['svg'].relative_to(self.output_dir)
-                svg_src = str(rel_path).replace('\\', '/')
-
-        # Get parameters that differ from baseline
-        param_items = []
-        for key, value in sorted(result.parameters.items()):
-            # Shorten key for display
-            display_key = self._shorten_key(key)
-            param_items.append(f"""
-                <div class="param-item">
-                    <span class="param-label">{display_key}:</span>
-                    <span class="param-value">{value}</span>
-                </div>
-            """)
-
-        params_html = "".join(param_items)
-
-        # Generate metrics section
-        if result.success and result.metrics:
-            m = result.metrics
-            metrics_html = f"""
-                <div class="card-metrics">
-                    <div class="metric">
-                        <span class="metric-label">Facets</span>
-                        <span class="metric-value">{m.num_facets}</span>
-                    </div>
-                    <div class="metric">
-                        <span class="metric-label">Colors</span>
-                        <span class="metric-value">{m.num_colors}</span>
-                    </div>
-                    <div class="metric">
-                        <span class="metric-label">Time</span>
-                        <span class="metric-value">{m.processing_time:.2f}s</span>
-                    </div>
-                    <div class="metric">
-                        <span class="metric-label">Diversity</span>
-                        <span class="metric-value">{m.color_diversity_score:.2f}</span>
-                    </div>
-                    <div class="metric">
-                        <span class="metric-label">Avg Facet</span>
-                        <span class="metric-value">{m.mean_facet_size:.0f}px</span>
-                    </div>
-                    <div class="metric">
-                        <span class="metric-label">Complexity</span>
-                        <span class="metric-value">{m.avg_border_complexity:.1f}</span>
-                    </div>
-                </div>
-            """
-        else:
-            metrics_html = f'<div class="error-message">Error: {result.error[:200]}</div>'
-
-        # Generate data attributes for filtering/sorting
-        data_attrs = ""
-        if result.success and result.metrics:
-            m = result.metrics
-            data_attrs = f"""
-                data-facets="{m.num_facets}"
-                data-colors="{m.num_colors}"
-                data-time="{m.processing_time:.2f}"
-                data-diversity="{m.color_diversity_score:.2f}"
-                data-complexity="{m.avg_border_complexity:.1f}"
-                data-index="{result.variation_index}"
-                data-png-src="{png_src}"
-                data-svg-src="{svg_src}"
-            """
-
-        error_class = "" if result.success else " error"
-
-        return f"""<div class="card{error_class}"
-                       id="card-{result.variation_index}"
-                       {data_attrs}
-                       onclick="selectCard(this, event)">
-        {f'<img class="card-image" src="{png_src}" alt="{result.variation_id}" onclick="openModal(event, this.src)">' if png_src else '<div class="card-image" style="display: flex; align-items: center; justify-content: center; color: #999;">No preview</div>'}
-        <div class="card-content">
-            <div class="card-title">{result.variation_id}</div>
-            <div class="card-params">
-                {params_html}
-            </div>
-            {metrics_html}
-        </div>
-    </div>"""
-
-    def _shorten_key(self, key: str) -> str:
-        """Shorten parameter names for display."""
-        replacements = {
-            "kMeansNrOfClusters": "Clusters",
-            "kMeansClusteringColorSpace": "Color Space",
-            "kMeansMinDeltaDifference": "Delta",
-            "removeFacetsSmallerThanNrOfPoints": "Min Facet Size",
-            "maximumNumberOfFacets": "Max Facets",
-            "narrowPixelStripCleanupRuns": "Cleanup Runs",
-            "nrOfTimesToHalveBorderSegments": "Border Smoothing",
-            "resizeImageWidth": "Width",
-            "resizeImageHeight": "Height",
-            "removeFacetsFromLargeToSmall": "Remove Large First",
-        }
-        return replacements.get(key, key)
-
-    def _get_scripts(self) -> str:
-        """Generate JavaScript for interactivity."""
-        # Convert results to JSON for use in JavaScript
-        results_data = []
-        for r in self.results:
-            if r.success and r.metrics:
-                results_data.append({
-                    'index': r.variation_index,
-                    'id': r.variation_id,
-                    'facets': r.metrics.num_facets,
-                    'colors': r.metrics.num_colors,
-                    'time': r.metrics.processing_time,
-                    'diversity': r.metrics.color_diversity_score,
-                    'complexity': r.metrics.avg_border_complexity,
-                })
-
-        results_json = json.dumps(results_data)
-
-        return f"""<script>
-        let comparisonMode = false;
-        let selectedCards = new Set();
-        const resultsData = {results_json};
-
-        function applyFiltersAndSort() {{
-            const facetsMin = parseFloat(document.getElementById('facets-min').value) || -Infinity;
-            const facetsMax = parseFloat(document.getElementById('facets-max').value) || Infinity;
-            const colorsMin = parseFloat(document.getElementById('colors-min').value) || -Infinity;
-            const colorsMax = parseFloat(document.getElementById('colors-max').value) || Infinity;
-            const timeMin = parseFloat(document.getElementById('time-min').value) || -Infinity;
-            const timeMax = parseFloat(document.getElementById('time-max').value) || Infinity;
-
-            const sortBy = document.getElementById('sort-by').value;
-            const sortOrder = document.getElementById('sort-order').value;
-
-            const grid = document.getElementById('results-grid');
-            const cards = Array.from(grid.querySelectorAll('.card'));
-
-            // Filter cards
-            cards.forEach(card => {{
-                const facets = parseFloat(card.dataset.facets) || 0;
-                const colors = parseFloat(card.dataset.colors) || 0;
-                const time = parseFloat(card.dataset.time) || 0;
-
-                const visible = facets >= facetsMin && facets <= facetsMax &&
-                               colors >= colorsMin && colors <= colorsMax &&
-                               time >= timeMin && time <= timeMax;
-
-                card.style.display = visible ? 'block' : 'none';
-            }});
-
-            // Sort visible cards
-            const visibleCards = cards.filter(card => card.style.display !== 'none');
-
-            visibleCards.sort((a, b) => {{
-                let aVal, bVal;
-
-                switch(sortBy) {{
-                    case 'index':
-                        aVal = parseFloat(a.dataset.index) || 0;
-                        bVal = parseFloat(b.dataset.index) || 0;
-                        break;
-                    case 'facets':
-                        aVal = parseFloat(a.dataset.facets) || 0;
-                        bVal = parseFloat(b.dataset.facets) || 0;
-                        break;
-                    case 'colors':
-                        aVal = parseFloat(a.dataset.colors) || 0;
-                        bVal = parseFloat(b.dataset.colors) || 0;
-                        break;
-                    case 'time':
-                        aVal = parseFloat(a.dataset.time) || 0;
-                        bVal = parseFloat(b.dataset.time) || 0;
-                        break;
-                    case 'diversity':
-                        aVal = parseFloat(a.dataset.diversity) || 0;
-                        bVal = parseFloat(b.dataset.diversity) || 0;
-                        break;
-                    case 'complexity':
-                        aVal = parseFloat(a.dataset.complexity) || 0;
-                        bVal = parseFloat(b.dataset.complexity) || 0;
-                        break;
-                    default:
-                        aVal = 0;
-                        bVal = 0;
-                }}
-
-                return sortOrder === 'asc' ? aVal - bVal : bVal - aVal;
-            }});
-
-            // Clear grid and re-add sorted cards
-            grid.innerHTML = '';
-            visibleCards.forEach(card => grid.appendChild(card));
-
-            // Add back hidden cards at the end
-            cards.filter(card => card.style.display === 'none')
-                 .forEach(card => grid.appendChild(card));
-        }}
-
-        function resetFilters() {{
-            document.getElementById('facets-min').value = '';
-            document.getElementById('facets-max').value = '';
-            document.getElementById('colors-min').value = '';
-            document.getElementById('colors-max').value = '';
-            document.getElementById('time-min').value = '';
-            document.getElementById('time-max').value = '';
-            document.getElementById('sort-by').value = 'index';
-            document.getElementById('sort-order').value = 'asc';
-
-            applyFiltersAndSort();
-        }}
-
-        function toggleComparisonMode() {{
-            comparisonMode = !comparisonMode;
-            const button = document.getElementById('toggle-comparison');
-            button.textContent = comparisonMode ?
-                'Disable Comparison' :
-                'Enable Comparison (select up to 4)';
-            button.style.background = comparisonMode ? '#e74c3c' : '#3498db';
-
-            if (!comparisonMode) {{
-                clearComparison();
-            }}
-        }}
-
-        function selectCard(card, event) {{
-            // Don't select if clicking on image (that opens modal)
-            if (event.target.tagName === 'IMG') {{
-                return;
-            }}
-
-            if (!comparisonMode) return;
-
-            const cardId = card.id;
-
-            if (selectedCards.has(cardId)) {{
-                selectedCards.delete(cardId);
-                card.classList.remove('selected');
-            }} else {{
-                if (selectedCards.size >= 4) {{
-                    alert('Maximum 4 variations can be compared');
-                    return;
-                }}
-                selectedCards.add(cardId);
-                card.classList.add('selected');
-            }}
-
-            updateComparison();
-        }}
-
-        function clearComparison() {{
-            selectedCards.clear();
-            document.querySelectorAll('.card').forEach(card => {{
-                card.classList.remove('selected');
-            }});
-            updateComparison();
-        }}
-
-        function updateComparison() {{
-            const section = document.getElementById('comparison-section');
-            const grid = document.getElementById('comparison-grid');
-
-            if (selectedCards.size === 0) {{
-                section.classList.remove('active');
-                return;
-            }}
-
-            section.classList.add('active');
-            grid.innerHTML = '';
-
-            selectedCards.forEach(cardId => {{
-                const originalCard = document.getElementById(cardId);
-                const clone = originalCard.cloneNode(true);
-                clone.classList.add('comparison-item');
-                clone.onclick = null;
-                grid.appendChild(clone);
-            }});
-        }}
-
-        // View mode toggle
-        let isListView = false;
-
-        function toggleViewMode() {{
-            isListView = !isListView;
-            const grid = document.getElementById('results-grid');
-            const button = document.getElementById('toggle-view');
-            const cards = grid.querySelectorAll('.card');
-
-            if (isListView) {{
-                grid.classList.add('list-view');
-                button.textContent = '🔲 Switch to Grid View';
-
-                // Switch to high-res SVG images for list view
-                cards.forEach(card => {{
-                    const img = card.querySelector('.card-image');
-                    const svgSrc = card.dataset.svgSrc;
-                    if (img && svgSrc) {{
-                        img.src = svgSrc;
-                    }}
-                }});
-            }} else {{
-                grid.classList.remove('list-view');
-                button.textContent = '📋 Switch to List View (larger images)';
-
-                // Switch back to PNG thumbnails for grid view
-                cards.forEach(card => {{
-                    const img = card.querySelector('.card-image');
-                    const pngSrc = card.dataset.pngSrc;
-                    if (img && pngSrc) {{
-                        img.src = pngSrc;
-                    }}
-                }});
-            }}
-        }}
-
-        // Modal navigation
-        let currentModalIndex = 0;
-        let visibleCards = [];
-
-        function getVisibleCards() {{
-            const grid = document.getElementById('results-grid');
-            return Array.from(grid.querySelectorAll('.card'))
-                .filter(card => card.style.display !== 'none');
-        }}
-
-        function openModal(event, src) {{
-            event.stopPropagation();
-
-            // Get the card element
-            const cardElement = event.target.closest('.card');
-
-            // Update visible cards list
-            visibleCards = getVisibleCards();
-
-            // Find current card index
-            currentModalIndex = visibleCards.findIndex(card => card === cardElement);
-
-            // Show modal
-            showModalImage(currentModalIndex);
-        }}
-
-        function showModalImage(index) {{
-            if (index < 0 || index >= visibleCards.length) return;
-
-            currentModalIndex = index;
-            const card = visibleCards[index];
-
-            // Update modal image
-            const modal = document.getElementById('image-modal');
-            const modalImg = document.getElementById('modal-image');
-
-            // Always use SVG for better quality in modal
-            const svgSrc = card.dataset.svgSrc;
-            if (svgSrc) {{
-                modalImg.src = svgSrc;
-            }}
-
-            // Update counter and title
-            const counter = document.getElementById('modal-counter');
-            const title = document.getElementById('modal-title');
-            const cardTitle = card.querySelector('.card-title');
-
-            counter.textContent = `${{index + 1}} / ${{visibleCards.length}}`;
-            title.textContent = cardTitle ? cardTitle.textContent : '';
-
-            // Update navigation button states
-            const prevBtn = document.querySelector('.modal-nav.prev');
-            const nextBtn = document.querySelector('.modal-nav.next');
-
-            prevBtn.classList.toggle('disabled', index === 0);
-            nextBtn.classList.toggle('disabled', index === visibleCards.length - 1);
-
-            modal.classList.add('active');
-        }}
-
-        function navigateModal(direction) {{
-            const newIndex = currentModalIndex + direction;
-            if (newIndex >= 0 && newIndex < visibleCards.length) {{
-                showModalImage(newIndex);
-            }}
-        }}
-
-        function closeModal() {{
-            const modal = document.getElementById('image-modal');
-            modal.classList.remove('active');
-        }}
-
-        // Keyboard shortcuts
-        document.addEventListener('keydown', (e) => {{
-            const modal = document.getElementById('image-modal');
-            const isModalOpen = modal.classList.contains('active');
-
-            if (e.key === 'Escape') {{
-                if (isModalOpen) {{
-                    closeModal();
-                }} else if (comparisonMode) {{
-                    toggleComparisonMode();
-                }}
-            }}
-
-            if (isModalOpen) {{
-                if (e.key === 'ArrowLeft' || e.key === 'ArrowUp') {{
-                    e.preventDefault();
-                    navigateModal(-1);
-                }}
-                if (e.key === 'ArrowRight' || e.key === 'ArrowDown') {{
-                    e.preventDefault();
-                    navigateModal(1);
-                }}
-            }}
-        }});
-    </script>"""
@@ -1,12 +1,36 @@
 """Generate parameter variations for exploration."""
 
 from itertools import product
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+import pickle
 import random
 from copy import deepcopy
 
+import numpy as np
+from numpy.typing import NDArray
+
 from .config import ExplorerConfig, ExplorationStrategy
 
+# Parameter values that can be shared between variations; a shallow dict
+# copy is enough when the baseline holds only these
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+
+# Swap proposals tried when improving a Latin hypercube design
+_MAXIMIN_ITERATIONS = 200
+
+# Short forms of common parameter names used in variation labels
+_LABEL_NAMES = {
+    "kMeansNrOfClusters": "clusters",
+    "kMeansClusteringColorSpace": "colorspace",
+    "kMeansMinDeltaDifference": "delta",
+    "removeFacetsSmallerThanNrOfPoints": "minfacet",
+    "maximumNumberOfFacets": "maxfacet",
+    "narrowPixelStripCleanupRuns": "cleanup",
+    "nrOfTimesToHalveBorderSegments": "smooth",
+    "resizeImageWidth": "width",
+    "resizeImageHeight": "height",
+}
+
 
 class VariationGenerator:
     """Generates parameter variations based on exploration strategy."""
@@ -14,47 +38,77 @@ class VariationGenerator:
     def __init__(self, config: ExplorerConfig):
         """Initialize with exploration configuration."""
         self.config = config
+        # Varied parameters in label order, with their short names
+        self._label_params = [
+            (name, self._shorten_param_name(name)) for name in sorted(config.vary)
+        ]
 
     def generate_variations(self) -> List[Dict[str, Any]]:
         """Generate all parameter variations based on strategy."""
+        return list(self.iter_variations())
+
+    def iter_variations(self) -> Iterator[Dict[str, Any]]:
+        """Yield the parameter variations one at a time.
+
+        Same variations, in the same order, as ``generate_variations()``,
+        without building the list; suited to feeding a process pool lazily.
+
+        Raises:
+            ValueError: If the strategy is unknown
+        """
         if self.config.strategy == ExplorationStrategy.GRID:
             return self._generate_grid_variations()
         elif self.config.strategy == ExplorationStrategy.STAR:
             return self._generate_star_variations()
         elif self.config.strategy == ExplorationStrategy.RANDOM:
             return self._generate_random_variations()
+        elif self.config.strategy == ExplorationStrategy.LATIN_HYPERCUBE:
+            return self._generate_latin_hypercube_variations()
         else:
             raise ValueError(f"Unknown strategy: {self.config.strategy}")
 
-    def _generate_grid_variations(self) -> List[Dict[str, Any]]:
-        """Generate all combinations of parameters (Cartesian product)."""
-        variations = []
+    def _base_variation(
+        self,
+    ) -> Tuple[Dict[str, Any], Callable[[Dict[str, Any]], Dict[str, Any]]]:
+        """Return the baseline with fixed parameters applied, and its copier.
+
+        Returns:
+            Tuple of (base parameters, function copying them). The copier is
+            ``dict.copy`` unless a value is a container (such as
+            ``kMeansColorRestrictions``), in which case it makes a deep copy.
+        """
+        base = deepcopy(self.config.baseline)
+        base.update(self.config.fixed)
+        copy: Callable[[Dict[str, Any]], Dict[str, Any]]
+        if all(isinstance(value, _IMMUTABLE_TYPES) for value in base.values()):
+            copy = dict.copy
+        else:
+            copy = _deep_copy_params
+        return base, copy
 
+    def _generate_grid_variations(self) -> Iterator[Dict[str, Any]]:
+        """Generate all combinations of parameters (Cartesian product)."""
         # Get parameter names and their values
         param_names = list(self.config.vary.keys())
         param_values = [self.config.vary[name] for name in param_names]
+        base, copy = self._base_variation()
 
         # Generate all combinations
         for combination in product(*param_values):
-            variation = deepcopy(self.config.baseline)
-            variation.update(self.config.fixed)
+            variation = copy(base)
 
             # Apply this combination
             for param_name, param_value in zip(param_names, combination):
                 variation[param_name] = param_value
 
-            variations.append(variation)
-
-        return variations
+            yield variation
 
-    def _generate_star_variations(self) -> List[Dict[str, Any]]:
+    def _generate_star_variations(self) -> Iterator[Dict[str, Any]]:
         """Generate variations by changing one parameter at a time from baseline."""
-        variations = []
-
-        # Start with baseline (center of the star)
-        baseline = deepcopy(self.config.baseline)
-        baseline.update(self.config.fixed)
-        variations.append(baseline)
+        # Start with baseline (center of the star). A copy is yielded: the
+        # other variations are copied from it after the caller has it.
+        baseline, copy = self._base_variation()
+        yield copy(baseline)
 
         # For each parameter, vary it while keeping others at baseline
         for param_name, param_values in self.config.vary.items():
@@ -67,29 +121,47 @@ class VariationGenerator:
                     continue
 
                 # Create variation with only this parameter changed
-                variation = deepcopy(baseline)
+                variation = copy(baseline)
                 variation[param_name] = value
-                variations.append(variation)
-
-        return variations
+                yield variation
 
-    def _generate_random_variations(self) -> List[Dict[str, Any]]:
+    def _generate_random_variations(self) -> Iterator[Dict[str, Any]]:
         """Generate random sampling of parameter combinations."""
-        variations = []
         param_names = list(self.config.vary.keys())
+        base, copy = self._base_variation()
 
         for _ in range(self.config.random_samples):
-            variation = deepcopy(self.config.baseline)
-            variation.update(self.config.fixed)
+            variation = copy(base)
 
             # Randomly select a value for each varied parameter
             for param_name in param_names:
                 param_values = self.config.vary[param_name]
                 variation[param_name] = random.choice(param_values)
 
-            variations.append(variation)
+            yield variation
 
-        return variations
+    def _generate_latin_hypercube_variations(self) -> Iterator[Dict[str, Any]]:
+        """Generate a maximin Latin hypercube sample of parameter combinations.
+
+        Each parameter's values are split into ``random_samples`` equal
+        strata, one sample per stratum, so every value is used about equally
+        often; independent random draws instead cluster and repeat
+        combinations when samples are few. Sampling is driven by the
+        ``random`` module, so ``random.seed()`` makes it reproducible.
+        """
+        param_names = list(self.config.vary.keys())
+        n_samples = self.config.random_samples
+        base, copy = self._base_variation()
+
+        rng = np.random.default_rng(random.getrandbits(64))
+        design = _maximin_latin_hypercube(n_samples, len(param_names), rng)
+
+        for row in design.tolist():
+            variation = copy(base)
+            for param_name, stratum in zip(param_names, row, strict=True):
+                param_values = self.config.vary[param_name]
+                variation[param_name] = param_values[stratum * len(param_values) // n_samples]
+            yield variation
 
     def get_variation_label(self, variation: Dict[str, Any], index: int) -> str:
         """Generate a descriptive label for a variation.
@@ -104,39 +176,24 @@ class VariationGenerator:
         # Start with index
         parts = [f"var_{index:03d}"]
 
-        # Add only the parameters that differ from baseline
+        # Add only the varied parameters that differ from baseline
         baseline = self.config.baseline
-        for param_name, param_value in sorted(variation.items()):
-            # Skip if not a varied parameter
-            if param_name not in self.config.vary:
+        for param_name, short_name in self._label_params:
+            if param_name not in variation:
                 continue
 
             # Skip if same as baseline
-            baseline_value = baseline.get(param_name)
-            if param_value == baseline_value:
+            param_value = variation[param_name]
+            if param_value == baseline.get(param_name):
                 continue
 
-            # Add to label (shorten common parameter names)
-            short_name = self._shorten_param_name(param_name)
-            short_value = self._format_param_value(param_value)
-            parts.append(f"{short_name}-{short_value}")
+            parts.append(f"{short_name}-{self._format_param_value(param_value)}")
 
         return "_".join(parts)
 
     def _shorten_param_name(self, name: str) -> str:
         """Shorten parameter names for labels."""
-        replacements = {
-            "kMeansNrOfClusters": "clusters",
-            "kMeansClusteringColorSpace": "colorspace",
-            "kMeansMinDeltaDifference": "delta",
-            "removeFacetsSmallerThanNrOfPoints": "minfacet",
-            "maximumNumberOfFacets": "maxfacet",
-            "narrowPixelStripCleanupRuns": "cleanup",
-            "nrOfTimesToHalveBorderSegments": "smooth",
-            "resizeImageWidth": "width",
-            "resizeImageHeight": "height",
-        }
-        return replacements.get(name, name)
+        return _LABEL_NAMES.get(name, name)
 
     def _format_param_value(self, value: Any) -> str:
         """Format parameter value for labels."""
@@ -166,3 +223,85 @@ class VariationGenerator:
                 differences[param_name] = (baseline_value, variation_value)
 
         return differences
+
+
+def _deep_copy_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Deep copy a parameter dict through a pickle round trip.
+
+    Parameter values are plain data (they are pickled to the worker
+    processes anyway), and for such small dicts this is about three times
+    faster than ``deepcopy``.
+    """
+    copied: Dict[str, Any] = pickle.loads(pickle.dumps(params, pickle.HIGHEST_PROTOCOL))
+    return copied
+
+
+def _maximin_latin_hypercube(
+    n_samples: int, n_dims: int, rng: np.random.Generator
+) -> NDArray[np.intp]:
+    """Build a Latin hypercube design with a large minimum point distance.
+
+    Starts from a random design and keeps the swaps (of two samples' strata
+    in one dimension) that do not shrink the smallest pairwise distance.
+    A swap only changes the distances of the two swapped rows, so each
+    proposal costs O(n_samples * n_dims); the full pairwise matrix is kept
+    and rescanned only when the current minimum distance disappears.
+
+    Args:
+        n_samples: Number of samples (strata per dimension)
+        n_dims: Number of dimensions
+        rng: Random generator
+
+    Returns:
+        Array of shape (n_samples, n_dims); each column is a permutation of
+        ``range(n_samples)``
+    """
+    design = rng.permuted(np.tile(np.arange(n_samples), (n_dims, 1)), axis=1).T
+    if n_samples < 3 or n_dims < 2:
+        # Every design is equally spread
+        return design
+
+    # Squared distances between rows (the diagonal never counts as the
+    # minimum), the smallest one, and how many pairs are at that distance
+    distances = _row_distances(design, np.arange(n_samples))
+    best = int(distances.min())
+    n_at_best = int(np.count_nonzero(distances == best)) // 2
+
+    for _ in range(_MAXIMIN_ITERATIONS):
+        dim = rng.integers(n_dims)
+        i, j = rng.choice(n_samples, size=2, replace=False)
+        design[[i, j], dim] = design[[j, i], dim]
+
+        # Pairs not involving i or j are unchanged and already >= best
+        rows = _row_distances(design, np.array([i, j]))
+        if rows.min() < best:
+            design[[i, j], dim] = design[[j, i], dim]
+            continue
+
+        # Pairs at the minimum that involve i or j: before and after the swap
+        # (the pair (i, j) itself appears in both rows)
+        old_rows = distances[[i, j]]
+        n_at_best -= int(np.count_nonzero(old_rows == best)) - int(old_rows[0, j] == best)
+        n_at_best += int(np.count_nonzero(rows == best)) - int(rows[0, j] == best)
+        distances[[i, j], :] = rows
+        distances[:, [i, j]] = rows.T
+
+        if n_at_best == 0:
+            best = int(distances.min())
+            n_at_best = int(np.count_nonzero(distances == best)) // 2
+    return design
+
+
+def _row_distances(design: NDArray[np.intp], rows: NDArray[np.intp]) -> NDArray[np.int64]:
+    """Return squared distances from the given rows of ``design`` to every row.
+
+    A row's distance to itself is set to the largest int64, so it is never
+    the minimum. Accumulated one dimension at a time, so no
+    (rows, n_samples, n_dims) difference array is built.
+    """
+    distances = np.zeros((len(rows), design.shape[0]), dtype=np.int64)
+    for dim in range(design.shape[1]):
+        diff = design[rows, dim, None] - design[None, :, dim]
+        distances += diff * diff
+    distances[np.arange(len(rows)), rows] = np.iinfo(np.int64).max
+    return distances
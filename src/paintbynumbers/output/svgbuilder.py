@@ -5,10 +5,8 @@ fills, strokes, labels, and smooth curves using quadratic Bezier paths.
 """
 
 from __future__ import annotations
-from typing import List, Tuple, Optional
-from xml.etree import ElementTree as ET
+from typing import Dict, Iterable, List, Tuple, Optional
 from paintbynumbers.processing.facetmanagement import FacetResult
-from paintbynumbers.structs.point import Point
 from paintbynumbers.core.types import RGB
 
 # SVG constants
@@ -16,6 +14,19 @@ DEFAULT_FONT_SIZE = 50
 DEFAULT_FONT_COLOR = "black"
 DEFAULT_STROKE_WIDTH = 1
 
+XML_DECLARATION = "<?xml version='1.0' encoding='utf-8'?>\n"
+
+# Same escaping as ElementTree applies to attribute values
+_ATTRIB_ESCAPES = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    '\r': '&#13;',
+    '\n': '&#10;',
+    '\t': '&#09;',
+})
+
 
 class SVGBuilder:
     """Builds SVG output from facet results.
@@ -64,95 +75,121 @@ class SVGBuilder:
             >>> with open('output.svg', 'w') as f:
             ...     f.write(svg_content)
         """
-        # Create root SVG element
-        svg = ET.Element('svg')
-        svg.set('xmlns', 'http://www.w3.org/2000/svg')
-        svg.set('width', str(int(size_multiplier * facet_result.width)))
-        svg.set('height', str(int(size_multiplier * facet_result.height)))
-        svg.set('viewBox', f'0 0 {int(size_multiplier * facet_result.width)} {int(size_multiplier * facet_result.height)}')
+        # OPTIMIZED: Markup is written straight into a list of strings and
+        # joined once, instead of building and serializing an ElementTree
+        width = int(size_multiplier * facet_result.width)
+        height = int(size_multiplier * facet_result.height)
+        svg_open = (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
+            f'height="{height}" viewBox="0 0 {width} {height}"'
+        )
+        parts: List[str] = [XML_DECLARATION, svg_open, '>']
+
+        # Facets are grouped by color: stroke and fill are set once on a <g>
+        # per color and inherited by its paths. With fill off every facet
+        # looks the same, so they all share one group.
+        groups: Dict[int, List[str]] = {}
+        labels: List[str] = []
 
         # Process each facet
         for f in facet_result.facets:
             if f is None or len(f.borderSegments) == 0:
                 continue
 
-            # Get full path from border segments
-            newpath = f.get_full_path_from_border_segments(use_walls=False)
+            # Stream the border path straight into SVG path data with quadratic
+            # Bezier curves for smoothness, without building a list of Points
+            path_data = SVGBuilder._create_path_data(
+                f.iter_path_points(use_walls=False), size_multiplier
+            )
 
-            if len(newpath) == 0:
+            if not path_data:
                 continue
 
-            # Close loop if necessary
-            if (newpath[0].x != newpath[-1].x or
-                newpath[0].y != newpath[-1].y):
-                newpath.append(Point(newpath[0].x, newpath[0].y))
-
-            # Create SVG path with quadratic Bezier curves for smoothness
-            path_data = SVGBuilder._create_path_data(newpath, size_multiplier)
-
-            # Create path element
-            path = ET.SubElement(svg, 'path')
-            path.set('data-facet-id', str(f.id))
-            path.set('d', path_data)
-
-            # Set stroke
-            if stroke:
-                path.set('stroke', '#000')
-            elif fill:
-                # Make border same color as fill to prevent gaps
-                rgb = colors_by_index[f.color]
-                path.set('stroke', f'rgb({rgb[0]},{rgb[1]},{rgb[2]})')
-            else:
-                path.set('stroke', 'none')
+            group_key = f.color if fill else 0
+            group = groups.get(group_key)
+            if group is None:
+                group = groups[group_key] = []
+            group.append(f'<path data-facet-id="{f.id}" d="{path_data}" />')
+
+            # Add label if requested
+            if add_color_labels:
+                SVGBuilder._add_label(labels, f, font_size, min_font_size, size_multiplier, label_start_number)
 
-            path.set('stroke-width', str(border_width))
+        if not groups:
+            # No content: self-closing root, as ElementTree writes it
+            return f'{XML_DECLARATION}{svg_open} />'
 
-            # Set fill
+        for color in sorted(groups):
             if fill:
-                rgb = colors_by_index[f.color]
-                path.set('fill', f'rgb({rgb[0]},{rgb[1]},{rgb[2]})')
+                # Format each palette color once rather than once per facet
+                rgb = colors_by_index[color]
+                fill_color = f'rgb({rgb[0]},{rgb[1]},{rgb[2]})'
+                # Without strokes, make the border the fill color to prevent gaps
+                stroke_color = '#000' if stroke else fill_color
             else:
-                path.set('fill', 'none')
+                fill_color = 'none'
+                stroke_color = '#000' if stroke else 'none'
 
-            # Add label if requested
-            if add_color_labels:
-                SVGBuilder._add_label(svg, f, font_size, min_font_size, font_color, size_multiplier, label_start_number)
+            parts.append(
+                f'<g stroke="{stroke_color}" stroke-width="{border_width}" fill="{fill_color}">'
+            )
+            parts.extend(groups[color])
+            parts.append('</g>')
 
-        # Convert to string
-        return SVGBuilder._element_to_string(svg)
+        # Labels go last, on top of every facet, sharing their text styling
+        if labels:
+            parts.append(
+                f'<g font-family="Tahoma" dominant-baseline="middle" text-anchor="middle" '
+                f'fill="{font_color.translate(_ATTRIB_ESCAPES)}">'
+            )
+            parts.extend(labels)
+            parts.append('</g>')
+
+        parts.append('</svg>')
+        return ''.join(parts)
 
     @staticmethod
-    def _create_path_data(path: List[Point], size_multiplier: float) -> str:
+    def _create_path_data(path: Iterable[Tuple[float, float]], size_multiplier: float) -> str:
         """Create SVG path data with quadratic Bezier curves.
 
         Uses quadratic curves (Q command) for smooth, natural-looking paths
         by placing control points at midpoints between consecutive points.
+        The path is closed back to its first point if it does not end there.
 
-        OPTIMIZED: Uses list comprehension and join instead of string concatenation.
+        OPTIMIZED: Consumes the points in a single pass and joins the parts
+        once, instead of indexing a list of Points and concatenating strings.
 
         Args:
-            path: List of points forming the path
+            path: (x, y) coordinates of the points forming the path
             size_multiplier: Scale factor
 
         Returns:
-            SVG path data string
+            SVG path data string, empty for an empty path
         """
-        if len(path) == 0:
+        points = iter(path)
+        first = next(points, None)
+        if first is None:
             return ""
 
-        # OPTIMIZED: Build path parts as list then join (much faster than string concatenation)
-        parts = [f"M {path[0].x * size_multiplier} {path[0].y * size_multiplier}"]
+        first_x, first_y = first
+        parts = [f"M {first_x * size_multiplier} {first_y * size_multiplier}"]
 
-        # Add quadratic Bezier curves
-        for i in range(1, len(path)):
-            # Control point is at midpoint between consecutive points
-            midpoint_x = (path[i].x + path[i - 1].x) / 2
-            midpoint_y = (path[i].y + path[i - 1].y) / 2
+        # Add quadratic Bezier curves; the control point is at the midpoint
+        # between consecutive points: Q control_x control_y end_x end_y
+        prev_x, prev_y = first_x, first_y
+        for x, y in points:
+            parts.append(
+                f"Q {(x + prev_x) / 2 * size_multiplier} {(y + prev_y) / 2 * size_multiplier} "
+                f"{x * size_multiplier} {y * size_multiplier}"
+            )
+            prev_x, prev_y = x, y
 
-            # Q control_x control_y end_x end_y
+        # Close loop if necessary
+        if prev_x != first_x or prev_y != first_y:
             parts.append(
-                f"Q {midpoint_x * size_multiplier} {midpoint_y * size_multiplier} "
-                f"{path[i].x * size_multiplier} {path[i].y * size_multiplier}"
+                f"Q {(first_x + prev_x) / 2 * size_multiplier} "
+                f"{(first_y + prev_y) / 2 * size_multiplier} "
+                f"{first_x * size_multiplier} {first_y * size_multiplier}"
             )
 
         # Close path
@@ -162,22 +199,21 @@ class SVGBuilder:
 
     @staticmethod
     def _add_label(
-        svg: ET.Element,
+        parts: List[str],
         facet,
         font_size: int,
         min_font_size: Optional[float],
-        font_color: str,
         size_multiplier: float,
         label_start_number: int = 0
     ) -> None:
         """Add color label to SVG.
 
         Args:
-            svg: Parent SVG element
+            parts: Label markup being built; the text element is appended.
+                Font family, alignment and color come from the enclosing group.
             facet: Facet to add label for
             font_size: Font size
             min_font_size: Minimum font size (None = no minimum)
-            font_color: Font color
             size_multiplier: Scale factor
             label_start_number: Starting number for labels (default: 0)
         """
@@ -206,31 +242,7 @@ class SVGBuilder:
             final_font_size = max(final_font_size, min_font_size)
 
         # Create text element
-        text = ET.SubElement(svg, 'text')
-        text.set('x', str(label_x * size_multiplier))
-        text.set('y', str(label_y * size_multiplier))
-        text.set('font-family', 'Tahoma')
-        text.set('font-size', str(final_font_size * size_multiplier))
-        text.set('dominant-baseline', 'middle')
-        text.set('text-anchor', 'middle')
-        text.set('fill', font_color)
-        text.text = label_text
-
-    @staticmethod
-    def _element_to_string(element: ET.Element) -> str:
-        """Convert ElementTree element to string.
-
-        Args:
-            element: XML element
-
-        Returns:
-            XML string with declaration
-        """
-        # Create tree and convert to string
-        tree = ET.ElementTree(element)
-
-        # Write to string with XML declaration
-        import io
-        output = io.BytesIO()
-        tree.write(output, encoding='utf-8', xml_declaration=True)
-        return output.getvalue().decode('utf-8')
+        parts.append(
+            f'<text x="{label_x * size_multiplier}" y="{label_y * size_multiplier}" '
+            f'font-size="{final_font_size * size_multiplier}">{label_text}</text>'
+        )
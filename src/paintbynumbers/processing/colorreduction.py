@@ -5,7 +5,7 @@ of color maps that assign each pixel to a color index.
 """
 
 from __future__ import annotations
-from typing import List, Dict, Tuple
+from typing import List, MutableSequence, Sequence, Tuple
 import numpy as np
 from numpy.typing import NDArray
 
@@ -13,10 +13,74 @@ from paintbynumbers.core.types import RGB
 from paintbynumbers.core.settings import Settings, ClusteringColorSpace
 from paintbynumbers.structs.typed_arrays import Uint8Array2D
 from paintbynumbers.algorithms.kmeans import KMeans
-from paintbynumbers.algorithms.vector import Vector
+from paintbynumbers.algorithms.vector import VectorStore
 from paintbynumbers.utils.random import Random
 from paintbynumbers.utils.color import rgb_to_hsl, hsl_to_rgb, rgb_to_lab, lab_to_rgb
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _narrow_strip_kernel(
+    indices: MutableSequence[int],
+    width: int,
+    height: int,
+    distances: Sequence[float],
+    n_colors: int
+) -> int:
+    """Replace narrow pixel strips in place on flat row-major color indices.
+
+    Plain indexing only, so the same code runs on Python lists or, compiled
+    with Numba, on NumPy arrays. Pixels are updated as they are visited, so
+    later pixels see the replaced colors of earlier ones.
+
+    Args:
+        indices: Color index of each pixel (modified in place)
+        width: Image width
+        height: Image height
+        distances: Flat (n_colors * n_colors) color distance matrix
+        n_colors: Number of colors
+
+    Returns:
+        Number of pixels replaced
+    """
+    count = 0
+    for j in range(1, height - 1):
+        row = j * width
+        for i in range(1, width - 1):
+            idx = row + i
+            cur = indices[idx]
+            top = indices[idx - width]
+            bottom = indices[idx + width]
+            left = indices[idx - 1]
+            right = indices[idx + 1]
+
+            if cur != top and cur != bottom and cur != left and cur != right:
+                # Single pixel - skip for now
+                pass
+            elif cur != top and cur != bottom:
+                # Horizontally isolated
+                if distances[cur * n_colors + top] < distances[cur * n_colors + bottom]:
+                    indices[idx] = top
+                else:
+                    indices[idx] = bottom
+                count += 1
+            elif cur != left and cur != right:
+                # Vertically isolated
+                if distances[cur * n_colors + left] < distances[cur * n_colors + right]:
+                    indices[idx] = left
+                else:
+                    indices[idx] = right
+                count += 1
+    return count
+
+
+if NUMBA_AVAILABLE:
+    _narrow_strip_kernel_jit = njit(cache=True)(_narrow_strip_kernel)
+
 
 class ColorMapResult:
     """Result of color map creation.
@@ -67,29 +131,27 @@ class ColorReducer:
             >>> result = ColorReducer.create_color_map(img_data, 100, 100)
             >>> print(f"Found {len(result.colorsByIndex)} unique colors")
         """
-        # OPTIMIZED: Use NumPy vectorization for 10-100x speedup
-        # Reshape image to (height*width, 3) for processing
-        pixels_flat = img_data.reshape(-1, 3)
+        # OPTIMIZED: Pack each pixel into a single uint32 (r<<16 | g<<8 | b) so
+        # np.unique sorts plain integers instead of rows (axis=0). Packed order
+        # is the same as row-wise RGB order, so color indices are unchanged.
+        pixels = img_data.reshape(-1, 3).astype(np.uint32)
+        packed = (pixels[:, 0] << 16) | (pixels[:, 1] << 8) | pixels[:, 2]
 
-        # Find unique colors and their inverse mapping (indices)
-        # unique_colors: array of unique RGB tuples
+        # unique_packed: sorted unique colors
         # indices: maps each pixel to its unique color index
-        unique_colors, indices = np.unique(pixels_flat, axis=0, return_inverse=True)
+        unique_packed, indices = np.unique(packed, return_inverse=True)
 
-        # Reshape indices back to 2D image shape
-        indices_2d = indices.reshape(height, width).astype(np.uint8)
-
-        # Create Uint8Array2D from numpy array
+        # Fill the color index map in one call rather than pixel by pixel
         img_color_indices = Uint8Array2D(width, height)
-        for j in range(height):
-            for i in range(width):
-                img_color_indices.set(i, j, int(indices_2d[j, i]))
+        img_color_indices.set_buffer(indices.astype(np.uint8))
 
-        # Convert unique colors to list of RGB tuples
-        colors_by_index: List[RGB] = [
-            (int(color[0]), int(color[1]), int(color[2]))
-            for color in unique_colors
-        ]
+        # Unpack unique colors to list of RGB tuples
+        colors_by_index: List[RGB] = list(zip(
+            ((unique_packed >> 16) & 0xFF).tolist(),
+            ((unique_packed >> 8) & 0xFF).tolist(),
+            (unique_packed & 0xFF).tolist(),
+            strict=True,
+        ))
 
         result = ColorMapResult()
         result.imgColorIndices = img_color_indices
@@ -129,24 +191,20 @@ class ColorReducer:
         # Reduce bit depth for color grouping
         img_reduced = (img_data >> bits_to_chop_off) << bits_to_chop_off
 
-        # Reshape to (height*width, 3) and find unique colors with counts
-        pixels_flat = img_reduced.reshape(-1, 3)
-        unique_colors, inverse_indices, counts = np.unique(
-            pixels_flat, axis=0, return_inverse=True, return_counts=True
+        # Pack each pixel into a single uint32 (r<<16 | g<<8 | b) and find the
+        # unique colors with counts; packed order matches row-wise RGB order
+        pixels = img_reduced.reshape(-1, 3).astype(np.uint32)
+        packed = (pixels[:, 0] << 16) | (pixels[:, 1] << 8) | pixels[:, 2]
+        unique_packed, inverse_indices, counts = np.unique(
+            packed, return_inverse=True, return_counts=True
         )
+        unique_colors = np.column_stack((
+            (unique_packed >> 16) & 0xFF, (unique_packed >> 8) & 0xFF, unique_packed & 0xFF
+        ))
 
-        # Build pixel position lookup for each unique color
-        # This is needed for updating the output image later
-        points_by_color: Dict[Tuple[int, int, int], List[int]] = {}
-        for i, color_idx in enumerate(inverse_indices):
-            color_tuple = tuple(unique_colors[color_idx])
-            if color_tuple not in points_by_color:
-                points_by_color[color_tuple] = []
-            points_by_color[color_tuple].append(i)
-
-        # Build vectors for K-means
+        # Build vectors for K-means (contiguous storage, one row per color)
         total_pixels = width * height
-        vectors: List[Vector] = []
+        vectors = VectorStore(dimensions=3)
 
         for color, count in zip(unique_colors, counts):
             r, g, b = int(color[0]), int(color[1]), int(color[2])
@@ -163,16 +221,15 @@ class ColorReducer:
             else:
                 data = [float(r), float(g), float(b)]
 
-            # Weight by frequency
+            # Weight by frequency, store original RGB as tuple tag
             weight = float(count) / total_pixels
-
-            vec = Vector(data, weight)
-            vec.tag = (r, g, b)  # Store original RGB as tuple
-            vectors.append(vec)
+            vectors.add(data, weight, (r, g, b))
 
         # Run K-means
         random = Random(settings.randomSeed)
-        kmeans = KMeans(vectors, settings.kMeansNrOfClusters, random)
+        kmeans = KMeans(
+            vectors, settings.kMeansNrOfClusters, random, n_threads=settings.kMeansThreads
+        )
 
         # Iterate until convergence
         kmeans.step()
@@ -183,8 +240,7 @@ class ColorReducer:
         output_data = ColorReducer._update_kmeans_output_image_data(
             kmeans,
             settings,
-            points_by_color,
-            img_data,
+            inverse_indices,
             width,
             height
         )
@@ -195,8 +251,7 @@ class ColorReducer:
     def _update_kmeans_output_image_data(
         kmeans: KMeans,
         settings: Settings,
-        points_by_color: Dict[str, List[int]],
-        img_data: NDArray[np.uint8],
+        inverse_indices: NDArray[np.intp],
         width: int,
         height: int
     ) -> NDArray[np.uint8]:
@@ -205,49 +260,41 @@ class ColorReducer:
         Args:
             kmeans: Trained K-means object
             settings: Settings
-            points_by_color: Mapping of colors to pixel indices
-            img_data: Original image data
+            inverse_indices: Index of each pixel's color among the clustered
+                colors (the K-means points, in order)
             width: Image width
             height: Image height
 
         Returns:
             Updated image data with reduced colors
         """
-        output_data = np.zeros((height, width, 3), dtype=np.uint8)
-
-        for c in range(len(kmeans.centroids)):
-            centroid = kmeans.centroids[c]
-
-            # For each cluster
-            for v in kmeans.points_per_category[c]:
-                # Convert centroid back to RGB
-                if settings.kMeansClusteringColorSpace == ClusteringColorSpace.RGB:
-                    rgb = centroid.values
-                elif settings.kMeansClusteringColorSpace == ClusteringColorSpace.HSL:
-                    hsl_values = centroid.values
-                    rgb_tuple = hsl_to_rgb(hsl_values[0], hsl_values[1], hsl_values[2])
-                    rgb = [rgb_tuple[0], rgb_tuple[1], rgb_tuple[2]]  # r, g, b
-                elif settings.kMeansClusteringColorSpace == ClusteringColorSpace.LAB:
-                    lab_values = centroid.values
-                    rgb_tuple = lab_to_rgb(lab_values[0], lab_values[1], lab_values[2])
-                    rgb = [rgb_tuple[0], rgb_tuple[1], rgb_tuple[2]]  # r, g, b
-                else:
-                    rgb = centroid.values
-
-                # Remove decimals
-                rgb = [int(val) for val in rgb]
+        if kmeans.labels is None:
+            return np.zeros((height, width, 3), dtype=np.uint8)
 
-                # Get original color from vector tag (already a tuple)
-                point_rgb = v.tag
+        # OPTIMIZED: Convert each centroid back to RGB once, then map every
+        # clustered color and every pixel through lookup tables
+        centroid_rgb: List[List[int]] = []
+        for centroid in kmeans.centroids:
+            if settings.kMeansClusteringColorSpace == ClusteringColorSpace.RGB:
+                rgb = centroid.values
+            elif settings.kMeansClusteringColorSpace == ClusteringColorSpace.HSL:
+                hsl_values = centroid.values
+                rgb_tuple = hsl_to_rgb(hsl_values[0], hsl_values[1], hsl_values[2])
+                rgb = [rgb_tuple[0], rgb_tuple[1], rgb_tuple[2]]  # r, g, b
+            elif settings.kMeansClusteringColorSpace == ClusteringColorSpace.LAB:
+                lab_values = centroid.values
+                rgb_tuple = lab_to_rgb(lab_values[0], lab_values[1], lab_values[2])
+                rgb = [rgb_tuple[0], rgb_tuple[1], rgb_tuple[2]]  # r, g, b
+            else:
+                rgb = centroid.values
 
-                # Replace all pixels of the old color with new centroid color
-                for pt in points_by_color[point_rgb]:
-                    ptx = pt % width
-                    pty = pt // width
-                    output_data[pty, ptx, 0] = rgb[0]
-                    output_data[pty, ptx, 1] = rgb[1]
-                    output_data[pty, ptx, 2] = rgb[2]
+            # Remove decimals
+            centroid_rgb.append([int(val) for val in rgb])
 
+        # Cluster color of each clustered color, then of each pixel
+        palette = np.array(centroid_rgb, dtype=np.int64).astype(np.uint8)
+        color_rgb = palette[kmeans.labels]
+        output_data: NDArray[np.uint8] = color_rgb[inverse_indices].reshape(height, width, 3)
         return output_data
 
     @staticmethod
@@ -267,22 +314,20 @@ class ColorReducer:
             >>> matrix = ColorReducer.build_color_distance_matrix(colors)
             >>> print(f"Distance red to green: {matrix[0][1]:.2f}")
         """
-        n = len(colors_by_index)
-        color_distances: List[List[float]] = [[0.0] * n for _ in range(n)]
-
-        for j in range(n):
-            for i in range(j, n):
-                c1 = colors_by_index[j]
-                c2 = colors_by_index[i]
-                distance = ((c1[0] - c2[0]) ** 2 +
-                           (c1[1] - c2[1]) ** 2 +
-                           (c1[2] - c2[2]) ** 2) ** 0.5
-
-                color_distances[i][j] = distance
-                color_distances[j][i] = distance
-
+        # OPTIMIZED: Computed with NumPy broadcasting, converted to nested lists once
+        color_distances: List[List[float]] = (
+            ColorReducer._color_distance_array(colors_by_index).tolist()
+        )
         return color_distances
 
+    @staticmethod
+    def _color_distance_array(colors_by_index: List[RGB]) -> NDArray[np.float64]:
+        """Vectorized Euclidean distance matrix as a (K, K) array."""
+        colors_array = np.asarray(colors_by_index, dtype=np.float64).reshape(-1, 3)
+        diff = colors_array[:, None, :] - colors_array[None, :, :]
+        distances: NDArray[np.float64] = np.sqrt(np.einsum('ijk,ijk->ij', diff, diff))
+        return distances
+
     @staticmethod
     def process_narrow_pixel_strip_cleanup(color_map_result: ColorMapResult) -> int:
         """Remove narrow pixel strips by merging with closest neighbor color.
@@ -308,37 +353,25 @@ class ColorReducer:
             return 0
 
         # Build vectorized color distance matrix using NumPy
-        colors_array = np.asarray(color_map_result.colorsByIndex, dtype=np.float64)
-        diff = colors_array[:, None, :] - colors_array[None, :, :]
-        color_distances = np.sqrt(np.einsum('ijk,ijk->ij', diff, diff))
+        color_distances = ColorReducer._color_distance_array(color_map_result.colorsByIndex)
 
-        count = 0
+        # OPTIMIZED: The scan runs as a compiled kernel on the index array when
+        # Numba is installed, otherwise on plain Python lists (much cheaper to
+        # index than NumPy scalars)
         img_color_indices = color_map_result.imgColorIndices
+        width = color_map_result.width
+        height = color_map_result.height
 
-        for j in range(1, color_map_result.height - 1):
-            for i in range(1, color_map_result.width - 1):
-                top = img_color_indices.get(i, j - 1)
-                bottom = img_color_indices.get(i, j + 1)
-                left = img_color_indices.get(i - 1, j)
-                right = img_color_indices.get(i + 1, j)
-                cur = img_color_indices.get(i, j)
-
-                if cur != top and cur != bottom and cur != left and cur != right:
-                    # Single pixel - skip for now
-                    pass
-                elif cur != top and cur != bottom:
-                    # Horizontally isolated
-                    top_color_distance = color_distances[cur, top]
-                    bottom_color_distance = color_distances[cur, bottom]
-                    new_color = top if top_color_distance < bottom_color_distance else bottom
-                    img_color_indices.set(i, j, new_color)
-                    count += 1
-                elif cur != left and cur != right:
-                    # Vertically isolated
-                    left_color_distance = color_distances[cur, left]
-                    right_color_distance = color_distances[cur, right]
-                    new_color = left if left_color_distance < right_color_distance else right
-                    img_color_indices.set(i, j, new_color)
-                    count += 1
+        if NUMBA_AVAILABLE:
+            return int(_narrow_strip_kernel_jit(
+                img_color_indices._arr, width, height, color_distances.ravel(), n_colors
+            ))
+
+        indices = img_color_indices._arr.tolist()
+        count = _narrow_strip_kernel(
+            indices, width, height, color_distances.ravel().tolist(), n_colors
+        )
+        if count:
+            img_color_indices.set_buffer(np.array(indices, dtype=np.uint8))
 
         return count
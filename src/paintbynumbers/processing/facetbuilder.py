@@ -5,12 +5,14 @@ more modular and easier to test.
 """
 
 from __future__ import annotations
-from typing import List, Set
+from typing import List, Optional, Set
+import numpy as np
+from numpy.typing import NDArray
 from paintbynumbers.structs.point import Point
 from paintbynumbers.structs.boundingbox import BoundingBox
 from paintbynumbers.structs.typed_arrays import BooleanArray2D, Uint8Array2D
 from paintbynumbers.algorithms.flood_fill import FloodFillAlgorithm
-from paintbynumbers.utils.boundary import get_neighbors_4
+from paintbynumbers.utils.boundary import inner_point_mask
 from paintbynumbers.processing.facetmanagement import Facet, FacetResult
 
 
@@ -47,7 +49,8 @@ class FacetBuilder:
         y: int,
         visited: BooleanArray2D,
         img_color_indices: Uint8Array2D,
-        facet_result: FacetResult
+        facet_result: FacetResult,
+        inner_mask: Optional[NDArray[np.bool_]] = None
     ) -> Facet:
         """Build a single facet starting from a given point.
 
@@ -66,6 +69,9 @@ class FacetBuilder:
             visited: 2D array tracking visited pixels
             img_color_indices: 2D array of color indices
             facet_result: Result container to update
+            inner_mask: ``inner_point_mask()`` of ``img_color_indices``, when
+                building many facets from the same image. Without it each
+                pixel's neighbors are checked individually.
 
         Returns:
             Newly created facet
@@ -86,25 +92,33 @@ class FacetBuilder:
         facet.borderPoints = []
         facet.neighbourFacetsIsDirty = True
         facet.neighbourFacets = None
+        # OPTIMIZED: Direct access to the underlying arrays; both callbacks run
+        # for every pixel, so the typed-array get/set calls add up
+        width = img_color_indices.width
+        visited_arr = visited._arr
+        color_arr = img_color_indices._arr
+        facet_map_arr = facet_result.facetMap._arr  # type: ignore
 
         def should_include(ptx: int, pty: int) -> bool:
             """Check if pixel should be included in facet."""
-            if visited.get(ptx, pty):
-                return False
-            if img_color_indices.get(ptx, pty) != facet_color_index:
-                return False
-            return True
+            idx = pty * width + ptx
+            return not visited_arr[idx] and color_arr[idx] == facet_color_index
 
         def on_fill(ptx: int, pty: int) -> None:
             """Callback for each filled pixel."""
+            idx = pty * width + ptx
+
             # Mark as visited
-            visited.set(ptx, pty, True)
-            facet_result.facetMap.set(ptx, pty, facet_index)  # type: ignore
+            visited_arr[idx] = 1
+            facet_map_arr[idx] = facet_index
             facet.pointCount += 1
 
             # Determine if this is a border point
             # A point is a border point if any of its 4-neighbors has a different color
-            is_inner_point = img_color_indices.match_all_around(ptx, pty, facet_color_index)
+            if inner_mask is not None:
+                is_inner_point = inner_mask[idx]
+            else:
+                is_inner_point = img_color_indices.match_all_around(ptx, pty, facet_color_index)
             if not is_inner_point:
                 facet.borderPoints.append(Point(ptx, pty))
 
@@ -162,6 +176,7 @@ class FacetBuilder:
         """
         visited = BooleanArray2D(width, height)
         facets: List[Facet] = []
+        inner_mask = inner_point_mask(img_color_indices._arr, width, height)
 
         for j in range(height):
             for i in range(width):
@@ -176,7 +191,8 @@ class FacetBuilder:
                         j,
                         visited,
                         img_color_indices,
-                        facet_result
+                        facet_result,
+                        inner_mask
                     )
 
                     facets.append(facet)
@@ -5,7 +5,7 @@ of pixels with the same color) throughout the processing pipeline.
 """
 
 from __future__ import annotations
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 from paintbynumbers.structs.point import Point
 from paintbynumbers.structs.boundingbox import BoundingBox
 from paintbynumbers.structs.typed_arrays import Uint32Array2D
@@ -68,37 +68,47 @@ class Facet:
             >>> print(len(path))
             100
         """
-        newpath: List[Point] = []
+        return [Point(x, y) for x, y in self.iter_path_points(use_walls)]
 
-        def add_point(pt: PathPoint) -> None:
-            if use_walls:
-                newpath.append(Point(pt.get_wall_x(), pt.get_wall_y()))
-            else:
-                newpath.append(Point(pt.x, pt.y))
+    def iter_path_points(self, use_walls: bool = False) -> Iterator[Tuple[float, float]]:
+        """Yield the coordinates of the full path from border segments.
+
+        Same points, in the same order, as
+        ``get_full_path_from_border_segments()``, as (x, y) tuples and without
+        building the list; suited to writing the path out in a single pass.
+
+        Args:
+            use_walls: If True, use wall coordinates (±0.5). If False, use pixel centers.
 
+        Yields:
+            (x, y) coordinates along the border path
+        """
         last_segment: Optional[FacetBoundarySegment] = None
 
         for seg in self.borderSegments:
+            points = seg.originalSegment.points
+
             # Fix for continuity: repeat transition points between segments
             # to prevent holes when rendered
             if last_segment is not None:
-                if last_segment.reverseOrder:
-                    add_point(last_segment.originalSegment.points[0])
+                last_points = last_segment.originalSegment.points
+                pt = last_points[0] if last_segment.reverseOrder else last_points[-1]
+                if use_walls:
+                    yield pt.get_wall_x(), pt.get_wall_y()
                 else:
-                    add_point(last_segment.originalSegment.points[-1])
+                    yield pt.x, pt.y
 
             # Add all points from this segment (in correct order)
-            for i in range(len(seg.originalSegment.points)):
-                if seg.reverseOrder:
-                    idx = len(seg.originalSegment.points) - 1 - i
-                else:
-                    idx = i
-                add_point(seg.originalSegment.points[idx])
+            ordered = reversed(points) if seg.reverseOrder else points
+            if use_walls:
+                for pt in ordered:
+                    yield pt.get_wall_x(), pt.get_wall_y()
+            else:
+                for pt in ordered:
+                    yield pt.x, pt.y
 
             last_segment = seg
 
-        return newpath
-
     def __repr__(self) -> str:
         """Return string representation of facet."""
         return (f"Facet(id={self.id}, color={self.color}, "
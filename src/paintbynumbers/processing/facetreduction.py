@@ -15,6 +15,7 @@ from paintbynumbers.structs.point import Point
 from paintbynumbers.structs.typed_arrays import BooleanArray2D, Uint8Array2D
 from paintbynumbers.processing.facetmanagement import Facet, FacetResult
 from paintbynumbers.processing.facetbuilder import FacetBuilder
+from paintbynumbers.utils.boundary import inner_point_mask
 
 RGB = Tuple[int, int, int]
 
@@ -390,6 +391,12 @@ class FacetReducer:
                     if n_id not in removed_facets:
                         all_affected.add(n_id)
 
+        # The color indices stay fixed while rebuilding, so classify every
+        # pixel as inner or border once
+        inner_mask = inner_point_mask(
+            img_color_indices._arr, img_color_indices.width, img_color_indices.height
+        )
+
         # Rebuild each affected facet once
         for fid in all_affected:
             facet = facets[fid]
@@ -414,7 +421,8 @@ class FacetReducer:
                 bp.y,
                 visited_cache,
                 img_color_indices,
-                facet_result
+                facet_result,
+                inner_mask
             )
 
             facets[fid] = new_facet
@@ -4,11 +4,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Point:
     """Represents a 2D point with integer coordinates.
 
     This class is immutable (frozen) to allow use as dictionary keys and in sets.
+    Instances have no ``__dict__``: facet borders hold one point per boundary
+    pixel, so the per-instance size adds up.
 
     Attributes:
         x: X coordinate
@@ -105,6 +105,23 @@ class Uint8Array2D:
         """
         self._arr[y * self.width + x] = value
 
+    def set_buffer(self, values: NDArray[np.uint8]) -> None:
+        """Set every value at once from an array in row-major order.
+
+        Args:
+            values: Array of width * height values, flat or shaped (height, width)
+
+        Raises:
+            ValueError: If values does not hold width * height elements
+        """
+        values = np.asarray(values)
+        if values.size != self._arr.size:
+            raise ValueError(
+                f"Expected {self._arr.size} values for a {self.width}x{self.height} array, "
+                f"got {values.size}"
+            )
+        self._arr[:] = values.reshape(-1)
+
     def match_all_around(self, x: int, y: int, value: int) -> bool:
         """Check if all 4 orthogonal neighbors match a value.
 
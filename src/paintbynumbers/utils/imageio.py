@@ -44,24 +44,29 @@ def load_image(file_path: str, max_width: Optional[int] = None, max_height: Opti
     # Load image
     img = Image.open(file_path)
 
-    # Convert to RGB (handles RGBA, grayscale, etc.)
-    img = img.convert('RGB')
+    # Compute the target size from the full-resolution dimensions
+    width, height = img.size
+    new_width, new_height = width, height
+
+    if max_width is not None and width > max_width:
+        new_width = max_width
+        new_height = int(height * (max_width / width))
 
-    # Resize if necessary
-    if max_width is not None or max_height is not None:
-        width, height = img.size
-        new_width, new_height = width, height
+    if max_height is not None and new_height > max_height:
+        new_height = max_height
+        new_width = int(new_width * (max_height / new_height))
 
-        if max_width is not None and width > max_width:
-            new_width = max_width
-            new_height = int(height * (max_width / width))
+    resize = (new_width, new_height) != (width, height)
+    if resize:
+        # Lets the JPEG decoder scale by 1/2, 1/4 or 1/8 while decoding, to
+        # a size no smaller than the target; a no-op for other formats
+        img.draft('RGB', (new_width, new_height))
 
-        if max_height is not None and new_height > max_height:
-            new_height = max_height
-            new_width = int(new_width * (max_height / new_height))
+    # Convert to RGB (handles RGBA, grayscale, etc.)
+    img = img.convert('RGB')
 
-        if (new_width, new_height) != (width, height):
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    if resize:
+        img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
     # Convert to NumPy array
     img_array = np.array(img, dtype=np.uint8)
@@ -78,7 +83,9 @@ def image_to_flat_array(img_array: NDArray[np.uint8]) -> NDArray[np.uint8]:
         img_array: NumPy array of shape (height, width, 3)
 
     Returns:
-        Flat NumPy array of shape (height * width * 3,)
+        Flat NumPy array of shape (height * width * 3,). This is a view of
+        ``img_array`` when it is contiguous (as from ``load_image``), so
+        copy it before modifying it independently.
 
     Example:
         >>> img = np.zeros((100, 100, 3), dtype=np.uint8)
@@ -86,7 +93,7 @@ def image_to_flat_array(img_array: NDArray[np.uint8]) -> NDArray[np.uint8]:
         >>> flat.shape
         (30000,)
     """
-    return img_array.flatten()
+    return img_array.ravel()
 
 
 def flat_array_to_image(flat_array: NDArray[np.uint8], width: int, height: int) -> NDArray[np.uint8]:
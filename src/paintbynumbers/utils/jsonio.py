@@ -0,0 +1,130 @@
+"""JSON file helpers for settings and explorer configuration files.
+
+Uses orjson when it is installed (``pip install paintbynumbers[speedups]``)
+and falls back to the standard library ``json`` module otherwise. Both
+paths write the same layout, either two-space indented or compact.
+"""
+
+from __future__ import annotations
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def read_json(file_path: Union[str, Path]) -> Any:
+    """Load a JSON document from a file.
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        The decoded JSON value (usually a dict)
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ValueError: If the file is not valid JSON
+
+    Example:
+        >>> data = read_json('settings.json')
+        >>> data['kMeansNrOfClusters']
+        16
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(Path(file_path).read_bytes())
+    return json.loads(Path(file_path).read_text())
+
+
+def dumps_json(data: Any, indent: bool = False) -> str:
+    """Encode a value as a JSON string.
+
+    Args:
+        data: JSON-serializable value (NumPy scalars and arrays are accepted)
+        indent: Pretty-print with two-space indentation; compact otherwise
+
+    Example:
+        >>> dumps_json({'facets': 120, 'colors': 16})
+        '{"facets":120,"colors":16}'
+    """
+    return _dumps(data, indent).decode('utf-8')
+
+
+def write_json(data: Any, file_path: Union[str, Path], indent: bool = True) -> None:
+    """Write a value to a file as JSON.
+
+    Args:
+        data: JSON-serializable value (NumPy scalars and arrays are accepted)
+        file_path: Destination path (overwritten if it exists)
+        indent: Pretty-print with two-space indentation. Pass False for
+            machine-read files; compact output keeps the stdlib encoder
+            on its C fast path.
+
+    Example:
+        >>> write_json(Settings().to_json(), 'settings.json')
+        >>> write_json(metadata, 'metadata.json', indent=False)
+    """
+    Path(file_path).write_bytes(_dumps(data, indent))
+
+
+def write_json_streamed(
+    data: Dict[str, Any],
+    list_key: str,
+    items: Iterable[Any],
+    file_path: Union[str, Path],
+) -> None:
+    """Write a dict plus one list-valued key, encoding the list item by item.
+
+    The output is identical to ``write_json({**data, list_key: list(items)})``
+    with indentation, but the items are encoded and written one at a time,
+    so a long list never has to exist in memory as objects or as one string.
+
+    Args:
+        data: JSON-serializable dict written before the list
+        list_key: Key of the streamed list, written last (must not be in
+            ``data``)
+        items: JSON-serializable values; may be a generator
+        file_path: Destination path (overwritten if it exists)
+
+    Example:
+        >>> entries = (r.to_dict() for r in results)
+        >>> write_json_streamed(header, 'variations', entries, 'summary.json')
+    """
+    head = _dumps({**data, list_key: []}, True)
+    # Keep everything before the empty list, which is the last value
+    head = head[:head.rindex(b'[]')]
+
+    with open(file_path, 'wb') as f:
+        f.write(head + b'[')
+        first = True
+        for item in items:
+            f.write(b'\n    ' if first else b',\n    ')
+            f.write(_dumps(item, True).replace(b'\n', b'\n    '))
+            first = False
+        f.write(b']\n}' if first else b'\n  ]\n}')
+
+
+def _dumps(data: Any, indent: bool) -> bytes:
+    """Encode a value as UTF-8 JSON with the active backend."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if indent:
+        text = json.dumps(data, indent=2, default=_numpy_default)
+    else:
+        text = json.dumps(data, separators=(',', ':'), default=_numpy_default)
+    return text.encode('utf-8')
+
+
+def _numpy_default(value: Any) -> Any:
+    """Convert NumPy values for the stdlib encoder, as orjson does natively."""
+    if hasattr(value, 'tolist') and hasattr(value, 'dtype'):
+        # NumPy scalars and arrays both provide tolist()
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
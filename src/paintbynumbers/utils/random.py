@@ -7,6 +7,9 @@ ensuring reproducible output in the paint-by-numbers generation.
 
 import math
 import time
+from typing import Optional
+
+import numpy as np
 
 
 class Random:
@@ -17,6 +20,7 @@ class Random:
 
     Attributes:
         seed: Current seed value (incremented on each call)
+        generator: NumPy generator seeded from the initial seed, for batch draws
     """
 
     def __init__(self, seed: int | None = None) -> None:
@@ -29,6 +33,24 @@ class Random:
             self.seed = int(time.time() * 1000)  # Milliseconds like JS
         else:
             self.seed = seed
+        self._initial_seed = self.seed
+        self._generator: Optional[np.random.Generator] = None
+
+    @property
+    def generator(self) -> np.random.Generator:
+        """Get a NumPy generator seeded with this instance's initial seed.
+
+        Use it to draw many values in one C-level call (e.g. choosing k indices
+        at once). It is created on first access and is independent of next(),
+        so the sin-based sequence stays identical to the TypeScript version.
+
+        Returns:
+            Seeded numpy.random.Generator
+        """
+        if self._generator is None:
+            # NumPy seeds must be non-negative; fold negative seeds into 64 bits
+            self._generator = np.random.default_rng(self._initial_seed & 0xFFFFFFFFFFFFFFFF)
+        return self._generator
 
     def next(self) -> float:
         """Generate next random number in range [0, 1).
@@ -41,6 +63,26 @@ class Random:
         self.seed += 1
         return x - math.floor(x)
 
+    def next_batch(self, n: int) -> np.ndarray:
+        """Generate the next n values of the next() sequence at once.
+
+        Evaluates the same sin-based formula over n consecutive seeds in
+        NumPy, so the values equal n calls to next() to within rounding
+        and the seed advances by n.
+
+        Args:
+            n: Number of values to generate
+
+        Returns:
+            Array of n floats in range [0, 1)
+        """
+        # Seeds are integers below 2**53, so the float arange is exact
+        x = np.sin(np.arange(self.seed, self.seed + n, dtype=np.float64))
+        x *= 10000
+        x -= np.floor(x)
+        self.seed += n
+        return x
+
     def randint(self, min_val: int, max_val: int) -> int:
         """Generate random integer in range [min_val, max_val].
 
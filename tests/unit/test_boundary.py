@@ -1,5 +1,6 @@
 """Tests for boundary utilities."""
 
+import numpy as np
 import pytest
 from paintbynumbers.utils.boundary import (
     is_in_bounds,
@@ -9,9 +10,11 @@ from paintbynumbers.utils.boundary import (
     get_neighbors_8,
     is_on_edge,
     get_edge_type,
+    inner_point_mask,
     EdgeType,
 )
 from paintbynumbers.structs.point import Point
+from paintbynumbers.structs.typed_arrays import Uint8Array2D
 
 
 class TestIsInBounds:
@@ -188,6 +191,28 @@ class TestGetNeighbors8:
         assert len(neighbors) == len(set(neighbors))
 
 
+class TestInnerPointMask:
+    """Test inner_point_mask function."""
+
+    def test_matches_match_all_around(self) -> None:
+        """Test that the mask agrees with per-pixel match_all_around."""
+        arr = Uint8Array2D(7, 5)
+        arr._arr[:] = np.random.default_rng(0).integers(0, 2, 35)
+
+        mask = inner_point_mask(arr._arr, 7, 5)
+
+        for y in range(5):
+            for x in range(7):
+                assert mask[y * 7 + x] == arr.match_all_around(x, y, arr.get(x, y))
+
+    def test_edges_never_inner(self) -> None:
+        """Test that edge pixels of a uniform image are not inner points."""
+        mask = inner_point_mask(np.zeros(16, dtype=np.uint8), 4, 4).reshape(4, 4)
+
+        assert mask[1:3, 1:3].all()
+        assert mask.sum() == 4
+
+
 class TestIsOnEdge:
     """Test is_on_edge function."""
 
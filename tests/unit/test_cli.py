@@ -3,7 +3,9 @@
 import pytest
 import tempfile
 import os
+import sys
 import json
+import subprocess
 from pathlib import Path
 from click.testing import CliRunner
 from PIL import Image
@@ -16,7 +18,7 @@ except ImportError:
     HAS_CLICK = False
 
 if HAS_CLICK:
-    from paintbynumbers.cli.main import main, init_config
+    from paintbynumbers.cli.main import main, init_config, cli_group
 
 
 @pytest.mark.skipif(not HAS_CLICK, reason="requires click")
@@ -116,6 +118,57 @@ class TestCLI:
         assert result.exit_code == 0
         assert (tmp_path / "output.svg").exists()
 
+    def test_main_config_profiles_preserved(self, runner, test_image, tmp_path):
+        """Test that output profiles from --config survive without appearance flags."""
+        from paintbynumbers.core.settings import Settings, OutputProfile
+
+        settings = Settings()
+        settings.outputProfiles = [OutputProfile(name="custom", svgFontSize=33)]
+        config_path = tmp_path / "config.json"
+        with open(config_path, 'w') as f:
+            json.dump(settings.to_json(), f)
+        saved_path = tmp_path / "saved.json"
+
+        result = runner.invoke(main, [
+            test_image,
+            str(tmp_path / "output"),
+            '--config', str(config_path),
+            '--save-config', str(saved_path),
+            '--quiet'
+        ])
+
+        assert result.exit_code == 0
+        with open(saved_path, 'r') as f:
+            profiles = json.load(f)['outputProfiles']
+        assert [p['name'] for p in profiles] == ["custom"]
+        assert profiles[0]['svgFontSize'] == 33
+
+    def test_main_config_profiles_overridden_by_flag(self, runner, test_image, tmp_path):
+        """Test that an explicit appearance flag replaces the --config profiles."""
+        from paintbynumbers.core.settings import Settings, OutputProfile
+
+        settings = Settings()
+        settings.outputProfiles = [OutputProfile(name="custom", svgFontSize=33)]
+        config_path = tmp_path / "config.json"
+        with open(config_path, 'w') as f:
+            json.dump(settings.to_json(), f)
+        saved_path = tmp_path / "saved.json"
+
+        result = runner.invoke(main, [
+            test_image,
+            str(tmp_path / "output"),
+            '--config', str(config_path),
+            '--font-size', '12',
+            '--save-config', str(saved_path),
+            '--quiet'
+        ])
+
+        assert result.exit_code == 0
+        with open(saved_path, 'r') as f:
+            profiles = json.load(f)['outputProfiles']
+        assert [p['name'] for p in profiles] == ["cli_output"]
+        assert profiles[0]['svgFontSize'] == 12
+
     def test_main_save_config(self, runner, test_image, tmp_path):
         """Test CLI with --save-config option."""
         output_path = tmp_path / "output"
@@ -137,6 +190,24 @@ class TestCLI:
             config = json.load(f)
         assert config['kMeansNrOfClusters'] == 12
 
+    def test_main_color_space_case_insensitive(self, runner, test_image, tmp_path):
+        """Test that --color-space accepts lowercase names."""
+        output_path = tmp_path / "output"
+        config_path = tmp_path / "saved_config.json"
+
+        result = runner.invoke(main, [
+            test_image,
+            str(output_path),
+            '--color-space', 'hsl',
+            '--save-config', str(config_path),
+            '--quiet'
+        ])
+
+        assert result.exit_code == 0
+        with open(config_path, 'r') as f:
+            config = json.load(f)
+        assert config['kMeansClusteringColorSpace'] == 'HSL'
+
     def test_main_invalid_image(self, runner, tmp_path):
         """Test CLI with non-existent image."""
         output_path = tmp_path / "output"
@@ -149,6 +220,44 @@ class TestCLI:
 
         # Should fail
         assert result.exit_code != 0
+        assert "input file not found" in result.output
+
+    def test_main_missing_config(self, runner, test_image, tmp_path):
+        """Test CLI with a non-existent --config file."""
+        output_path = tmp_path / "output"
+
+        result = runner.invoke(main, [
+            test_image,
+            str(output_path),
+            '--config', str(tmp_path / "missing.json"),
+            '--quiet'
+        ])
+
+        assert result.exit_code == 1
+        assert "config file not found" in result.output
+
+    def test_main_error_without_traceback(self, runner, tmp_path):
+        """Test that errors print a one-line summary unless --verbose is set."""
+        bad_image = tmp_path / "broken.png"
+        bad_image.write_bytes(b"not an image")
+        output_path = tmp_path / "output"
+
+        result = runner.invoke(main, [str(bad_image), str(output_path)])
+
+        assert result.exit_code == 1
+        assert "Error:" in result.output
+        assert "Traceback" not in result.output
+
+    def test_main_error_verbose_traceback(self, runner, tmp_path):
+        """Test that --verbose prints the full traceback."""
+        bad_image = tmp_path / "broken.png"
+        bad_image.write_bytes(b"not an image")
+        output_path = tmp_path / "output"
+
+        result = runner.invoke(main, [str(bad_image), str(output_path), '--verbose'])
+
+        assert result.exit_code == 1
+        assert "Traceback" in result.output
 
     def test_main_no_svg(self, runner, test_image, tmp_path):
         """Test CLI with --no-svg option."""
@@ -197,6 +306,30 @@ class TestCLI:
             config = json.load(f)
         assert 'kMeansNrOfClusters' in config
 
+    def test_group_lists_subcommands(self, runner):
+        """Test that the group lists every subcommand."""
+        result = runner.invoke(cli_group, ['--help'])
+
+        assert result.exit_code == 0
+        for name in ('generate', 'init-config', 'explore', 'init-explorer-config'):
+            assert name in result.output
+
+    def test_group_init_config(self, runner, tmp_path):
+        """Test that init-config dispatches through the lazy group."""
+        config_path = tmp_path / "settings.json"
+
+        result = runner.invoke(cli_group, ['init-config', '--output', str(config_path)])
+
+        assert result.exit_code == 0
+        assert config_path.exists()
+
+    def test_group_unknown_command(self, runner):
+        """Test that an unknown subcommand is reported as a usage error."""
+        result = runner.invoke(cli_group, ['no-such-command'])
+
+        assert result.exit_code != 0
+        assert 'no-such-command' in result.output
+
     def test_main_with_seed(self, runner, test_image, tmp_path):
         """Test CLI with random seed for reproducibility."""
         output_path1 = tmp_path / "output1"
@@ -258,3 +391,97 @@ class TestCLI:
 
         assert result.exit_code == 0
         assert (tmp_path / "output.svg").exists()
+
+
+@pytest.mark.skipif(not HAS_CLICK, reason="requires click")
+class TestHelpFastPath:
+    """Test the precomputed help served by the console entry point."""
+
+    def test_help_text_matches_click(self):
+        """Test that the shipped _help.txt matches --dump-help output."""
+        from paintbynumbers.cli.main import _cached_help_text
+
+        result = CliRunner().invoke(main, ['--dump-help'])
+
+        assert result.exit_code == 0
+        assert _cached_help_text() == result.output
+
+    def test_dump_help_uses_prog_placeholder(self):
+        """Test that --dump-help renders a program-name placeholder."""
+        result = CliRunner().invoke(main, ['--dump-help'])
+
+        assert result.output.startswith("Usage: {prog} [OPTIONS] INPUT_PATH OUTPUT_PATH")
+        assert "--dump-help" not in result.output
+
+    @pytest.mark.parametrize("argv", [[], ["--help"], ["-h"]])
+    def test_run_serves_help_without_building_command(self, argv):
+        """Test that run() prints help without importing the generate command."""
+        code = (
+            "import sys\n"
+            f"sys.argv = ['paintbynumbers'] + {argv!r}\n"
+            "from paintbynumbers.cli.main import run\n"
+            "try:\n"
+            "    run()\n"
+            "except SystemExit as e:\n"
+            "    assert e.code == 0\n"
+            "assert 'paintbynumbers.cli._generate' not in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.startswith(
+            "Usage: paintbynumbers [OPTIONS] INPUT_PATH OUTPUT_PATH"
+        )
+
+    def test_main_no_args_shows_help(self):
+        """Test that the Click command also shows help when given no arguments."""
+        result = CliRunner().invoke(main, [])
+
+        assert "Usage:" in result.output
+        assert "--colors" in result.output
+
+class TestCLIWithoutClick:
+    """Test CLI behaviour when Click is not installed."""
+
+    def test_import_and_stub_without_click(self):
+        """Test that the CLI module imports and commands exit with a hint."""
+        code = (
+            "import sys; sys.modules['click'] = None\n"
+            "from paintbynumbers.cli.main import main, cli_group, CLICK_AVAILABLE\n"
+            "assert not CLICK_AVAILABLE\n"
+            "main()\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+
+        assert result.returncode == 1
+        assert "pip install click" in result.stderr
+
+
+@pytest.mark.skipif(not HAS_CLICK, reason="requires click")
+class TestProgressCallback:
+    """Test the generate command's progress display."""
+
+    def test_repeated_updates_are_skipped(self, capsys):
+        """Test that updates with an unchanged percentage are not redrawn."""
+        from paintbynumbers.cli._generate import _progress_callback
+
+        for progress in (0.0, 0.001, 0.002, 0.5, 0.5, 1.0):
+            _progress_callback("Stage", progress)
+
+        out = capsys.readouterr().out
+        assert out.count("\r") == 3
+        assert out.endswith("100%\n")
+
+    def test_new_stage_redraws(self, capsys):
+        """Test that a new stage is drawn even at the same percentage."""
+        from paintbynumbers.cli._generate import _progress_callback
+
+        _progress_callback("First", 0.0)
+        _progress_callback("Second", 0.0)
+
+        out = capsys.readouterr().out
+        assert "First" in out and "Second" in out
@@ -363,3 +363,36 @@ class TestColorReducerNarrowPixelStrip:
 
         assert count > 0
         # Gray should be replaced with black or white based on distance
+
+    def test_narrow_pixel_strip_numba_matches_python(self, monkeypatch) -> None:
+        """Test that the Numba-compiled kernel matches the pure Python path."""
+        pytest.importorskip("numba")
+        from paintbynumbers.processing import colorreduction
+
+        rng = np.random.default_rng(3)
+        colors = [tuple(int(c) for c in rng.integers(0, 256, 3)) for _ in range(6)]
+        indices = rng.integers(0, len(colors), 40 * 30).astype(np.uint8)
+
+        def make_result() -> ColorMapResult:
+            result = ColorMapResult()
+            result.width = 40
+            result.height = 30
+            result.imgColorIndices = Uint8Array2D(40, 30)
+            result.imgColorIndices.set_buffer(indices)
+            result.colorsByIndex = colors
+            return result
+
+        compiled = make_result()
+        compiled_counts = [
+            ColorReducer.process_narrow_pixel_strip_cleanup(compiled) for _ in range(3)
+        ]
+
+        monkeypatch.setattr(colorreduction, "NUMBA_AVAILABLE", False)
+        python = make_result()
+        python_counts = [
+            ColorReducer.process_narrow_pixel_strip_cleanup(python) for _ in range(3)
+        ]
+
+        assert compiled_counts == python_counts
+        assert compiled_counts[0] > 0
+        np.testing.assert_array_equal(compiled.imgColorIndices._arr, python.imgColorIndices._arr)
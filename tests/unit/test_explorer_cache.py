@@ -0,0 +1,104 @@
+"""Tests for the explorer's on-disk result cache."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from paintbynumbers.explorer.cache import ResultCache
+from paintbynumbers.explorer.metrics import VariationMetrics
+
+
+VARIATION = {"kMeansNrOfClusters": 8, "kMeansClusteringColorSpace": "LAB"}
+
+
+@pytest.fixture
+def image(tmp_path: Path) -> Path:
+    path = tmp_path / "input.png"
+    path.write_bytes(b"not really a png")
+    return path
+
+
+def _metrics() -> VariationMetrics:
+    return VariationMetrics(
+        num_facets=12,
+        num_colors=8,
+        processing_time=1.5,
+        min_facet_size=20,
+        max_facet_size=400,
+        mean_facet_size=90.5,
+        median_facet_size=60.0,
+        color_diversity_score=0.4,
+        avg_color_saturation=0.3,
+        avg_color_lightness=0.6,
+        total_border_points=800,
+        avg_border_complexity=66.7,
+        edge_density=0.08,
+        image_width=100,
+        image_height=100,
+        total_pixels=10000,
+    )
+
+
+class TestResultCacheKey:
+    """Test cache key computation."""
+
+    def test_key_stable_across_instances(self, tmp_path: Path, image: Path) -> None:
+        """Test that separate instances compute the same key."""
+        first = ResultCache(tmp_path / "cache", image)
+        second = ResultCache(tmp_path / "other", image)
+
+        assert first.key(VARIATION) == second.key(VARIATION)
+        assert first.key(VARIATION) == first.key(dict(reversed(list(VARIATION.items()))))
+
+    def test_key_depends_on_parameters(self, tmp_path: Path, image: Path) -> None:
+        """Test that different parameters give different keys."""
+        cache = ResultCache(tmp_path / "cache", image)
+
+        assert cache.key(VARIATION) != cache.key({**VARIATION, "kMeansNrOfClusters": 16})
+
+    def test_image_size_change_invalidates(self, tmp_path: Path, image: Path) -> None:
+        """Test that changing the image's size changes every key."""
+        before = ResultCache(tmp_path / "cache", image).key(VARIATION)
+        stat = image.stat()
+        image.write_bytes(b"a different, longer image")
+        os.utime(image, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert ResultCache(tmp_path / "cache", image).key(VARIATION) != before
+
+    def test_image_mtime_change_invalidates(self, tmp_path: Path, image: Path) -> None:
+        """Test that touching the image changes every key."""
+        before = ResultCache(tmp_path / "cache", image).key(VARIATION)
+        stat = image.stat()
+        os.utime(image, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert ResultCache(tmp_path / "cache", image).key(VARIATION) != before
+
+
+class TestResultCacheEntries:
+    """Test storing and loading cache entries."""
+
+    def test_store_load_round_trip(self, tmp_path: Path, image: Path) -> None:
+        """Test that a stored result is loaded back unchanged."""
+        cache = ResultCache(tmp_path / "cache", image)
+        key = cache.key(VARIATION)
+        metrics = _metrics()
+
+        cache.store(key, metrics, "<svg />")
+
+        assert cache.load(key) == (metrics, "<svg />")
+
+    def test_unknown_key_misses(self, tmp_path: Path, image: Path) -> None:
+        """Test that a key that was never stored is a miss."""
+        cache = ResultCache(tmp_path / "cache", image)
+
+        assert cache.load(cache.key(VARIATION)) is None
+
+    def test_entry_without_metrics_misses(self, tmp_path: Path, image: Path) -> None:
+        """Test that an interrupted store (no metrics.json) is a miss."""
+        cache = ResultCache(tmp_path / "cache", image)
+        key = cache.key(VARIATION)
+        cache.store(key, _metrics(), "<svg />")
+        (tmp_path / "cache" / key / "metrics.json").unlink()
+
+        assert cache.load(key) is None
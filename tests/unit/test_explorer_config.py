@@ -0,0 +1,23 @@
+"""Tests for explorer configuration presets."""
+
+import paintbynumbers.explorer as explorer
+from paintbynumbers.explorer import config
+from paintbynumbers.explorer.config import ExplorerConfig, get_preset
+
+
+class TestPresets:
+    """Test the preset configurations."""
+
+    def test_presets_built_once(self) -> None:
+        """Test that PRESETS is the same dict on every access and import path."""
+        assert config.PRESETS is config.PRESETS
+        assert explorer.PRESETS is config.PRESETS
+
+    def test_presets_cover_every_preset(self) -> None:
+        """Test that PRESETS holds a config for each preset name."""
+        assert set(config.PRESETS) == set(config._PRESET_NAMES)
+        assert all(isinstance(preset, ExplorerConfig) for preset in config.PRESETS.values())
+
+    def test_get_preset_returns_new_config(self) -> None:
+        """Test that get_preset() returns a fresh config each call."""
+        assert get_preset("quick_test") is not get_preset("quick_test")
@@ -0,0 +1,65 @@
+"""Tests for the explorer's background output writer."""
+
+from pathlib import Path
+from typing import Dict
+
+from paintbynumbers.explorer.engine import VariationResult, _OutputWriter
+
+
+def _result(output_paths: Dict[str, Path]) -> VariationResult:
+    return VariationResult(
+        variation_id="var_001",
+        variation_index=1,
+        parameters={},
+        metrics=None,  # type: ignore[arg-type]
+        output_paths=output_paths,
+    )
+
+
+def _fail_render(path: Path) -> None:
+    raise OSError(f"cannot render {path}")
+
+
+class TestOutputWriterFailures:
+    """Test that failed background writes reach the variation results."""
+
+    def test_successful_writes_keep_results(self, tmp_path: Path) -> None:
+        """Test that results are unchanged when every write succeeds."""
+        svg_path = tmp_path / "output.svg"
+        results = [_result({'svg': svg_path})]
+
+        with _OutputWriter() as writer:
+            writer.submit(svg_path, svg_path.write_text, "<svg />")
+
+        assert writer.check_results(results) is results
+        assert svg_path.read_text() == "<svg />"
+
+    def test_failed_svg_write_fails_variation(self, tmp_path: Path) -> None:
+        """Test that a failed SVG write marks the variation as failed."""
+        svg_path = tmp_path / "missing" / "output.svg"
+        metadata_path = tmp_path / "metadata.json"
+        results = [_result({'svg': svg_path, 'metadata': metadata_path})]
+
+        with _OutputWriter() as writer:
+            writer.submit(svg_path, svg_path.write_text, "<svg />")
+            writer.submit(metadata_path, metadata_path.write_text, "{}")
+
+        [checked] = writer.check_results(results)
+        assert not checked.success
+        assert checked.error is not None
+        assert checked.error.startswith("FileNotFoundError")
+        assert checked.output_paths == {'metadata': metadata_path}
+
+    def test_failed_preview_is_dropped(self, tmp_path: Path) -> None:
+        """Test that a failed PNG preview only removes its output path."""
+        svg_path = tmp_path / "output.svg"
+        png_path = tmp_path / "preview.png"
+        results = [_result({'svg': svg_path, 'png': png_path})]
+
+        with _OutputWriter() as writer:
+            writer.submit(svg_path, svg_path.write_text, "<svg />")
+            writer.render(png_path, _fail_render, png_path)
+
+        [checked] = writer.check_results(results)
+        assert checked.success
+        assert checked.output_paths == {'svg': svg_path}
@@ -0,0 +1,93 @@
+"""Tests for Latin hypercube variation generation."""
+
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from paintbynumbers.explorer.config import ExplorationStrategy, ExplorerConfig
+from paintbynumbers.explorer.variations import VariationGenerator, _maximin_latin_hypercube
+
+
+def _latin_hypercube_config(vary: dict, samples: int) -> ExplorerConfig:
+    return ExplorerConfig(
+        strategy=ExplorationStrategy.LATIN_HYPERCUBE,
+        random_samples=samples,
+        baseline={"kMeansNrOfClusters": 16},
+        vary=vary,
+    )
+
+
+class TestMaximinLatinHypercube:
+    """Test the maximin Latin hypercube design."""
+
+    @pytest.mark.parametrize("n_samples,n_dims", [(10, 2), (25, 4), (60, 5)])
+    def test_columns_are_permutations(self, n_samples: int, n_dims: int) -> None:
+        """Test that every column uses each stratum exactly once."""
+        design = _maximin_latin_hypercube(n_samples, n_dims, np.random.default_rng(0))
+
+        assert design.shape == (n_samples, n_dims)
+        for column in design.T:
+            assert sorted(column.tolist()) == list(range(n_samples))
+
+    @pytest.mark.parametrize("n_samples,n_dims", [(1, 3), (2, 3), (5, 1)])
+    def test_small_designs_returned_unoptimized(self, n_samples: int, n_dims: int) -> None:
+        """Test the early returns for fewer than 3 samples or 1 dimension."""
+        design = _maximin_latin_hypercube(n_samples, n_dims, np.random.default_rng(0))
+
+        assert design.shape == (n_samples, n_dims)
+        for column in design.T:
+            assert sorted(column.tolist()) == list(range(n_samples))
+
+    def test_same_generator_seed_same_design(self) -> None:
+        """Test that the design depends only on the generator state."""
+        first = _maximin_latin_hypercube(30, 4, np.random.default_rng(5))
+        second = _maximin_latin_hypercube(30, 4, np.random.default_rng(5))
+
+        np.testing.assert_array_equal(first, second)
+
+
+class TestLatinHypercubeVariations:
+    """Test Latin hypercube sampling through VariationGenerator."""
+
+    def test_values_used_evenly(self) -> None:
+        """Test that each value is used equally often when samples divide evenly."""
+        vary = {
+            "kMeansNrOfClusters": [4, 8, 12, 16],
+            "narrowPixelStripCleanupRuns": [0, 1],
+        }
+        variations = VariationGenerator(_latin_hypercube_config(vary, 8)).generate_variations()
+
+        assert len(variations) == 8
+        assert Counter(v["kMeansNrOfClusters"] for v in variations) == {4: 2, 8: 2, 12: 2, 16: 2}
+        assert Counter(v["narrowPixelStripCleanupRuns"] for v in variations) == {0: 4, 1: 4}
+
+    def test_values_used_nearly_evenly(self) -> None:
+        """Test that value counts differ by at most one otherwise."""
+        vary = {
+            "kMeansNrOfClusters": [4, 8, 12],
+            "narrowPixelStripCleanupRuns": [0, 1, 2],
+        }
+        variations = VariationGenerator(_latin_hypercube_config(vary, 10)).generate_variations()
+
+        for name, values in vary.items():
+            counts = Counter(v[name] for v in variations)
+            assert set(counts) == set(values)
+            assert max(counts.values()) - min(counts.values()) <= 1
+
+    def test_random_seed_reproducible(self) -> None:
+        """Test that random.seed() makes the sample reproducible."""
+        vary = {
+            "kMeansNrOfClusters": [4, 8, 12, 16, 20],
+            "narrowPixelStripCleanupRuns": [0, 1, 2, 3],
+            "removeFacetsSmallerThanNrOfPoints": [10, 20, 30],
+        }
+        config = _latin_hypercube_config(vary, 12)
+
+        random.seed(1234)
+        first = VariationGenerator(config).generate_variations()
+        random.seed(1234)
+        second = VariationGenerator(config).generate_variations()
+
+        assert first == second
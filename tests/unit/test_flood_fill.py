@@ -428,3 +428,59 @@ class TestFloodFillEdgeCases:
         # Check for duplicates
         unique_points = set(filled)
         assert len(filled) == len(unique_points)
+
+    def test_predicate_called_once_per_pixel(self) -> None:
+        """Test that each pixel is tested against the predicate at most once."""
+        flood_fill = FloodFillAlgorithm()
+        calls = []
+
+        def predicate(x: int, y: int) -> bool:
+            calls.append((x, y))
+            return True
+
+        flood_fill.fill(Point(2, 2), 5, 5, predicate)
+
+        assert len(calls) == len(set(calls)) == 25
+
+    def test_rejected_pixel_tested_once(self) -> None:
+        """Test that a rejected pixel with several filled neighbors is tested once."""
+        flood_fill = FloodFillAlgorithm()
+        calls = []
+
+        def predicate(x: int, y: int) -> bool:
+            calls.append((x, y))
+            return (x, y) != (2, 2)
+
+        filled = flood_fill.fill(Point(0, 0), 5, 5, predicate)
+
+        assert len(filled) == 24
+        assert calls.count((2, 2)) == 1
+        assert len(calls) == len(set(calls)) == 25
+
+    def test_rejected_pixel_tested_once_with_callback(self) -> None:
+        """Test fill_with_callback also tests a rejected pixel only once."""
+        flood_fill = FloodFillAlgorithm()
+        calls = []
+
+        def predicate(x: int, y: int) -> bool:
+            calls.append((x, y))
+            return (x, y) != (2, 2)
+
+        count = flood_fill.fill_with_callback(Point(0, 0), 5, 5, predicate, lambda x, y: None)
+
+        assert count == 24
+        assert len(calls) == len(set(calls)) == 25
+
+    def test_isolated_pixel_checks_only_neighbors(self) -> None:
+        """Test that an isolated pixel only tests itself and its 4 neighbors."""
+        flood_fill = FloodFillAlgorithm()
+        calls = []
+
+        def predicate(x: int, y: int) -> bool:
+            calls.append((x, y))
+            return x == 2 and y == 2
+
+        count = flood_fill.fill_with_callback(Point(2, 2), 5, 5, predicate, lambda x, y: None)
+
+        assert count == 1
+        assert len(calls) == 5
@@ -208,3 +208,15 @@ class TestImageIO:
         assert img_data.shape == (100, 100, 3)
         assert width == 100
         assert height == 100
+
+    def test_load_jpeg_image_with_resize(self, tmp_path):
+        """Test that JPEGs downscaled while decoding still get the exact size."""
+        img = Image.new('RGB', (400, 300), (200, 40, 10))
+        image_path = tmp_path / "large.jpg"
+        img.save(image_path, 'JPEG')
+
+        img_data, width, height = load_image(str(image_path), max_width=90)
+
+        assert img_data.shape == (67, 90, 3)
+        assert (width, height) == (90, 67)
+        assert abs(int(img_data[33, 45, 0]) - 200) <= 4
@@ -0,0 +1,113 @@
+"""Tests for JSON file helpers."""
+
+import json
+import pytest
+from paintbynumbers.utils import jsonio
+from paintbynumbers.utils.jsonio import dumps_json, read_json, write_json, write_json_streamed
+
+
+SAMPLE = {
+    "kMeansNrOfClusters": 16,
+    "kMeansMinDeltaDifference": 1.5,
+    "maximumNumberOfFacets": None,
+    "outputProfiles": [{"name": "default", "svgShowLabels": True}],
+}
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with and without orjson."""
+    if request.param and not jsonio.ORJSON_AVAILABLE:
+        pytest.skip("requires orjson")
+    monkeypatch.setattr(jsonio, "ORJSON_AVAILABLE", request.param)
+    return request.param
+
+
+class TestJsonIO:
+    """Test read_json and write_json."""
+
+    def test_roundtrip(self, backend, tmp_path) -> None:
+        """Test that written data reads back unchanged."""
+        path = tmp_path / "settings.json"
+        write_json(SAMPLE, path)
+        assert read_json(path) == SAMPLE
+
+    def test_accepts_str_path(self, backend, tmp_path) -> None:
+        """Test that plain string paths are accepted."""
+        path = str(tmp_path / "settings.json")
+        write_json(SAMPLE, path)
+        assert read_json(path) == SAMPLE
+
+    def test_indented_output(self, backend, tmp_path) -> None:
+        """Test that output matches json.dump(indent=2)."""
+        path = tmp_path / "settings.json"
+        write_json(SAMPLE, path)
+        assert path.read_text() == json.dumps(SAMPLE, indent=2)
+
+    def test_missing_file(self, backend, tmp_path) -> None:
+        """Test that a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            read_json(tmp_path / "missing.json")
+
+    def test_invalid_json(self, backend, tmp_path) -> None:
+        """Test that malformed JSON raises ValueError."""
+        path = tmp_path / "bad.json"
+        path.write_text("{not json")
+        with pytest.raises(ValueError):
+            read_json(path)
+
+    def test_compact_output(self, backend, tmp_path) -> None:
+        """Test that indent=False writes compact JSON."""
+        path = tmp_path / "metadata.json"
+        write_json(SAMPLE, path, indent=False)
+        assert path.read_text() == json.dumps(SAMPLE, separators=(',', ':'))
+        assert read_json(path) == SAMPLE
+
+    def test_numpy_scalars(self, backend, tmp_path) -> None:
+        """Test that NumPy float scalars are written as plain numbers."""
+        np = pytest.importorskip("numpy")
+        path = tmp_path / "metrics.json"
+        write_json({"mean": np.float64(2.5)}, path, indent=False)
+        assert read_json(path) == {"mean": 2.5}
+
+    def test_numpy_ints_and_arrays(self, backend, tmp_path) -> None:
+        """Test that NumPy integers and arrays are written as plain JSON."""
+        np = pytest.importorskip("numpy")
+        path = tmp_path / "metrics.json"
+        data = {"count": np.int64(3), "sizes": np.array([1, 2, 3], dtype=np.int32)}
+        write_json(data, path)
+        assert read_json(path) == {"count": 3, "sizes": [1, 2, 3]}
+
+    def test_dumps_json(self, backend) -> None:
+        """Test that dumps_json returns compact or indented text."""
+        assert dumps_json(SAMPLE) == json.dumps(SAMPLE, separators=(',', ':'))
+        assert dumps_json(SAMPLE, indent=True) == json.dumps(SAMPLE, indent=2)
+
+    def test_unserializable_value(self, backend, tmp_path) -> None:
+        """Test that unsupported objects raise TypeError."""
+        with pytest.raises(TypeError):
+            write_json({"value": object()}, tmp_path / "bad.json")
+
+
+class TestWriteJsonStreamed:
+    """Test write_json_streamed."""
+
+    HEADER = {"input_image": "photo.jpg", "total_variations": 2}
+    ENTRIES = [
+        {"id": "var_001", "metrics": {"num_facets": 120, "mean": 1.5}},
+        {"id": "var_002", "metrics": None, "error": "line 1\nline 2"},
+    ]
+
+    def test_matches_write_json(self, backend, tmp_path) -> None:
+        """Test that output equals write_json of the assembled dict."""
+        path = tmp_path / "summary.json"
+        write_json_streamed(self.HEADER, "variations", iter(self.ENTRIES), path)
+        expected = {**self.HEADER, "variations": self.ENTRIES}
+        assert path.read_text() == json.dumps(expected, indent=2)
+
+    def test_empty_list(self, backend, tmp_path) -> None:
+        """Test that an empty iterable writes an empty list."""
+        path = tmp_path / "summary.json"
+        write_json_streamed(self.HEADER, "variations", [], path)
+        expected = {**self.HEADER, "variations": []}
+        assert path.read_text() == json.dumps(expected, indent=2)
@@ -1,8 +1,14 @@
 """Tests for KMeans clustering algorithm."""
 
+import numpy as np
 import pytest
-from paintbynumbers.algorithms.kmeans import KMeans
-from paintbynumbers.algorithms.vector import Vector
+from paintbynumbers.algorithms import kmeans as kmeans_module
+from paintbynumbers.algorithms.kmeans import (
+    KMeans,
+    KMeansInitMethod,
+    get_assignment_chunk_size,
+)
+from paintbynumbers.algorithms.vector import Vector, VectorStore
 from paintbynumbers.utils.random import Random
 
 
@@ -55,6 +61,70 @@ class TestKMeansInit:
         assert kmeans1.centroids[0].values == kmeans2.centroids[0].values
         assert kmeans1.centroids[1].values == kmeans2.centroids[1].values
 
+    def test_kmeans_plus_plus_is_default(self) -> None:
+        """Test that k-means++ seeding is used by default."""
+        kmeans = KMeans([Vector([1, 1]), Vector([2, 2])], 2, Random(42))
+
+        assert kmeans.init_method == KMeansInitMethod.KMEANS_PP
+
+    def test_deterministic_kmeans_plus_plus_initialization(self) -> None:
+        """Test that k-means++ seeding is reproducible with a fixed seed."""
+        points = [Vector([float(i), float(i * i % 7)]) for i in range(20)]
+
+        kmeans1 = KMeans(points, 4, Random(42), init_method=KMeansInitMethod.KMEANS_PP)
+        kmeans2 = KMeans(points, 4, Random(42), init_method=KMeansInitMethod.KMEANS_PP)
+
+        for c1, c2 in zip(kmeans1.centroids, kmeans2.centroids, strict=True):
+            assert c1.values == c2.values
+
+    def test_kmeans_plus_plus_spreads_centroids(self) -> None:
+        """Test that k-means++ picks one seed from each well-separated group."""
+        points = [
+            Vector([0, 0]), Vector([1, 0]), Vector([0, 1]),
+            Vector([100, 100]), Vector([101, 100]), Vector([100, 101]),
+        ]
+
+        for seed in range(10):
+            kmeans = KMeans(points, 2, Random(seed), init_method=KMeansInitMethod.KMEANS_PP)
+            groups = {centroid.values[0] >= 50 for centroid in kmeans.centroids}
+            assert groups == {True, False}
+
+    def test_kmeans_plus_plus_duplicate_points(self) -> None:
+        """Test that k-means++ handles points that all coincide."""
+        points = [Vector([5, 5]), Vector([5, 5]), Vector([5, 5])]
+
+        kmeans = KMeans(points, 2, Random(42), init_method=KMeansInitMethod.KMEANS_PP)
+
+        assert len(kmeans.centroids) == 2
+        assert all(c.values == [5, 5] for c in kmeans.centroids)
+
+    def test_uniform_random_initialization(self) -> None:
+        """Test that uniform random seeding is still available."""
+        points = [Vector([1, 1]), Vector([2, 2]), Vector([3, 3])]
+
+        kmeans = KMeans(points, 2, Random(42), init_method=KMeansInitMethod.RANDOM)
+
+        assert kmeans.init_method == KMeansInitMethod.RANDOM
+        assert len(kmeans.centroids) == 2
+        for centroid in kmeans.centroids:
+            assert any(centroid.values == p.values for p in points)
+
+    def test_uniform_random_initialization_distinct(self) -> None:
+        """Test that uniform seeding picks distinct points when possible."""
+        points = [Vector([float(i), 0.0]) for i in range(10)]
+
+        kmeans = KMeans(points, 5, Random(3), init_method=KMeansInitMethod.RANDOM)
+
+        assert len({c.values[0] for c in kmeans.centroids}) == 5
+
+    def test_uniform_random_initialization_more_clusters_than_points(self) -> None:
+        """Test that uniform seeding reuses points when k exceeds the point count."""
+        points = [Vector([1, 1]), Vector([2, 2])]
+
+        kmeans = KMeans(points, 4, Random(3), init_method=KMeansInitMethod.RANDOM)
+
+        assert len(kmeans.centroids) == 4
+
     def test_custom_centroids(self) -> None:
         """Test initializing with custom centroids."""
         random = Random(42)
@@ -182,6 +252,143 @@ class TestKMeansStep:
         assert last_movement < first_movement or last_movement < 0.01
 
 
+class TestKMeansMiniBatch:
+    """Test mini-batch KMeans updates."""
+
+    @staticmethod
+    def _two_blobs() -> list:
+        points = []
+        for i in range(50):
+            points.append(Vector([float(i % 5), float(i % 3)]))
+            points.append(Vector([100.0 + i % 5, 100.0 + i % 3]))
+        return points
+
+    def test_step_minibatch_converges(self) -> None:
+        """Test that mini-batch steps find well-separated clusters."""
+        points = self._two_blobs()
+        centroids = [Vector([10.0, 10.0]), Vector([90.0, 90.0])]
+        kmeans = KMeans(points, 2, Random(42), centroids)
+
+        for _ in range(20):
+            kmeans.step_minibatch(32)
+
+        assert kmeans.current_iteration == 20
+        assert abs(kmeans.centroids[0].values[0] - 2.0) < 1.0
+        assert abs(kmeans.centroids[1].values[0] - 102.0) < 1.0
+
+    def test_use_minibatch_flag_dispatches_step(self) -> None:
+        """Test that step() runs mini-batch updates when enabled."""
+        points = self._two_blobs()
+        kmeans = KMeans(points, 2, Random(42), use_minibatch=True, batch_size=16)
+
+        kmeans.step()
+
+        assert kmeans.current_iteration == 1
+        # Mini-batch steps leave the full partition untouched
+        assert all(len(category) == 0 for category in kmeans.points_per_category)
+
+    def test_assign_points_after_minibatch(self) -> None:
+        """Test that assign_points() partitions all points after training."""
+        points = self._two_blobs()
+        kmeans = KMeans(points, 2, Random(42), use_minibatch=True, batch_size=32)
+
+        for _ in range(10):
+            kmeans.step()
+        kmeans.assign_points()
+
+        sizes = sorted(len(category) for category in kmeans.points_per_category)
+        assert sizes == [50, 50]
+
+    def test_minibatch_deterministic(self) -> None:
+        """Test that mini-batch training is reproducible with a fixed seed."""
+        points = self._two_blobs()
+
+        kmeans1 = KMeans(points, 2, Random(7), use_minibatch=True, batch_size=8)
+        kmeans2 = KMeans(points, 2, Random(7), use_minibatch=True, batch_size=8)
+        for _ in range(5):
+            kmeans1.step()
+            kmeans2.step()
+
+        for c1, c2 in zip(kmeans1.centroids, kmeans2.centroids, strict=True):
+            assert c1.values == c2.values
+
+
+class TestAssignmentChunking:
+    """Test cache-sized chunking of the assignment step."""
+
+    def test_chunk_size_fits_half_l2(self) -> None:
+        """Test that the per-chunk buffers use at most half of L2."""
+        chunk = get_assignment_chunk_size(64, 3)
+
+        assert chunk >= kmeans_module.MIN_ASSIGNMENT_CHUNK_SIZE
+        assert chunk * 8 * (2 * 64 + 3) <= kmeans_module.L2_CACHE_BYTES // 2
+
+    def test_chunk_size_minimum(self) -> None:
+        """Test that huge k still yields the minimum chunk size."""
+        assert get_assignment_chunk_size(10**7, 3) == kmeans_module.MIN_ASSIGNMENT_CHUNK_SIZE
+
+    def test_chunked_assignment_matches_unchunked(self, monkeypatch) -> None:
+        """Test that assignments do not depend on the chunk size."""
+        rng = np.random.default_rng(1)
+        points = [Vector(list(row)) for row in rng.uniform(0, 255, (200, 3))]
+        centroids = [Vector(list(row)) for row in rng.uniform(0, 255, (5, 3))]
+
+        reference = KMeans(points, 5, Random(1), [c.clone() for c in centroids])
+        reference.assign_points()
+
+        monkeypatch.setitem(kmeans_module._chunk_size_cache, (5, 3), 7)
+        chunked = KMeans(points, 5, Random(1), [c.clone() for c in centroids])
+        chunked.assign_points()
+
+        for expected, actual in zip(
+            reference.points_per_category, chunked.points_per_category, strict=True
+        ):
+            assert [p.values for p in expected] == [p.values for p in actual]
+
+    def test_threaded_assignment_matches_serial(self, monkeypatch) -> None:
+        """Test that splitting the assignment over threads gives the same labels."""
+        rng = np.random.default_rng(2)
+        points = [Vector(list(row)) for row in rng.uniform(0, 255, (200, 3))]
+        centroids = [Vector(list(row)) for row in rng.uniform(0, 255, (5, 3))]
+        monkeypatch.setitem(kmeans_module._chunk_size_cache, (5, 3), 7)
+
+        serial = KMeans(points, 5, Random(1), [c.clone() for c in centroids])
+        threaded = KMeans(points, 5, Random(1), [c.clone() for c in centroids], n_threads=3)
+
+        np.testing.assert_array_equal(serial.assign_points(), threaded.assign_points())
+
+    def test_invalid_thread_count(self) -> None:
+        """Test that fewer than one thread is rejected."""
+        with pytest.raises(ValueError, match="n_threads"):
+            KMeans([Vector([1, 1])], 1, Random(42), n_threads=0)
+
+
+class TestKMeansDevice:
+    """Test compute device selection."""
+
+    def test_default_device_is_cpu(self) -> None:
+        """Test that the CPU path is used by default."""
+        kmeans = KMeans([Vector([1, 1]), Vector([2, 2])], 2, Random(42))
+
+        assert kmeans.device == "cpu"
+
+    def test_unsupported_device(self) -> None:
+        """Test that unknown devices are rejected."""
+        with pytest.raises(ValueError, match="Unsupported device"):
+            KMeans([Vector([1, 1])], 1, Random(42), device="tpu")
+
+    def test_cuda_without_cupy(self) -> None:
+        """Test that requesting CUDA without CuPy raises ImportError."""
+        try:
+            import cupy  # noqa: F401
+            pytest.skip("CuPy is installed")
+        except ImportError:
+            pass
+
+        with pytest.raises(ImportError, match="CuPy"):
+            KMeans([Vector([1, 1])], 1, Random(42), device="cuda")
+
+
 class TestKMeansClassify:
     """Test KMeans classify() method."""
 
@@ -257,13 +464,12 @@ class TestKMeansWeighted:
         random = Random(42)
 
         # One point with weight 1, another with weight 9
-        points = [
-            Vector([0, 0], 1.0),
-            Vector([10, 10], 9.0),
-        ]
+        store = VectorStore()
+        store.add([0, 0], 1.0)
+        store.add([10, 10], 9.0)
 
         centroids = [Vector([5, 5])]
-        kmeans = KMeans(points, 1, random, centroids)
+        kmeans = KMeans(store, 1, random, centroids)
 
         kmeans.step()
 
@@ -278,13 +484,13 @@ class TestKMeansWeighted:
 
         # Simulate color frequencies
         # 10 pixels of red, 1 pixel of green
-        red = Vector([255, 0, 0], 10.0)
-        green = Vector([0, 255, 0], 1.0)
+        store = VectorStore()
+        store.add([255, 0, 0], 10.0)  # red
+        store.add([0, 255, 0], 1.0)   # green
 
-        points = [red, green]
         centroids = [Vector([127, 127, 0])]
 
-        kmeans = KMeans(points, 1, random, centroids)
+        kmeans = KMeans(store, 1, random, centroids)
         kmeans.step()
 
         # Centroid should be much closer to red due to weight
@@ -293,6 +499,33 @@ class TestKMeansWeighted:
         assert centroid.values[0] > 230  # Mostly red
         assert centroid.values[1] < 25   # Little green
 
+    def test_weighted_vector_list_matches_store(self) -> None:
+        """Test that Vector lists and VectorStores cluster identically."""
+        vectors = [Vector([0, 0], 1.0), Vector([10, 10], 9.0), Vector([50, 50], 2.0)]
+        store = VectorStore.from_vectors(vectors)
+
+        kmeans_list = KMeans(vectors, 2, Random(42), [Vector([0, 0]), Vector([40, 40])])
+        kmeans_store = KMeans(store, 2, Random(42), [Vector([0, 0]), Vector([40, 40])])
+        kmeans_list.step()
+        kmeans_store.step()
+
+        for c1, c2 in zip(kmeans_list.centroids, kmeans_store.centroids, strict=True):
+            assert c1.values == c2.values
+            assert c1.weight == c2.weight
+
+    def test_store_points_per_category_keeps_tags(self) -> None:
+        """Test that points materialized from a store keep their tags."""
+        store = VectorStore()
+        store.add([0, 0], 1.0, "a")
+        store.add([10, 10], 1.0, "b")
+
+        kmeans = KMeans(store, 2, Random(42), [Vector([0, 0]), Vector([10, 10])])
+        kmeans.step()
+
+        assert [v.tag for v in kmeans.points_per_category[0]] == ["a"]
+        assert [v.tag for v in kmeans.points_per_category[1]] == ["b"]
+        assert list(kmeans.labels) == [0, 1]
+
 
 class TestKMeansDeterminism:
     """Test that KMeans is deterministic with same seed."""
@@ -1,5 +1,6 @@
 """Tests for random number generator."""
 
+import numpy as np
 import pytest
 from paintbynumbers.utils.random import Random
 
@@ -121,3 +122,30 @@ class TestRandom:
         # Test 1000 values
         for _ in range(1000):
             assert abs(rng1.next() - rng2.next()) < 1e-10
+
+    def test_generator_deterministic(self) -> None:
+        """Test that the NumPy generator is seeded from the initial seed."""
+        rng1 = Random(seed=42)
+        rng2 = Random(seed=42)
+        rng2.next()  # Advancing next() must not affect the generator
+
+        assert list(rng1.generator.integers(0, 100, 10)) == list(rng2.generator.integers(0, 100, 10))
+
+    def test_generator_negative_seed(self) -> None:
+        """Test that negative seeds still produce a usable generator."""
+        rng = Random(seed=-5)
+
+        values = rng.generator.random(5)
+        assert all(0.0 <= v < 1.0 for v in values)
+
+    def test_next_batch_matches_next(self) -> None:
+        """Test that next_batch() continues the next() sequence."""
+        rng1 = Random(seed=42)
+        rng2 = Random(seed=42)
+        rng2.next()
+
+        batch = rng2.next_batch(100)
+
+        expected = [rng1.next() for _ in range(101)][1:]
+        np.testing.assert_allclose(batch, expected, rtol=0, atol=1e-10)
+        assert rng1.seed == rng2.seed
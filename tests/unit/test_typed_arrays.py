@@ -1,5 +1,6 @@
 """Tests for TypedArray wrapper classes."""
 
+import numpy as np
 import pytest
 from paintbynumbers.structs.typed_arrays import (
     Uint32Array2D,
@@ -112,6 +113,22 @@ class TestUint8Array2D:
         arr.set(1, 1, 255)
         assert arr.get(1, 1) == 255
 
+    def test_set_buffer(self) -> None:
+        """Test setting all values from a (height, width) array."""
+        arr = Uint8Array2D(3, 2)
+        arr.set_buffer(np.array([[1, 2, 3], [4, 5, 6]], dtype=np.uint8))
+
+        assert arr.get(0, 0) == 1
+        assert arr.get(2, 0) == 3
+        assert arr.get(0, 1) == 4
+        assert arr.get(2, 1) == 6
+
+    def test_set_buffer_wrong_size(self) -> None:
+        """Test set_buffer rejects arrays of the wrong size."""
+        arr = Uint8Array2D(3, 2)
+        with pytest.raises(ValueError):
+            arr.set_buffer(np.zeros(5, dtype=np.uint8))
+
     def test_match_all_around_true(self) -> None:
         """Test match_all_around when all neighbors match."""
         arr = Uint8Array2D(5, 5)
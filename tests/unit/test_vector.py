@@ -2,7 +2,8 @@
 
 import pytest
 import math
-from paintbynumbers.algorithms.vector import Vector
+import numpy as np
+from paintbynumbers.algorithms.vector import Vector, VectorStore
 
 
 class TestVector:
@@ -212,3 +213,62 @@ class TestVectorAverage:
 
         # Centroid of square should be at center
         assert avg.values == [2.0, 2.0]
+
+
+class TestVectorStore:
+    """Test VectorStore structure-of-arrays storage."""
+
+    def test_add_and_arrays(self) -> None:
+        """Test that added vectors land in contiguous arrays."""
+        store = VectorStore()
+        assert store.add([1, 2, 3], 5.0) == 0
+        assert store.add([4, 5, 6]) == 1
+
+        assert len(store) == 2
+        assert store.dimensions == 3
+        np.testing.assert_array_equal(store.values, [[1, 2, 3], [4, 5, 6]])
+        np.testing.assert_array_equal(store.weights, [5.0, 1.0])
+
+    def test_growth_preserves_data(self) -> None:
+        """Test that growing past the initial capacity keeps earlier rows."""
+        store = VectorStore()
+        for i in range(200):
+            store.add([i, -i], float(i))
+
+        assert len(store) == 200
+        assert store.values[150].tolist() == [150.0, -150.0]
+        assert store.weights[199] == 199.0
+
+    def test_getitem_materializes_vector(self) -> None:
+        """Test indexing returns a Vector with weight and tag."""
+        store = VectorStore()
+        store.add([255, 0, 0], 2.0, (255, 0, 0))
+
+        vec = store[0]
+        assert vec.values == [255.0, 0.0, 0.0]
+        assert vec.weight == 2.0
+        assert vec.tag == (255, 0, 0)
+        assert store[-1] == vec
+
+    def test_getitem_out_of_range(self) -> None:
+        """Test indexing past the end raises IndexError."""
+        store = VectorStore()
+        store.add([1, 2])
+
+        with pytest.raises(IndexError):
+            store[1]
+
+    def test_dimension_mismatch(self) -> None:
+        """Test that adding a vector of the wrong size is rejected."""
+        store = VectorStore(dimensions=3)
+
+        with pytest.raises(ValueError):
+            store.add([1, 2])
+
+    def test_from_vectors(self) -> None:
+        """Test building a store from Vector objects."""
+        store = VectorStore.from_vectors([Vector([1, 2], 3.0, "x"), Vector([3, 4])])
+
+        assert len(store) == 2
+        np.testing.assert_array_equal(store.weights, [3.0, 1.0])
+        assert store.tags == ["x", None]